@@ -0,0 +1,59 @@
+import os
+import threading
+
+import praw
+import requests
+from requests.adapters import HTTPAdapter
+
+from newsfeed.lambdas.fetcher.engine import MAX_WORKERS
+
+# Module-scoped clients survive across warm Lambda invocations, so keep-alive
+# connections and the Reddit OAuth token are reused instead of re-negotiated.
+_lock = threading.Lock()
+_http_session = None
+_reddit_client = None
+
+USER_AGENT = "newsfeed-bot/1.0 (Educational Project)"
+
+
+def get_http_session() -> requests.Session:
+    """Shared keep-alive session with a connection pool sized to the fetch concurrency"""
+    global _http_session
+    with _lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+            _http_session = session
+        return _http_session
+
+
+def get_reddit_client() -> praw.Reddit:
+    """Single authenticated Reddit client shared by every RedditFetcher"""
+    global _reddit_client
+    with _lock:
+        if _reddit_client is None:
+            client_id = os.getenv('REDDIT_CLIENT_ID')
+            client_secret = os.getenv('REDDIT_CLIENT_SECRET')
+
+            if not client_id or not client_secret:
+                raise ValueError("Reddit credentials not found in environment variables")
+
+            _reddit_client = praw.Reddit(
+                client_id=client_id,
+                client_secret=client_secret,
+                user_agent=USER_AGENT,
+                check_for_async=False,
+                timeout=10
+            )
+        return _reddit_client
+
+
+def reset_clients():
+    """Drop cached clients (tests, credential rotation)"""
+    global _http_session, _reddit_client
+    with _lock:
+        _http_session = None
+        _reddit_client = None
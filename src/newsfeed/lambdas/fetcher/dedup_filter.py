@@ -0,0 +1,155 @@
+import base64
+import hashlib
+import logging
+import math
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from newsfeed.shared.fingerprint import FINGERPRINT_VERSION
+from newsfeed.shared.news_item import NewsItem
+
+logger = logging.getLogger(__name__)
+
+# Same retention as RawEvents items (see NewsItem.from_raw_event)
+TTL_DAYS = 10
+DAILY_CAPACITY = int(os.getenv("DEDUP_DAILY_CAPACITY", "5000"))
+# Target false-positive rate across all daily generations
+TARGET_FALSE_POSITIVE_RATE = float(os.getenv("DEDUP_FALSE_POSITIVE_RATE", "0.001"))
+
+FILTER_KEY = "dedup_filter"
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def _bloom_parameters(capacity: int, error_rate: float) -> (int, int):
+    """Optimal bit count and hash count for `capacity` items at `error_rate`"""
+    bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+    hashes = max(1, int(round(bits / capacity * math.log(2))))
+    return bits, hashes
+
+
+class RecentFingerprintFilter:
+    """
+    Bloom filter of fingerprints published in the last TTL_DAYS, split into one
+    generation per day so old fingerprints age out with their RawEvents items.
+
+    A fingerprint is reported as seen if any live generation contains it. Each
+    generation is sized for TARGET_FALSE_POSITIVE_RATE / TTL_DAYS so the
+    combined false-positive rate stays within the target while each day holds
+    at most DAILY_CAPACITY fingerprints; `estimated_false_positive_rate`
+    reports the actual bound from the current fill.
+    """
+
+    def __init__(self, capacity: int = DAILY_CAPACITY, error_rate: float = TARGET_FALSE_POSITIVE_RATE,
+                 ttl_days: int = TTL_DAYS):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.ttl_days = ttl_days
+        self.num_bits, self.num_hashes = _bloom_parameters(capacity, error_rate / ttl_days)
+        self.generations: Dict[int, bytearray] = {}
+        self.checked = 0
+        self.dropped = 0
+
+    def _positions(self, fingerprint: str) -> List[int]:
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(fingerprint.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    @staticmethod
+    def _day(now: Optional[float] = None) -> int:
+        return int((time.time() if now is None else now) // SECONDS_PER_DAY)
+
+    def expire(self, now: Optional[float] = None):
+        """Drop generations older than the TTL"""
+        oldest = self._day(now) - self.ttl_days + 1
+        for day in [d for d in self.generations if d < oldest]:
+            del self.generations[day]
+
+    def contains(self, fingerprint: str) -> bool:
+        positions = self._positions(fingerprint)
+        return any(
+            all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+            for bits in self.generations.values()
+        )
+
+    def add(self, fingerprint: str, now: Optional[float] = None):
+        day = self._day(now)
+        bits = self.generations.get(day)
+        if bits is None:
+            bits = self.generations[day] = bytearray((self.num_bits + 7) // 8)
+        for p in self._positions(fingerprint):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def filter_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop events whose fingerprint was already published (or repeats within this batch)"""
+        kept, batch = [], set()
+        for event in events:
+            self.checked += 1
+            try:
+                fingerprint = NewsItem._generate_fingerprint(event)
+            except KeyError:
+                # Malformed event; let ingest validation reject it
+                kept.append(event)
+                continue
+            if fingerprint in batch or self.contains(fingerprint):
+                self.dropped += 1
+                continue
+            batch.add(fingerprint)
+            kept.append(event)
+        return kept
+
+    def add_events(self, events: List[Dict[str, Any]], now: Optional[float] = None):
+        for event in events:
+            try:
+                self.add(NewsItem._generate_fingerprint(event), now)
+            except KeyError:
+                continue
+
+    def estimated_false_positive_rate(self) -> float:
+        """Upper bound on P(an unseen fingerprint is reported as seen), from the bits set"""
+        miss = 1.0
+        for bits in self.generations.values():
+            fill = sum(bin(b).count("1") for b in bits) / self.num_bits
+            miss *= 1 - fill ** self.num_hashes
+        return 1 - miss
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "ttl_days": self.ttl_days,
+            "fingerprint_version": FINGERPRINT_VERSION,
+            "generations": {
+                str(day): base64.b64encode(zlib.compress(bytes(bits))).decode()
+                for day, bits in self.generations.items()
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'RecentFingerprintFilter':
+        # Fingerprints from another scheme would never match; start over (ingest still dedups)
+        if not data or data.get("fingerprint_version", "v1") != FINGERPRINT_VERSION:
+            return cls()
+        bloom = cls(data["capacity"], data["error_rate"], data["ttl_days"])
+        for day, blob in data.get("generations", {}).items():
+            bits = bytearray(zlib.decompress(base64.b64decode(blob)))
+            if len(bits) == (bloom.num_bits + 7) // 8:
+                bloom.generations[int(day)] = bits
+        return bloom
+
+    @classmethod
+    def load(cls, state_store: Any) -> 'RecentFingerprintFilter':
+        bloom = cls.from_dict(state_store.get(FILTER_KEY) if state_store is not None else None)
+        # Resize on config change; the old blob can't be reinterpreted
+        if (bloom.capacity, bloom.error_rate, bloom.ttl_days) != (DAILY_CAPACITY, TARGET_FALSE_POSITIVE_RATE, TTL_DAYS):
+            logger.info("Dedup filter parameters changed, starting a fresh filter")
+            bloom = cls()
+        bloom.expire()
+        return bloom
+
+    def save(self, state_store: Any):
+        if state_store is not None:
+            state_store.put(FILTER_KEY, self.to_dict())
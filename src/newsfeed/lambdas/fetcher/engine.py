@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Concurrency and deadline settings (overridable per deployment)
+MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "8"))
+SOURCE_TIMEOUT_SECONDS = float(os.getenv("FETCH_SOURCE_TIMEOUT", "20"))
+# Time kept back from the Lambda deadline for publishing to SQS
+PUBLISH_RESERVE_SECONDS = float(os.getenv("FETCH_PUBLISH_RESERVE", "5"))
+# Deadline used when no Lambda context is available (local runs, tests)
+DEFAULT_OVERALL_TIMEOUT_SECONDS = 25.0
+START_POLL_SECONDS = 0.05
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching a single source"""
+    name: str
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    duration: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+    fetcher: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+def overall_deadline(context: Any, now: Optional[float] = None) -> float:
+    """
+    Return the monotonic time by which fetching must stop, leaving
+    PUBLISH_RESERVE_SECONDS of the Lambda's remaining time for publishing.
+    """
+    now = time.monotonic() if now is None else now
+    if context is not None and hasattr(context, "get_remaining_time_in_millis"):
+        remaining = context.get_remaining_time_in_millis() / 1000.0
+        return now + max(0.0, remaining - PUBLISH_RESERVE_SECONDS)
+    return now + DEFAULT_OVERALL_TIMEOUT_SECONDS
+
+
+def _source_name(source_config: Dict[str, Any]) -> str:
+    return source_config.get("name", "unknown")
+
+
+def _run_source(source_config: Dict[str, Any], started: Dict[str, float], fetchers: Dict[str, Any],
+                state_store: Any) -> List[Dict[str, Any]]:
+    """
+    Instantiate the fetcher for a source and fetch its articles. Each run gets
+    a fresh instance: a timed-out worker from an earlier run may still be
+    staging state on its own. Only the HTTP session and Reddit client
+    (fetcher/clients.py) are shared across warm invocations.
+    """
+    name = _source_name(source_config)
+    started[name] = time.monotonic()
+    fetcher = source_config["class"](**source_config["config"])
+    fetcher.state_store = state_store
+    fetcher.source_id = name
+    fetchers[name] = fetcher
+    return fetcher.fetch()
+
+
+def fetch_sources(sources: List[Dict[str, Any]], context: Any = None,
+                  max_workers: int = MAX_WORKERS,
+                  source_timeout: float = SOURCE_TIMEOUT_SECONDS,
+                  state_store: Any = None) -> List[FetchResult]:
+    """
+    Fetch all sources in parallel on a bounded thread pool.
+
+    Each source gets `source_timeout` seconds from the moment it starts running,
+    and nothing is waited on past the overall deadline derived from `context`.
+    Sources that miss their deadline are reported as timed out; results from
+    the sources that finished are always returned.
+    """
+    if not sources:
+        return []
+
+    deadline = overall_deadline(context)
+    started: Dict[str, float] = {}
+    fetchers: Dict[str, Any] = {}
+    results: Dict[str, FetchResult] = {}
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources))),
+                                  thread_name_prefix="fetch")
+    futures = {executor.submit(_run_source, sc, started, fetchers, state_store): _source_name(sc) for sc in sources}
+    pending = set(futures)
+
+    try:
+        while pending:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+
+            # Abandon sources that have been running longer than their own deadline
+            for future in list(pending):
+                name = futures[future]
+                if name in started and now - started[name] >= source_timeout:
+                    pending.discard(future)
+                    future.cancel()
+                    results[name] = FetchResult(name=name, duration=now - started[name], timed_out=True)
+                    logger.warning(f"Source {name} timed out after {source_timeout:.1f}s")
+            if not pending:
+                break
+
+            # Wake up at the earliest per-source or overall deadline, polling
+            # briefly while some worker hasn't recorded its start time yet
+            next_wakeup = deadline
+            for future in pending:
+                name = futures[future]
+                if name in started:
+                    next_wakeup = min(next_wakeup, started[name] + source_timeout)
+                else:
+                    next_wakeup = min(next_wakeup, now + START_POLL_SECONDS)
+            done, pending = wait(pending, timeout=max(0.0, next_wakeup - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = futures[future]
+                duration = time.monotonic() - started.get(name, now)
+                try:
+                    events = future.result()
+                    results[name] = FetchResult(name=name, events=events or [], duration=duration,
+                                                fetcher=fetchers.get(name))
+                except Exception as e:
+                    logger.error(f"Source {name} failed: {str(e)}")
+                    results[name] = FetchResult(name=name, duration=duration, error=str(e))
+
+        for future in pending:
+            name = futures[future]
+            future.cancel()
+            duration = time.monotonic() - started[name] if name in started else 0.0
+            results[name] = FetchResult(name=name, duration=duration, timed_out=True)
+            logger.warning(f"Source {name} did not finish before the overall deadline")
+    finally:
+        # Don't block on stragglers; their results are discarded
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [results[_source_name(sc)] for sc in sources]
@@ -1,52 +1,106 @@
 from newsfeed.lambdas.fetcher.sources.config import SOURCES
-import json
+from newsfeed.lambdas.fetcher.engine import fetch_sources, FetchResult
+from newsfeed.lambdas.fetcher.state_store import get_state_store
+from newsfeed.lambdas.fetcher.scheduler import SourceScheduler
+from newsfeed.lambdas.fetcher.dedup_filter import RecentFingerprintFilter
+from newsfeed.shared.sqs_publisher import SQSBatchPublisher
 import boto3
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
 
 # Initialize SQS client at module level
 sqs = boto3.client('sqs')
 
+# Number of events packed into a single SQS message body
+EVENTS_PER_MESSAGE = int(os.getenv('SQS_EVENTS_PER_MESSAGE', '10'))
+
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> None:
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     logger.info(f"Starting fetcher lambda with {len(SOURCES)} sources")
+    event = event or {}
     
     # Get queue URL from environment variable
     queue_url = os.getenv('SQS_QUEUE_URL')
     if not queue_url:
         raise ValueError("SQS_QUEUE_URL environment variable not set")
     
+    # Only poll sources that are due; pass {"force": true} to poll everything
+    state_store = get_state_store()
+    try:
+        scheduler = SourceScheduler(state_store)
+    except Exception as e:
+        # Poll everything rather than fail the run; don't overwrite the stored schedule
+        logger.error(f"Failed to load source schedule: {str(e)}")
+        scheduler = SourceScheduler()
+    sources = SOURCES if event.get("force") else scheduler.due_sources(SOURCES)
+
+    # Load the pre-dedup filter up front so a read error can't discard fetched events
+    dedup_store = state_store
+    try:
+        dedup_filter = RecentFingerprintFilter.load(state_store)
+    except Exception as e:
+        # Publish everything (ingest still dedups); don't overwrite the stored filter
+        logger.error(f"Failed to load dedup filter: {str(e)}")
+        dedup_filter, dedup_store = RecentFingerprintFilter(), None
+
+    # Fetch due sources concurrently; slow or failing sources don't block the rest
+    results = fetch_sources(sources, context, state_store=state_store)
     all_events = []
-    
-    for source_config in SOURCES:
-        try:
-            source_class = source_config["class"]
-            config = source_config["config"]
-            
-            # Instantiate the fetcher with its config
-            fetcher = source_class(**config)
-            
-            # Fetch articles
-            events = fetcher.fetch()
-            all_events.extend(events)
-            
-        except Exception as e:
-            logger.error(f"Source {source_config.get('name', 'unknown')} failed: {str(e)}")
+    for result in results:
+        all_events.extend(result.events)
+        logger.info(f"Source {result.name}: {len(result.events)} events in {result.duration:.2f}s"
+                    + (" (timed out)" if result.timed_out else ""))
+
+    # Drop events already published within the RawEvents TTL before they reach SQS
+    new_events = dedup_filter.filter_events(all_events)
+    logger.info(f"Pre-dedup dropped {dedup_filter.dropped} of {dedup_filter.checked} events "
+                f"(estimated false-positive rate {dedup_filter.estimated_false_positive_rate():.5f})")
 
-    # Send events to SQS
-    sent_count = 0
-    for event in all_events:
+    # Send events to SQS in batches of packed messages
+    publisher = SQSBatchPublisher(sqs, queue_url, events_per_message=EVENTS_PER_MESSAGE)
+    sent_count = publisher.publish(new_events)
+    _commit_source_state(results, publisher.failed_events)
+
+    failed = {id(e) for e in publisher.failed_events}
+    dedup_filter.add_events([e for e in new_events if id(e) not in failed])
+    try:
+        dedup_filter.save(dedup_store)
+    except Exception as e:
+        logger.error(f"Failed to save dedup filter: {str(e)}")
+
+    scheduler.record_results(results)
+    try:
+        scheduler.save()
+    except Exception as e:
+        logger.error(f"Failed to save source schedule: {str(e)}")
+
+    logger.info(f"Completed: fetched {len(all_events)} events, sent {sent_count} to SQS "
+                f"in {publisher.requests} requests")
+    return {
+        "fetched": len(all_events),
+        "sent": sent_count,
+        "sqs_requests": publisher.requests,
+        "sources": {
+            result.name: {"events": len(result.events), "duration": result.duration, "ok": result.ok}
+            for result in results
+        }
+    }
+
+
+def _commit_source_state(results: List[FetchResult], failed_events: List[Dict[str, Any]]) -> None:
+    """Persist fetcher state (validators etc.) only for sources whose events were all sent"""
+    failed = {id(event) for event in failed_events}
+    for result in results:
+        if not result.ok or result.fetcher is None:
+            continue
+        if any(id(event) in failed for event in result.events):
+            logger.warning(f"Not saving state for {result.name}: some events were not sent")
+            continue
         try:
-            sqs.send_message(
-                QueueUrl=queue_url,
-                MessageBody=json.dumps(event),
-            )
-            sent_count += 1
+            result.fetcher.commit_state()
         except Exception as e:
-            logger.error(f"Failed to send event to SQS: {str(e)}")
-
-    logger.info(f"Completed: fetched {len(all_events)} events, sent {sent_count} to SQS")
+            logger.error(f"Failed to save state for {result.name}: {str(e)}")
@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
+from typing import Union
+from newsfeed.lambdas.fetcher.watermark import SeenIds, Watermark, parse_published_at
 
 class BaseFetcher(ABC):
     """Base class for all news fetchers"""
     
+    # Persistent store for per-source state (set by the fetch engine, optional)
+    state_store = None
+    # Name of the SOURCES entry this fetcher serves (set by the fetch engine)
+    source_id = None
+    # True when the source lists entries newest-first by publish time, so a
+    # timestamp watermark is safe; otherwise recently seen ids are the cursor
+    date_ordered = False
+
     @abstractmethod
     def fetch(self):
         """
@@ -12,3 +22,50 @@ class BaseFetcher(ABC):
             list: List of news event dictionaries
         """
         pass
+
+    def stage_state(self, key: str, value: dict):
+        """Record state to persist once this fetch's events have been published"""
+        if self.state_store is None:
+            return
+        if not hasattr(self, "_staged_state"):
+            self._staged_state = {}
+        self._staged_state[key] = value
+
+    def commit_state(self):
+        """Persist staged state; called only after the fetched events were sent"""
+        staged = getattr(self, "_staged_state", {})
+        for key, value in staged.items():
+            self.state_store.put(key, value)
+        self._staged_state = {}
+
+    def _cursor_key(self) -> str:
+        if self.date_ordered:
+            return f"watermark#{self.source_id}"
+        return f"seen#{self.source_id}"
+
+    def load_cursor(self) -> Union[Watermark, SeenIds]:
+        """What a previous run emitted: a watermark for date-ordered sources, else seen ids"""
+        cursor_class = Watermark if self.date_ordered else SeenIds
+        if self.state_store is None or self.source_id is None:
+            return cursor_class()
+        if not hasattr(self, "_cursor"):
+            self._cursor = cursor_class.from_dict(self.state_store.get(self._cursor_key()))
+        return self._cursor
+
+    def filter_new(self, events: list) -> list:
+        """
+        Drop events a previous run already emitted and stage the advanced cursor.
+
+        Events without a parseable published_at are always new for a watermark
+        and never move it; fill in any fallback timestamp after this call.
+        """
+        cursor = self.load_cursor()
+        new_events = [
+            event for event in events
+            if cursor.is_new(parse_published_at(event.get("published_at")), event.get("id"))
+        ]
+        # Seen ids are refreshed by every fetched event, not only the new ones
+        advanced_by = new_events if self.date_ordered else events
+        if advanced_by and self.source_id is not None:
+            self.stage_state(self._cursor_key(), cursor.advance(advanced_by).to_dict())
+        return new_events
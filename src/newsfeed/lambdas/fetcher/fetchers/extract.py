@@ -0,0 +1,29 @@
+import re
+from html import unescape
+from typing import Optional, Tuple
+
+# Compiled once at import; both patterns run in C over the summary
+_FIRST_LINK = re.compile(r'''<a\s[^>]*?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.I)
+_MARKUP = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>', re.S | re.I)
+
+
+def extract_summary(html: str) -> Tuple[Optional[str], str]:
+    """
+    Return (first link href, plain text) from an HTML summary.
+
+    The link search stops at the first anchor, and markup (including script and
+    style content) is stripped in one substitution pass, so downstream stages
+    store and tokenize plain text instead of HTML.
+    """
+    if not html:
+        return None, ""
+
+    match = _FIRST_LINK.search(html)
+    link = None
+    if match:
+        link = unescape(next(group for group in match.groups() if group is not None))
+
+    text = _MARKUP.sub(" ", html) if "<" in html else html
+    if "&" in text:
+        text = unescape(text)
+    return link, " ".join(text.split())
@@ -1,33 +1,41 @@
-import praw
-import os
+import time
 from datetime import datetime
 from .base import BaseFetcher
+from newsfeed.lambdas.fetcher.clients import get_reddit_client
+from newsfeed.lambdas.fetcher.watermark import parse_published_at
+
+# Listings a source can page through
+LISTINGS = ("hot", "new", "rising")
+# Stop paginating when fewer requests than this remain in Reddit's rate-limit window
+RATE_LIMIT_RESERVE = 5
 
 class RedditFetcher(BaseFetcher):
-    def __init__(self, subreddit: str = "technology", limit: int = 10):
+    def __init__(self, subreddit: str = "technology", limit: int = 10, listing: str = "hot"):
+        if listing not in LISTINGS:
+            raise ValueError(f"Unsupported Reddit listing: {listing}")
         self.subreddit = subreddit
         self.limit = limit
+        self.listing = listing
+        # Only "new" is newest-first; hot and rising rank posts, so they track seen ids
+        self.date_ordered = listing == "new"
         self.reddit = None
 
     def _get_reddit_client(self):
-        """Initialize Reddit client with PRAW"""
-        client_id = os.getenv('REDDIT_CLIENT_ID')
-        client_secret = os.getenv('REDDIT_CLIENT_SECRET')
-        
-        if not client_id or not client_secret:
-            raise ValueError("Reddit credentials not found in environment variables")
-        
-        return praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent="newsfeed-bot/1.0 (Educational Project)",
-            check_for_async=False,
-            timeout=10  # Add timeout
-        )
+        """Shared PRAW client, authenticated once per warm container"""
+        return get_reddit_client()
+
+    def _rate_limited(self) -> bool:
+        """True when Reddit's X-Ratelimit-Remaining says to stop before the window resets"""
+        limits = getattr(getattr(self.reddit, "auth", None), "limits", None) or {}
+        remaining = limits.get("remaining")
+        reset_timestamp = limits.get("reset_timestamp")
+        if remaining is None or reset_timestamp is None:
+            return False
+        return remaining < RATE_LIMIT_RESERVE and reset_timestamp > time.time()
 
     def fetch(self):
         try:
-            print(f"Fetching from r/{self.subreddit}")
+            print(f"Fetching {self.listing} from r/{self.subreddit}")
             
             # Initialize Reddit client
             if not self.reddit:
@@ -35,10 +43,18 @@ class RedditFetcher(BaseFetcher):
             
             subreddit = self.reddit.subreddit(self.subreddit)
             
+            cursor = self.load_cursor()
+
             events = []
-            # Add timeout and reduce limit for faster response
-            for submission in subreddit.hot(limit=min(self.limit, 3)):
-                    
+            scanned = 0
+            # PRAW pages through the listing (100 per request) up to the configured limit
+            for submission in getattr(subreddit, self.listing)(limit=self.limit):
+                scanned += 1
+                published_at = datetime.fromtimestamp(submission.created_utc).isoformat()
+                if self.date_ordered and not cursor.is_new(parse_published_at(published_at), submission.id):
+                    # Newest-first listing: everything after this was already seen
+                    break
+
                 event = {
                     "source": "reddit",
                     "id": submission.id,
@@ -47,16 +63,24 @@ class RedditFetcher(BaseFetcher):
                     "url": submission.url,
                     "score": submission.score,
                     "subreddit": submission.subreddit.display_name,
-                    "published_at": datetime.fromtimestamp(submission.created_utc).isoformat()
+                    "published_at": published_at
                 }
                 events.append(event)
+
+                if self._rate_limited():
+                    print(f"Reddit rate limit nearly exhausted, stopping r/{self.subreddit} early")
+                    break
             
-            print(f"Reddit fetcher returned {len(events)} events from r/{self.subreddit}")
+            # Drop submissions already emitted and stage the advanced cursor
+            events = self.filter_new(events)
+
+            print(f"Reddit fetcher returned {len(events)} new of {scanned} scanned from r/{self.subreddit}")
             return events
             
         except Exception as e:
             print(f"Reddit fetch error: {e}")
-            return []
+            # Surface the failure so the scheduler can back off this source
+            raise
 
         # TODO: Implement logging or retry mechanism
         # for better error handling
\ No newline at end of file
@@ -1,47 +1,87 @@
 import feedparser
-import requests
-import re
-from datetime import datetime
+import hashlib
+from datetime import datetime, timezone
 from .base import BaseFetcher
-from html.parser import HTMLParser
+from .extract import extract_summary
+from newsfeed.lambdas.fetcher.clients import get_http_session
 
 
 class RSSFetcher(BaseFetcher):
-    def __init__(self, feed_url: str, source_name: str = "rss"):
+    def __init__(self, feed_url: str, source_name: str = "rss", date_ordered: bool = False):
         self.feed_url = feed_url
         self.source_name = source_name
+        # Only feeds listed newest-first by pubDate may use a timestamp watermark
+        self.date_ordered = date_ordered
+
+    def _validator_key(self) -> str:
+        return f"validators#{self.feed_url}"
+
+    def _get_validators(self) -> dict:
+        """Cached ETag / Last-Modified / content hash from the previous fetch"""
+        if self.state_store is None:
+            return {}
+        return self.state_store.get(self._validator_key()) or {}
 
     def fetch(self):
         try:
             print(f"Fetching RSS from {self.feed_url}")
             
-            response = requests.get(self.feed_url, timeout=30)
+            # Send cached validators so unchanged feeds come back as 304
+            validators = self._get_validators()
+            headers = {}
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
+            response = get_http_session().get(self.feed_url, timeout=30, headers=headers)
+            if response.status_code == 304:
+                print(f"RSS feed not modified: {self.feed_url}")
+                return []
             response.raise_for_status()
-            
+
+            # Some servers ignore validators; skip parsing if the body is unchanged
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            if content_hash == validators.get('content_hash'):
+                print(f"RSS feed content unchanged: {self.feed_url}")
+                return []
+
             feed = feedparser.parse(response.content)
 
             events = []
             for entry in feed.entries[:200]:
-                matches = re.findall(r'href="([^"]+)"', entry.summary)
-                if matches:
-                    url = matches[0]
-                else:
-                    url = self.feed_url
+                # Pull the first link and plain text out of the summary in one pass
+                link, text = extract_summary(getattr(entry, 'summary', ''))
                 events.append({
                     'source': self.source_name,
                     'id': getattr(entry, 'guid', entry.link),
                     'title': entry.title,
-                    'body': getattr(entry, 'summary', ''),
-                    'url': url,
-                    'published_at': getattr(entry, 'published', datetime.now().isoformat())
+                    'body': text,
+                    'url': link or self.feed_url,
+                    'published_at': getattr(entry, 'published', None)
                 })
             
-            print(f"RSS fetcher returned {len(events)} events")
+            # Only emit entries a previous run hasn't; undated ones never move the watermark
+            total = len(events)
+            events = self.filter_new(events)
+            fetched_at = datetime.now(timezone.utc).isoformat()
+            for event in events:
+                if event['published_at'] is None:
+                    event['published_at'] = fetched_at
+
+            self.stage_state(self._validator_key(), {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash
+            })
+
+            print(f"RSS fetcher returned {len(events)} new of {total} events")
             return events
             
         except Exception as e:
             print(f"Error fetching RSS feed: {e}")
-            return []
+            # Surface the failure so the scheduler can back off this source
+            raise
         
         # TODO: Implement logging or retry mechanism
         # for better error handling
\ No newline at end of file
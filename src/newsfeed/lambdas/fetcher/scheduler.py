@@ -0,0 +1,98 @@
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cadence of the EventBridge trigger; the shortest interval a source can get
+TICK_SECONDS = int(os.getenv("FETCH_TICK_SECONDS", "900"))
+# Longest a quiet source is left alone
+MAX_INTERVAL_SECONDS = int(os.getenv("FETCH_MAX_INTERVAL", str(6 * 3600)))
+# A poll yielding at least this many new items counts as busy
+BUSY_YIELD = 5
+BACKOFF_FACTOR = 1.5
+# Consecutive failures before the circuit opens and the source is backed off hard
+CIRCUIT_THRESHOLD = 3
+SMOOTHING = 0.3
+
+SCHEDULE_KEY = "scheduler"
+
+
+class SourceScheduler:
+    """
+    Decides which SOURCES are due on a tick and adapts each source's poll
+    interval to its observed yield of new items.
+
+    Busy sources are polled every tick, sources that keep returning nothing
+    are backed off up to MAX_INTERVAL_SECONDS, and failing sources are held
+    off exponentially once CIRCUIT_THRESHOLD consecutive failures trip the circuit.
+    """
+
+    def __init__(self, state_store: Any = None, tick_seconds: int = TICK_SECONDS,
+                 max_interval: int = MAX_INTERVAL_SECONDS):
+        self.state_store = state_store
+        self.tick_seconds = tick_seconds
+        self.max_interval = max_interval
+        self.state: Dict[str, Dict[str, Any]] = {}
+        if state_store is not None:
+            self.state = state_store.get(SCHEDULE_KEY) or {}
+
+    def _source_state(self, name: str) -> Dict[str, Any]:
+        return self.state.setdefault(name, {
+            "interval": self.tick_seconds,
+            "next_due": 0,
+            "failures": 0,
+            "avg_yield": 0.0
+        })
+
+    def is_due(self, name: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        # Allow half a tick of slack so EventBridge jitter doesn't skip a due source
+        return self._source_state(name)["next_due"] <= now + self.tick_seconds / 2
+
+    def due_sources(self, sources: List[Dict[str, Any]], now: Optional[float] = None) -> List[Dict[str, Any]]:
+        due = [source for source in sources if self.is_due(source.get("name", "unknown"), now)]
+        skipped = len(sources) - len(due)
+        if skipped:
+            logger.info(f"Scheduler skipped {skipped} sources not due this tick")
+        return due
+
+    def record_success(self, name: str, new_items: int, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        state = self._source_state(name)
+        state["avg_yield"] = SMOOTHING * new_items + (1 - SMOOTHING) * state["avg_yield"]
+        state["failures"] = 0
+
+        if new_items >= BUSY_YIELD:
+            state["interval"] = self.tick_seconds
+        elif new_items == 0:
+            state["interval"] = min(self.max_interval, state["interval"] * BACKOFF_FACTOR)
+        elif state["avg_yield"] >= 1:
+            state["interval"] = max(self.tick_seconds, state["interval"] / 2)
+        state["next_due"] = now + state["interval"]
+
+    def record_failure(self, name: str, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        state = self._source_state(name)
+        state["failures"] += 1
+        if state["failures"] >= CIRCUIT_THRESHOLD:
+            # Circuit open: back off exponentially, then allow a single trial poll
+            backoff = min(self.max_interval, self.tick_seconds * 2 ** (state["failures"] - CIRCUIT_THRESHOLD + 1))
+            logger.warning(f"Source {name} failed {state['failures']} times in a row, "
+                           f"backing off for {backoff:.0f}s")
+        else:
+            backoff = state["interval"]
+        state["next_due"] = now + backoff
+
+    def record_results(self, results: List[Any], now: Optional[float] = None):
+        """Update schedules from the engine's FetchResults"""
+        for result in results:
+            if result.ok:
+                self.record_success(result.name, len(result.events), now)
+            else:
+                self.record_failure(result.name, now)
+
+    def save(self):
+        if self.state_store is not None:
+            self.state_store.put(SCHEDULE_KEY, self.state)
@@ -32,7 +32,8 @@ SOURCES = [
         "class": RSSFetcher,
         "config": {
             "feed_url": "https://feeds.arstechnica.com/arstechnica/technology-lab",
-            "source_name": "ars_technica"
+            "source_name": "ars_technica",
+            "date_ordered": True
         }
     },
     {
@@ -0,0 +1,62 @@
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import boto3
+
+DEFAULT_STATE_PATH = "/tmp/newsfeed-fetcher-state.json"
+
+
+class FileStateStore:
+    """Fetcher state kept in a local JSON file (warm containers, local runs and tests)"""
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state: Optional[Dict[str, Any]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._state is None:
+            try:
+                with open(self.path) as f:
+                    self._state = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._state = {}
+        return self._state
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(key)
+
+    def put(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            state = self._load()
+            state[key] = value
+            # Write atomically so a frozen or killed container never leaves half a file
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+
+
+class DynamoDBStateStore:
+    """Fetcher state kept in a DynamoDB table keyed by `id`, one JSON document per key"""
+
+    def __init__(self, table_name: str):
+        self.table = boto3.resource("dynamodb").Table(table_name)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self.table.get_item(Key={"id": key}).get("Item")
+        return json.loads(item["state"]) if item else None
+
+    def put(self, key: str, value: Dict[str, Any]):
+        self.table.put_item(Item={"id": key, "state": json.dumps(value)})
+
+
+def get_state_store():
+    """DynamoDB-backed store when FETCHER_STATE_TABLE is set, local file otherwise"""
+    table_name = os.getenv("FETCHER_STATE_TABLE")
+    if table_name:
+        return DynamoDBStateStore(table_name)
+    return FileStateStore(os.getenv("FETCHER_STATE_PATH", DEFAULT_STATE_PATH))
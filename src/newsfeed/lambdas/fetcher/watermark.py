@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Set
+
+# Ids a SeenIds cursor remembers; must exceed the entries one fetch returns
+SEEN_IDS_LIMIT = 1000
+
+
+def parse_published_at(value: Any) -> Optional[datetime]:
+    """Parse ISO-8601 or RFC 822 timestamps into an aware UTC datetime (None if unparseable)"""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass
+class Watermark:
+    """
+    Newest publish time seen for a source, plus the ids published at exactly
+    that time so items sharing the watermark timestamp aren't dropped or repeated.
+    """
+    published_at: Optional[datetime] = None
+    ids: Set[str] = field(default_factory=set)
+
+    def is_new(self, published_at: Optional[datetime], item_id: Any = None) -> bool:
+        if self.published_at is None or published_at is None:
+            return True
+        if published_at > self.published_at:
+            return True
+        return published_at == self.published_at and str(item_id) not in self.ids
+
+    def advance(self, events: List[Dict[str, Any]]) -> 'Watermark':
+        """Return the watermark after the given events have been emitted"""
+        newest, ids = self.published_at, set(self.ids)
+        for event in events:
+            published_at = parse_published_at(event.get("published_at"))
+            if published_at is None:
+                continue
+            if newest is None or published_at > newest:
+                newest, ids = published_at, {str(event.get("id"))}
+            elif published_at == newest:
+                ids.add(str(event.get("id")))
+        return Watermark(newest, ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "ids": sorted(self.ids)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'Watermark':
+        if not data:
+            return cls()
+        return cls(parse_published_at(data.get("published_at")), set(data.get("ids", [])))
+
+
+@dataclass
+class SeenIds:
+    """
+    Ids emitted recently for a source whose entries aren't in date order (rank
+    ordered feeds and listings), where a late-rising entry can be older than
+    ones already emitted. Ids seen again move to the newest end, so entries
+    still in the feed are never forgotten; the oldest are dropped past `limit`.
+    """
+    ids: List[str] = field(default_factory=list)
+    limit: int = SEEN_IDS_LIMIT
+
+    def is_new(self, published_at: Optional[datetime], item_id: Any = None) -> bool:
+        return str(item_id) not in self.ids
+
+    def advance(self, events: List[Dict[str, Any]]) -> 'SeenIds':
+        """Return the cursor after the given events were fetched (new or not)"""
+        fetched = [str(event.get("id")) for event in events]
+        current = set(fetched)
+        ids = [item_id for item_id in self.ids if item_id not in current] + list(dict.fromkeys(fetched))
+        return SeenIds(ids[-self.limit:], self.limit)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ids": list(self.ids)}
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'SeenIds':
+        if not data:
+            return cls()
+        return cls(list(data.get("ids", [])))
@@ -8,7 +8,7 @@ def create_filtered_item(raw_item: dict, relevance_score: float) -> dict:
     published_at = raw_item.get("published_at", datetime.now(timezone.utc).isoformat())
     sort_key = f"{relevance_score:.2f}#{published_at}"
 
-    return {
+    filtered_item = {
         "PK": "news",
         "SK": sort_key,
         "id": raw_item["id"],
@@ -21,3 +21,6 @@ def create_filtered_item(raw_item: dict, relevance_score: float) -> dict:
         "filtered_at": datetime.now(timezone.utc).isoformat(),
         "ttl_epoch": int(datetime.now(timezone.utc).timestamp()) + (30 * 24 * 60 * 60),
     }
+    if raw_item.get("cluster_id"):
+        filtered_item["cluster_id"] = raw_item["cluster_id"]
+    return filtered_item
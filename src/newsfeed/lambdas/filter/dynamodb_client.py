@@ -2,6 +2,8 @@ import os
 import boto3
 from typing import Dict, Any
 
+from newsfeed.shared.wire_format import deserialize_image
+
 class DynamoDBClient:
     def __init__(self, table_name: str = None):
         self.table_name = table_name or os.getenv("FILTERED_TABLE_NAME", "FilteredEvents")
@@ -20,10 +22,4 @@ class DynamoDBClient:
 
     @staticmethod
     def dynamodb_to_dict(dynamodb_item: Dict[str, Any]) -> Dict[str, Any]:
-        result = {}
-        for k, v in dynamodb_item.items():
-            if "S" in v:
-                result[k] = v["S"]
-            elif "N" in v:
-                result[k] = int(v["N"]) if v["N"].isdigit() else float(v["N"])
-        return result
+        return deserialize_image(dynamodb_item)
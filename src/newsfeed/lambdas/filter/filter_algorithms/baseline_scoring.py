@@ -1,4 +1,8 @@
+import re
 from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
 
 # --------------------------
 # Predefined keyword sets
@@ -20,6 +24,87 @@ LOW_PRIORITY_KEYWORDS = {
 # Priority points
 PRIORITY_POINTS = {"high": 10, "medium": 6, "low": 3}
 TITLE_MULTIPLIER = 3
+MAX_POSSIBLE_POINTS = 35  # Normalization for the 0-1 score (rough estimate)
+RECENCY_MAX_HOURS = 30 * 24  # 30 days
+
+
+# --------------------------
+# Keyword matcher
+# --------------------------
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Regex alternation shaped as a trie of the keywords, so each text position
+    is tried against shared prefixes once rather than against every keyword.
+    Spaces inside a phrase match any run of whitespace.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def pattern(node: dict) -> str:
+        optional = "" in node
+        branches = [(r"\s+" if char == " " else re.escape(char)) + pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if optional:
+            # Prefer the longer keyword ("data breach" over "data"), fall back to the shorter
+            body = ("(?:" + body + ")" if len(branches) == 1 else body) + "?"
+        return body
+
+    return pattern(trie)
+
+
+KEYWORD_PRIORITIES = {
+    **{keyword: "low" for keyword in LOW_PRIORITY_KEYWORDS},
+    **{keyword: "medium" for keyword in MEDIUM_PRIORITY_KEYWORDS},
+    **{keyword: "high" for keyword in HIGH_PRIORITY_KEYWORDS},
+}
+
+# One pass per text, whole words and phrases only ("outage," matches, "apis" doesn't)
+KEYWORD_PATTERN = re.compile(r"\b" + _trie_pattern(KEYWORD_PRIORITIES) + r"\b")
+
+
+def count_keyword_hits(text: str) -> Dict[str, int]:
+    """Number of keyword matches per priority in `text`, case-insensitive"""
+    counts = dict.fromkeys(PRIORITY_POINTS, 0)
+    for match in KEYWORD_PATTERN.finditer((text or "").lower()):
+        counts[KEYWORD_PRIORITIES[" ".join(match.group().split())]] += 1
+    return counts
+
+
+def keyword_points(text: str) -> int:
+    return sum(PRIORITY_POINTS[priority] * hits for priority, hits in count_keyword_hits(text).items())
+
+
+# Column of each keyword in the keyword-count matrices, and its points
+KEYWORD_COLUMNS = {keyword: column for column, keyword in enumerate(sorted(KEYWORD_PRIORITIES))}
+KEYWORD_WEIGHTS = np.array([PRIORITY_POINTS[KEYWORD_PRIORITIES[keyword]] for keyword in sorted(KEYWORD_PRIORITIES)],
+                           dtype=np.float64)
+
+
+def keyword_matrix(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sparse (COO) keyword-count matrix of `texts`: one (row, column) pair per
+    match, row indexing `texts` and column indexing KEYWORD_COLUMNS.
+    """
+    rows: List[int] = []
+    columns: List[int] = []
+    for row, text in enumerate(texts):
+        for match in KEYWORD_PATTERN.finditer((text or "").lower()):
+            rows.append(row)
+            columns.append(KEYWORD_COLUMNS[" ".join(match.group().split())])
+    return np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp)
+
+
+def keyword_points_batch(texts: Sequence[str]) -> np.ndarray:
+    """Keyword points of each text: its count matrix times KEYWORD_WEIGHTS"""
+    rows, columns = keyword_matrix(texts)
+    return np.bincount(rows, weights=KEYWORD_WEIGHTS[columns], minlength=len(texts))
 
 
 # --------------------------
@@ -33,12 +118,59 @@ def recency_points(published_at: str, max_points: int = 10) -> int:
     try:
         dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
         age_hours = (datetime.now(timezone.utc) - dt).total_seconds() / 3600
-        max_hours = 30 * 24  # 30 days
-        points = max(1, min(max_points, int(round(max_points * (1 - age_hours / max_hours)))))
+        points = max(1, min(max_points, int(round(max_points * (1 - age_hours / RECENCY_MAX_HOURS)))))
         return points
     except Exception:
         return 1
 
+
+def _published_epoch(published_at: str) -> float:
+    """Timezone-aware ISO 8601 timestamp as epoch seconds; NaN when it can't be scored"""
+    try:
+        dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except Exception:
+        return float("nan")
+    return dt.timestamp() if dt.tzinfo is not None else float("nan")
+
+
+def recency_points_batch(published_at: Sequence[str], max_points: int = 10, now: float = None) -> np.ndarray:
+    """recency_points for many timestamps at once, against a single clock read"""
+    now = datetime.now(timezone.utc).timestamp() if now is None else now
+    epochs = np.array([_published_epoch(value) for value in published_at], dtype=np.float64)
+    points = np.rint(max_points * (1 - (now - epochs) / (3600 * RECENCY_MAX_HOURS)))
+    # NaN (unscorable timestamp) fails both comparisons and becomes 1
+    return np.where(points >= 1, np.minimum(points, max_points), 1)
+
+
+# --------------------------
+# Batch scoring function
+# --------------------------
+def score_batch(items: Sequence[dict]) -> np.ndarray:
+    """
+    Relevance scores (0-1) of many news items at once, e.g. for backfills and
+    re-scoring RawEvents. Keyword points come from one sparse keyword-count
+    matrix over all titles and bodies, recency from one vectorized pass.
+
+    Args:
+        items: dicts with 'title', 'body', 'published_at' (all optional)
+
+    Returns:
+        np.ndarray: float64 score per item, in order
+    """
+    count = len(items)
+    if not count:
+        return np.zeros(0)
+    # Rows 0..count-1 are the titles, count..2*count-1 the bodies
+    points = keyword_points_batch([item.get("title", "") for item in items] +
+                                  [item.get("body", "") for item in items])
+    total_points = (
+        points[:count] * TITLE_MULTIPLIER
+        + points[count:]
+        + recency_points_batch([item.get("published_at", "") for item in items])
+    )
+    return np.minimum(total_points / MAX_POSSIBLE_POINTS, 1.0)
+
+
 # --------------------------
 # Keyword scoring function
 # --------------------------
@@ -55,25 +187,4 @@ def calculate_keyword_relevance_score(item: dict) -> float:
     Returns:
         float: Normalized relevance score (0.0 - 1.0)
     """
-    title = item.get("title", "").lower().split()
-    body = item.get("body", "").lower().split()
-
-    # Title keyword points
-    kw_title_points = sum(PRIORITY_POINTS["high"] for w in title if w in HIGH_PRIORITY_KEYWORDS) * TITLE_MULTIPLIER
-    kw_title_points += sum(PRIORITY_POINTS["medium"] for w in title if w in MEDIUM_PRIORITY_KEYWORDS) * TITLE_MULTIPLIER
-    kw_title_points += sum(PRIORITY_POINTS["low"] for w in title if w in LOW_PRIORITY_KEYWORDS) * TITLE_MULTIPLIER
-
-    # Body keyword points
-    kw_body_points = sum(PRIORITY_POINTS["high"] for w in body if w in HIGH_PRIORITY_KEYWORDS)
-    kw_body_points += sum(PRIORITY_POINTS["medium"] for w in body if w in MEDIUM_PRIORITY_KEYWORDS)
-    kw_body_points += sum(PRIORITY_POINTS["low"] for w in body if w in LOW_PRIORITY_KEYWORDS)
-
-    # Recency points
-    rec_pts = recency_points(item.get("published_at", ""))
-
-    total_points = kw_title_points + kw_body_points + rec_pts
-
-    # Normalize to 0-1 (rough estimate)
-    max_possible_points = 35
-    score = min(total_points / max_possible_points, 1.0)
-    return score
+    return float(score_batch([item])[0])
@@ -1,45 +1,88 @@
 import logging
-from typing import Dict, Any
-from newsfeed.lambdas.filter.ranker import calculate_relevance_score
+from typing import Any, Dict, Iterable, Optional
+from newsfeed.lambdas.filter.ranker import calculate_relevance_scores
+from newsfeed.shared.batch_writer import BufferedBatchWriter
 from newsfeed.shared.dynamodb_client import DynamoDBClient
+from newsfeed.shared.wire_format import deserialize_image
 from newsfeed.lambdas.filter.create_filtered import create_filtered_item
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClient = None) -> Dict[str, int]:
+# What scoring and create_filtered_item read; raw_payload and the rest are never decoded
+SCORED_ATTRIBUTES = ("id", "source", "title", "body", "published_at", "url", "cluster_id")
+
+
+def is_new_item(record: dict) -> bool:
+    """
+    Only INSERTs are new stories. MODIFYs and REMOVEs (including TTL
+    expiries) are dropped before any decoding; the event source mapping's
+    filter criteria should already keep them from invoking the Lambda.
     """
-    Processes DynamoDB stream records, filters tech articles, and stores them.
-    `db_client` can be injected for testing.
+    return record.get("eventName") == "INSERT"
+
+def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClient = None) -> Dict[str, Any]:
+    """
+    Processes DynamoDB stream records, filters tech articles, and stores them
+    with batched writes. `db_client` can be injected for testing.
+
+    Returns `batchItemFailures` with the SequenceNumbers of records whose
+    write failed (ReportBatchItemFailures), so the stream resumes from the
+    first failed record instead of replaying the whole batch.
     """
     table_name = "FilteredEvents"
     if db_client is None:
         db_client = DynamoDBClient(table_name)
 
     records = event.get('Records', [])
-    logger.info(f"Processing {len(records)} records")
-    processed = 0
+    new_records = [record for record in records if is_new_item(record)]
+    logger.info(f"Processing {len(new_records)} of {len(records)} records (INSERTs only)")
+    repeats = 0
 
-    for record in records:
-        item = extract_stream_item(record)
+    items, sequence_numbers = [], []
+    for record in new_records:
+        item = extract_stream_item(record, SCORED_ATTRIBUTES)
 
-        relevance_score = calculate_relevance_score(item, algorithm = 'word_score')
+        # A near-duplicate of a story already seen from another source: its cluster is scored once
+        cluster_id = item.get("cluster_id")
+        if cluster_id and cluster_id != item.get("id"):
+            repeats += 1
+            continue
+        items.append(item)
+        sequence_numbers.append(record.get("dynamodb", {}).get("SequenceNumber"))
+
+    scores = calculate_relevance_scores(items, algorithm = 'word_score')
+    # FilteredEvents is keyed on (PK, SK); SK is score#published_at, so distinct stories can share it
+    writer = BufferedBatchWriter(db_client, key_attributes=("PK", "SK"))
+    for item, relevance_score, sequence_number in zip(items, scores, sequence_numbers):
         logger.info(f"Calculated relevance score: {relevance_score}")
         if relevance_score > 0.4:  # Threshold for filtering
-            filtered_item = create_filtered_item(item, relevance_score)
-            db_client.put_item(filtered_item)
-            processed += 1
+            writer.add(create_filtered_item(item, relevance_score), sequence_number)
+    writer.flush()
+
+    failed_records = list(dict.fromkeys(writer.failed))
+    if None in failed_records:
+        # Without sequence numbers (direct invocation) the only way to retry is to fail the call
+        raise RuntimeError(f"Failed to store {len(writer.failed)} filtered items")
 
-    logger.info(f"Processed {processed} items")
-    return {"processed": processed}
+    logger.info(f"Processed {writer.written} items, skipped {repeats} near-duplicates, "
+                f"failed {len(failed_records)} records")
+    return {
+        "processed": writer.written,
+        "batchItemFailures": [{"itemIdentifier": sequence_number} for sequence_number in failed_records]
+    }
 
 
-def extract_stream_item(record: dict):
-    """Return a normalized Python dict from a DynamoDB stream record."""
+def extract_stream_item(record: dict, attributes: Optional[Iterable[str]] = None):
+    """
+    Return a normalized Python dict from a DynamoDB stream record, decoding
+    only `attributes` when given. Numbers become int/Decimal, lists, maps and
+    sets their Python counterparts, and binary attributes (e.g. a compressed
+    raw_payload) bytes; decoding their contents is left to readers that need it.
+    """
     dynamodb_data = record.get("dynamodb", {})
     image = dynamodb_data.get("NewImage") or dynamodb_data.get("OldImage")
     if not image:
         return {}
-
-    return {k: list(v.values())[0] for k, v in image.items()}
\ No newline at end of file
+    return deserialize_image(image, attributes)
@@ -1,4 +1,6 @@
-from newsfeed.lambdas.filter.filter_algorithms.baseline_scoring import calculate_keyword_relevance_score
+from typing import List
+
+from newsfeed.lambdas.filter.filter_algorithms.baseline_scoring import calculate_keyword_relevance_score, score_batch
 from newsfeed.lambdas.filter.filter_algorithms.openai_scoring import get_openai_relevance_score
 
 def calculate_relevance_score(item: dict, algorithm: str) -> float:
@@ -17,4 +19,11 @@ def calculate_relevance_score(item: dict, algorithm: str) -> float:
     """
     
     # Add more algorithms as needed
-    return 0.0
\ No newline at end of file
+    return 0.0
+
+
+def calculate_relevance_scores(items: List[dict], algorithm: str) -> List[float]:
+    """Scores for a batch of items, vectorized where the algorithm supports it"""
+    if algorithm == 'word_score':
+        return score_batch(items).tolist()
+    return [calculate_relevance_score(item, algorithm) for item in items]
@@ -0,0 +1,72 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+# Bounded so a long-lived container can't grow without limit
+MAX_ENTRIES = int(os.getenv("INGEST_CACHE_SIZE", "10000"))
+# Well under the RawEvents TTL (10 days), so a cached fingerprint is always still stored
+TTL_SECONDS = int(os.getenv("INGEST_CACHE_TTL", "3600"))
+
+
+class FingerprintCache:
+    """
+    LRU of fingerprints this container has confirmed are stored in RawEvents.
+
+    Only fingerprints that were written, or found already present, are added,
+    so a hit is always a true duplicate and a miss simply falls through to
+    DynamoDB. Entries expire after `ttl_seconds`.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: int = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, fingerprint: str, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        stored_at = self._entries.get(fingerprint)
+        if stored_at is not None and now - stored_at < self.ttl_seconds:
+            self._entries.move_to_end(fingerprint)
+            self.hits += 1
+            return True
+        if stored_at is not None:
+            del self._entries[fingerprint]
+        self.misses += 1
+        return False
+
+    def add(self, fingerprint: str, now: Optional[float] = None):
+        self._entries[fingerprint] = time.time() if now is None else now
+        self._entries.move_to_end(fingerprint)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def add_all(self, fingerprints: Iterable[str], now: Optional[float] = None):
+        now = time.time() if now is None else now
+        for fingerprint in fingerprints:
+            self.add(fingerprint, now)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4)
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
@@ -1,18 +1,44 @@
 import json
 import os
 import logging
-from typing import Dict, Any
+import boto3
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple
+from newsfeed.lambdas.ingest.fingerprint_cache import FingerprintCache
+from newsfeed.shared.cluster_index import assign_clusters, get_cluster_index
 from newsfeed.shared.dynamodb_client import DynamoDBClient
+from newsfeed.shared.fingerprint import find_legacy_duplicates, legacy_ids
+from newsfeed.shared.ingest_jobs import get_job_store
 from newsfeed.shared.news_item import NewsItem
+from newsfeed.shared.sqs_publisher import unpack_envelope
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClient = None) -> Dict[str, int]:
+# Batches with at least this many unique items use BatchGetItem/BatchWriteItem
+# (most production batches; see _store_bulk for the dedup race that trades in)
+BULK_THRESHOLD = int(os.getenv("INGEST_BULK_THRESHOLD", "5"))
+
+# The queue's redrive maxReceiveCount: a message failing on this delivery goes to the DLQ
+MAX_RECEIVE_COUNT = int(os.getenv("INGEST_MAX_RECEIVE_COUNT", "3"))
+
+# SQS client for the dead-letter path, created on first use
+sqs = None
+
+# Fingerprints confirmed stored by this container; survives warm invocations
+recent_fingerprints = FingerprintCache()
+
+def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClient = None) -> Dict[str, Any]:
     """
     Processes SQS messages, validates them, checks for duplicates, and stores in DynamoDB.
     `db_client` can be injected for testing; defaults to real DynamoDB.
+
+    Returns `batchItemFailures` with the message IDs that should be retried
+    (ReportBatchItemFailures), so records that succeeded aren't redelivered.
+    Messages that can never succeed (malformed JSON or events) go straight
+    to the dead-letter queue instead.
     """
     table_name = 'RawEvents'
 
@@ -21,29 +47,210 @@ def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClien
         db_client = DynamoDBClient(table_name)
 
     logger.info(f"Processing {len(event['Records'])} SQS messages")
-    processed, skipped = 0, 0
+    processed, skipped, dead_lettered = 0, 0, 0
+    items: Dict[str, NewsItem] = {}
+    # Message IDs carrying each fingerprint; they all fail if its write fails
+    owners: Dict[str, List[str]] = {}
+    failed_messages: List[str] = []
+    # Outcome counters for events queued by async ingest_api jobs
+    job_counts: Dict[str, Counter] = defaultdict(Counter)
+    job_of: Dict[str, str] = {}
+    # Messages on their last delivery; their failures are final
+    last_attempts = set()
+    # One clock read for the whole batch
+    now = datetime.now(timezone.utc)
 
     for record in event["Records"]:
+        message_id = record.get("messageId")
+        if int(record.get("attributes", {}).get("ApproximateReceiveCount", 1)) >= MAX_RECEIVE_COUNT:
+            last_attempts.add(message_id)
         try:
-            message_body = json.loads(record["body"])
-            news_item = NewsItem.from_raw_event(message_body)
+            events, job_id = unpack_envelope(record["body"])
+        except Exception as e:
+            logger.error(f"Malformed message {message_id}: {str(e)}")
+            if _dead_letter(record["body"], str(e)):
+                dead_lettered += 1
+            else:
+                failed_messages.append(message_id)
+            continue
+
+        # A message body may carry several packed events
+        for message_body, raw_json in events:
+            try:
+                news_item = NewsItem.from_raw_event(message_body, now=now, raw_json=raw_json)
+            except Exception as e:
+                logger.error(f"Malformed event in message {message_id}: {str(e)}")
+                if _dead_letter(json.dumps(message_body), str(e)):
+                    dead_lettered += 1
+                    if job_id:
+                        job_counts[job_id]["failed"] += 1
+                else:
+                    failed_messages.append(message_id)
+                    if job_id and message_id in last_attempts:
+                        job_counts[job_id]["failed"] += 1
+                continue
 
             if not news_item.validate():
                 logger.warning("Invalid event structure, skipping")
                 skipped += 1
+                if job_id:
+                    job_counts[job_id]["invalid"] += 1
                 continue
 
-            if db_client.event_exists(news_item.fingerprint):
-                logger.info(f"Duplicate event found: {news_item.title[:50]}...")
+            # Collapse duplicates within the batch before touching DynamoDB
+            if news_item.fingerprint in items:
+                owners[news_item.fingerprint].append(message_id)
+                logger.info(f"Duplicate event in batch: {news_item.title[:50]}...")
                 skipped += 1
+                if job_id:
+                    job_counts[job_id]["duplicates"] += 1
                 continue
+            if recent_fingerprints.contains(news_item.fingerprint):
+                logger.info(f"Recently stored event: {news_item.title[:50]}...")
+                skipped += 1
+                if job_id:
+                    job_counts[job_id]["duplicates"] += 1
+                continue
+            owners[news_item.fingerprint] = [message_id]
+            items[news_item.fingerprint] = news_item
+            if job_id:
+                job_of[news_item.fingerprint] = job_id
+
+    # Tag near-duplicate stories from other sources before they are stored
+    assign_clusters(list(items.values()), get_cluster_index())
+
+    if len(items) >= BULK_THRESHOLD:
+        stored, duplicates, failed = _store_bulk(list(items.values()), db_client)
+    else:
+        stored, duplicates, failed = _store_conditional(list(items.values()), db_client)
+    processed += len(stored)
+    skipped += len(duplicates)
+    for fingerprint in failed:
+        failed_messages.extend(owners[fingerprint])
+    # Failed writes are retried, so they only count towards the job once SQS gives up on them
+    final_failures = [fingerprint for fingerprint in failed if owners[fingerprint][0] in last_attempts]
+    for outcome, fingerprints in (("processed", stored), ("duplicates", duplicates), ("failed", final_failures)):
+        for fingerprint in fingerprints:
+            if fingerprint in job_of:
+                job_counts[job_of[fingerprint]][outcome] += 1
+    _record_job_progress(job_counts)
+    # Only fingerprints now known to be in the table; failed writes must be retried
+    failed_fingerprints = set(failed)
+    recent_fingerprints.add_all(fp for fp in items if fp not in failed_fingerprints)
+
+    failed_messages = list(dict.fromkeys(failed_messages))
+    if None in failed_messages:
+        # Without message IDs (direct invocation) the only way to retry is to fail the call
+        raise RuntimeError(f"Failed to ingest {len(failed_messages)} messages")
+
+    logger.info(f"Completed: processed {processed}, skipped {skipped}, "
+                f"failed {len(failed_messages)} messages, dead-lettered {dead_lettered}")
+    logger.info(f"Fingerprint cache: {recent_fingerprints.stats()}")
+    return {
+        "processed": processed,
+        "skipped": skipped,
+        "batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed_messages]
+    }
+
+
+def _get_sqs_client():
+    global sqs
+    if sqs is None:
+        sqs = boto3.client('sqs')
+    return sqs
 
-            db_client.put_item(news_item.to_dynamodb_item())
-            processed += 1
 
+def _dead_letter(body: str, error: str) -> bool:
+    """Send a permanently failing message to the DLQ; False if that isn't possible"""
+    dlq_url = os.getenv('INGEST_DLQ_URL')
+    if not dlq_url:
+        return False
+    try:
+        _get_sqs_client().send_message(
+            QueueUrl=dlq_url,
+            MessageBody=body,
+            MessageAttributes={"error": {"DataType": "String", "StringValue": error[:1024] or "unknown"}}
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Failed to dead-letter message: {str(e)}")
+        return False
+
+
+def _record_job_progress(job_counts: Dict[str, Counter]):
+    """Add this batch's outcomes to each async job's counters; never fails the batch"""
+    if not job_counts:
+        return
+    job_store = get_job_store()
+    if job_store is None:
+        return
+    for job_id, counts in job_counts.items():
+        try:
+            job_store.increment(job_id, counts)
         except Exception as e:
-            logger.error(f"Error processing message: {str(e)}")
-            raise
+            logger.error(f"Failed to update ingest job {job_id}: {str(e)}")
+
+
+def _store_conditional(items: List[NewsItem], db_client: DynamoDBClient) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Small batches: one conditional put per item; a failed condition means duplicate.
+    Returns the stored, duplicate and failed fingerprints.
+    """
+    stored, duplicates, failed = [], [], []
+    try:
+        # Items stored under their pre-v2 id during the fingerprint migration
+        legacy_duplicates = find_legacy_duplicates(items, db_client) if items else set()
+    except Exception as e:
+        logger.error(f"Legacy fingerprint lookup failed: {str(e)}")
+        return [], [], [news_item.fingerprint for news_item in items]
+
+    for news_item in items:
+        if news_item.fingerprint in legacy_duplicates:
+            duplicates.append(news_item.fingerprint)
+            continue
+        try:
+            if db_client.put_if_absent(news_item.to_dynamodb_item()):
+                stored.append(news_item.fingerprint)
+            else:
+                logger.info(f"Duplicate event found: {news_item.title[:50]}...")
+                duplicates.append(news_item.fingerprint)
+        except Exception as e:
+            logger.error(f"Failed to store {news_item.fingerprint}: {str(e)}")
+            failed.append(news_item.fingerprint)
+    return stored, duplicates, failed
+
+
+def _store_bulk(items: List[NewsItem], db_client: DynamoDBClient) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Large batches: one BatchGetItem to dedup, then BatchWriteItem for the new items.
+
+    BatchWriteItem can't carry a condition, so this reopens the get-then-put
+    race that put_if_absent closes: two containers that both miss a
+    fingerprint both write it. The second write replaces the first copy with
+    an event of the same fingerprint, so the stream emits a MODIFY record,
+    which the filter ignores, and the event is counted as processed twice.
+    That is accepted for the far fewer round trips on the fetcher's packed
+    batches; lower traffic under BULK_THRESHOLD keeps the conditional put.
+    """
+    # Pre-v2 ids are looked up in the same BatchGetItem during the fingerprint migration
+    legacy = legacy_ids(items)
+    try:
+        found = db_client.batch_get_existing_ids([news_item.fingerprint for news_item in items] + list(legacy))
+    except Exception as e:
+        logger.error(f"Bulk dedup lookup failed: {str(e)}")
+        return [], [], [news_item.fingerprint for news_item in items]
+    existing = {legacy.get(item_id, item_id) for item_id in found}
+    new_items = [news_item for news_item in items if news_item.fingerprint not in existing]
+    duplicates = [news_item.fingerprint for news_item in items if news_item.fingerprint in existing]
+
+    try:
+        failed = [item["id"]["S"] for item in
+                  db_client.batch_write_wire_items([news_item.to_dynamodb_wire() for news_item in new_items])]
+    except Exception as e:
+        logger.error(f"Bulk write failed: {str(e)}")
+        failed = [news_item.fingerprint for news_item in new_items]
 
-    logger.info(f"Completed: processed {processed}, skipped {skipped}")
-    return {"processed": processed, "skipped": skipped}
+    failed_set = set(failed)
+    stored = [news_item.fingerprint for news_item in new_items if news_item.fingerprint not in failed_set]
+    logger.info(f"Bulk ingest: {len(stored)} new, {len(duplicates)} duplicates, {len(failed)} failed")
+    return stored, duplicates, failed
@@ -1,13 +1,31 @@
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import uuid
+import boto3
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+from newsfeed.shared.cluster_index import assign_clusters, get_cluster_index
+from newsfeed.shared.fingerprint import find_legacy_duplicates
+from newsfeed.shared.ingest_jobs import IngestJobStore, get_job_store
 from newsfeed.shared.news_item import NewsItem
 from newsfeed.shared.dynamodb_client import DynamoDBClient
+from newsfeed.shared.sqs_publisher import SQSBatchPublisher
+from newsfeed.lambdas.ingest_api.stream_parser import EventParseError, EventStream
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Events per SQS message for async jobs; matches a BatchWriteItem request at ingest
+ASYNC_EVENTS_PER_MESSAGE = int(os.getenv("INGEST_API_EVENTS_PER_MESSAGE", "25"))
+
+# Events validated and written (or queued) per step, bounding what's held in memory
+STREAM_CHUNK_SIZE = int(os.getenv("INGEST_API_CHUNK_SIZE", "250"))
+
+# SQS client for async jobs, created on first use
+sqs = None
+
 def get_db_client() -> DynamoDBClient:
     return DynamoDBClient('RawEvents')
 
@@ -16,14 +34,23 @@ def lambda_handler(event: Dict[str, Any], context: Any, db_client: Optional[Dyna
     """
     API Gateway Lambda for ingesting news events directly.
     db_client can be injected for tests.
+
+    `POST /ingest?mode=async` validates the events, queues them for the ingest
+    Lambda and returns 202 with a job id; `GET /ingest/jobs/{job_id}` reports
+    the job's progress.
     """
     logger.info("Processing API ingestion request")
-    if db_client is None:
-        db_client = get_db_client()
+    if isinstance(event, dict) and event.get('httpMethod') == 'GET':
+        return _job_status(event)
 
     try:
         events_data = _parse_event_body(event)
-        logger.info(f"Processing {len(events_data)} events from API call")
+
+        if isinstance(event, dict) and (event.get('queryStringParameters') or {}).get('mode') == 'async':
+            return _accept_async(events_data)
+
+        if db_client is None:
+            db_client = get_db_client()
 
         processed, errors = _process_events(events_data, db_client)
 
@@ -38,7 +65,7 @@ def lambda_handler(event: Dict[str, Any], context: Any, db_client: Optional[Dyna
             'body': json.dumps({
                 'message': 'Events processed successfully',
                 'processed': processed,
-                'total': len(events_data),
+                'total': events_data.count,
                 'errors': errors if errors else None
             })
         }
@@ -55,40 +82,172 @@ def lambda_handler(event: Dict[str, Any], context: Any, db_client: Optional[Dyna
         }
 
 
-def _parse_event_body(event: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _response(status_code: int, body: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'statusCode': status_code,
+        'headers': {
+            'Content-Type': 'application/json',
+            'Access-Control-Allow-Origin': '*'
+        },
+        'body': json.dumps(body)
+    }
+
+
+def _get_sqs_client():
+    global sqs
+    if sqs is None:
+        sqs = boto3.client('sqs')
+    return sqs
+
+
+def _accept_async(events_data: EventStream, job_store: Optional[IngestJobStore] = None) -> Dict[str, Any]:
+    """Validate, queue the valid events in chunks under a new job id and return 202 without storing anything"""
+    job_store = job_store or get_job_store()
+    queue_url = os.getenv('SQS_QUEUE_URL')
+    if job_store is None or not queue_url:
+        return _response(503, {'error': 'Async ingest is not configured'})
+
+    job_id = uuid.uuid4().hex
+    # Create the job first so the ingest Lambda never updates a job that doesn't exist yet
+    job_store.create(job_id)
+
+    publisher = SQSBatchPublisher(_get_sqs_client(), queue_url,
+                                  events_per_message=ASYNC_EVENTS_PER_MESSAGE, job_id=job_id)
+    accepted, queued = 0, 0
+    errors = []
+    for chunk in _chunks(events_data, STREAM_CHUNK_SIZE):
+        valid_events, chunk_errors = _validate_events(chunk)
+        errors.extend(chunk_errors)
+        accepted += len(valid_events)
+        queued += publisher.publish(valid_events)
+
+    job_store.set_totals(job_id, accepted=accepted, rejected=len(errors))
+    if publisher.failed_events:
+        job_store.increment(job_id, {'failed': len(publisher.failed_events)})
+        errors.append(f"{len(publisher.failed_events)} events could not be queued")
+
+    logger.info(f"Async ingest job {job_id}: queued {queued} of {events_data.count} events "
+                f"in {publisher.requests} SQS requests")
+    return _response(202, {
+        'message': 'Events accepted for processing',
+        'job_id': job_id,
+        'queued': queued,
+        'total': events_data.count,
+        'errors': errors if errors else None
+    })
+
+
+def _chunks(events_data: Iterable, size: int) -> Iterable[List[Tuple[int, Any]]]:
+    """Consecutive (index, event) chunks of the stream"""
+    chunk = []
+    for i, event_data in enumerate(events_data):
+        chunk.append((i, event_data))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _build_item(i: int, event_data: Union[Dict[str, Any], EventParseError],
+                now: datetime) -> Tuple[Optional[NewsItem], Optional[str]]:
+    """NewsItem for a streamed event, or the per-event error"""
+    if isinstance(event_data, EventParseError):
+        return None, f"Event {i}: Invalid JSON: {str(event_data)}"
+    try:
+        news_item = NewsItem.from_raw_event(event_data, now=now)
+    except Exception as e:
+        return None, f"Event {i}: {str(e)}"
+    if not news_item.validate():
+        return None, f"Event {i}: Missing required fields"
+    return news_item, None
+
+
+def _validate_events(chunk: List[Tuple[int, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Split events into those ingest will accept and per-event errors, checking
+    the raw fields only; the ingest Lambda builds the items
+    """
+    valid_events = []
+    errors = []
+    for i, event_data in chunk:
+        if isinstance(event_data, EventParseError):
+            errors.append(f"Event {i}: Invalid JSON: {str(event_data)}")
+        elif not NewsItem.validate_raw_event(event_data):
+            errors.append(f"Event {i}: Missing required fields")
+        else:
+            valid_events.append(event_data)
+    return valid_events, errors
+
+
+def _job_status(event: Dict[str, Any], job_store: Optional[IngestJobStore] = None) -> Dict[str, Any]:
+    job_id = (event.get('pathParameters') or {}).get('job_id')
+    job_store = job_store or get_job_store()
+    if job_store is None:
+        return _response(503, {'error': 'Async ingest is not configured'})
+    if not job_id:
+        return _response(400, {'error': 'Invalid request', 'message': 'Missing job id'})
+
+    try:
+        status = job_store.get(job_id)
+    except Exception as e:
+        logger.error(f"Job status error: {str(e)}")
+        return _response(500, {'error': 'Internal server error', 'message': str(e)})
+    if status is None:
+        return _response(404, {'error': 'Job not found', 'job_id': job_id})
+    return _response(200, status)
+
+
+def _parse_event_body(event: Any) -> EventStream:
     """
-    Extract event list from API Gateway or direct invocation
+    Stream events from an API Gateway body (JSON array, NDJSON or one object)
+    or a direct invocation payload
     """
-    if 'body' in event:
-        body = json.loads(event['body'])
-    else:
-        body = event
-    return body if isinstance(body, list) else [body]
+    if isinstance(event, dict) and 'body' in event:
+        return EventStream(event['body'] or "")
+    return EventStream.of(event)
 
 
-def _process_events(events_data: List[Dict[str, Any]], db_client: DynamoDBClient) -> (int, List[str]):
-    """Process multiple news events, validate and store them"""
+def _process_events(events_data: Iterable, db_client: DynamoDBClient) -> (int, List[str]):
+    """Validate and store events chunk by chunk as they are parsed"""
     processed = 0
     errors = []
-
-    logger.info(f"Processing {len(events_data)} events from API call")
-    for i, event_data in enumerate(events_data):
+    # One clock read for the whole request
+    now = datetime.now(timezone.utc)
+
+    for chunk in _chunks(events_data, STREAM_CHUNK_SIZE):
+        valid_items = []
+        for i, event_data in chunk:
+            news_item, error = _build_item(i, event_data, now)
+            if error:
+                errors.append(error)
+            else:
+                valid_items.append((i, news_item))
+
+        # Tag near-duplicate stories before they are stored
+        assign_clusters([news_item for _, news_item in valid_items], get_cluster_index())
+        # Items stored under their pre-v2 id during the fingerprint migration
         try:
-            news_item = NewsItem.from_raw_event(event_data)
-
-            logger.info(f"Processing {news_item} events from API call")
-            if not news_item.validate():
-                errors.append(f"Event {i}: Missing required fields")
-                continue
+            legacy_duplicates = find_legacy_duplicates([news_item for _, news_item in valid_items], db_client)
+        except Exception as e:
+            # Without the lookup a write could duplicate a legacy item; report the chunk's events instead
+            logger.error(f"Legacy fingerprint lookup failed: {str(e)}")
+            errors.extend(f"Event {i}: {str(e)}" for i, _ in valid_items)
+            continue
 
-            if db_client.event_exists(news_item.fingerprint):
+        for i, news_item in valid_items:
+            if news_item.fingerprint in legacy_duplicates:
                 logger.info(f"Duplicate event skipped: {news_item.title[:50]}...")
                 continue
+            try:
+                # Dedup and write in one conditional put; a failed condition means duplicate
+                if not db_client.put_if_absent(news_item.to_dynamodb_item()):
+                    logger.info(f"Duplicate event skipped: {news_item.title[:50]}...")
+                    continue
 
-            db_client.put_item(news_item.to_dynamodb_item())
-            processed += 1
+                processed += 1
 
-        except Exception as e:
-            errors.append(f"Event {i}: {str(e)}")
+            except Exception as e:
+                errors.append(f"Event {i}: {str(e)}")
 
     return processed, errors
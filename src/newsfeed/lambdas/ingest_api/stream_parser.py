@@ -0,0 +1,120 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class EventParseError(Exception):
+    """A single malformed event; parsing continues with the next one"""
+
+
+class EventStream:
+    """
+    Incremental parser for an ingest request body: a JSON array of events,
+    NDJSON (one event per line) or a single event object.
+
+    Events are decoded one at a time with JSONDecoder.raw_decode, so only the
+    current event is materialized. A malformed event is yielded as an
+    EventParseError in its place and parsing resumes at the next array
+    element or line. `count` is the number of events seen so far.
+    """
+
+    def __init__(self, body: str):
+        self.body = body
+        self.count = 0
+        self._events: Optional[List[Any]] = None
+
+    @classmethod
+    def of(cls, payload: Any) -> 'EventStream':
+        """Stream over an already-decoded payload (direct Lambda invocation)"""
+        stream = cls("")
+        stream._events = payload if isinstance(payload, list) else [payload]
+        return stream
+
+    def __iter__(self) -> Iterator[Union[Dict[str, Any], EventParseError]]:
+        if self._events is not None:
+            for value in self._events:
+                yield self._event(value)
+            return
+        pos = self._skip_whitespace(0)
+        if pos == len(self.body):
+            return
+        if self.body[pos] == "[":
+            yield from self._array(pos + 1)
+        else:
+            yield from self._lines(pos)
+
+    def _skip_whitespace(self, pos: int) -> int:
+        body = self.body
+        while pos < len(body) and body[pos] in _WHITESPACE:
+            pos += 1
+        return pos
+
+    def _event(self, value: Any) -> Union[Dict[str, Any], EventParseError]:
+        self.count += 1
+        if not isinstance(value, dict):
+            return EventParseError(f"expected a JSON object, got {type(value).__name__}")
+        return value
+
+    def _array(self, pos: int) -> Iterator[Union[Dict[str, Any], EventParseError]]:
+        body = self.body
+        pos = self._skip_whitespace(pos)
+        if pos < len(body) and body[pos] == "]":
+            return
+        while pos < len(body):
+            try:
+                value, end = _decoder.raw_decode(body, pos)
+                end = self._skip_whitespace(end)
+                if end >= len(body) or body[end] not in ",]":
+                    raise ValueError(f"expected ',' or ']' at position {end}")
+                yield self._event(value)
+            except ValueError as e:
+                self.count += 1
+                yield EventParseError(str(e))
+                end = self._resync(pos)
+            if end >= len(body) or body[end] == "]":
+                return
+            pos = self._skip_whitespace(end + 1)
+        self.count += 1
+        yield EventParseError("Unterminated JSON array")
+
+    def _resync(self, pos: int) -> int:
+        """Position of the next ',' or ']' outside strings and nested values"""
+        body = self.body
+        depth, in_string, escaped = 0, False, False
+        while pos < len(body):
+            char = body[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                if depth == 0:
+                    return pos
+                depth -= 1
+            elif char == "," and depth == 0:
+                return pos
+            pos += 1
+        return pos
+
+    def _lines(self, pos: int) -> Iterator[Union[Dict[str, Any], EventParseError]]:
+        body = self.body
+        while pos < len(body):
+            try:
+                value, end = _decoder.raw_decode(body, pos)
+                yield self._event(value)
+                pos = end
+            except ValueError as e:
+                self.count += 1
+                yield EventParseError(str(e))
+                newline = body.find("\n", pos)
+                pos = len(body) if newline == -1 else newline
+            pos = self._skip_whitespace(pos)
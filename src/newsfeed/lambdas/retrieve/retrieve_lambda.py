@@ -27,7 +27,7 @@ def lambda_handler(event: Dict[str, Any], context: Any, db_client: DynamoDBClien
 
         logger.info(f"Retrieving up to {limit} filtered events (metadata: {include_metadata})")
 
-        items = _query_filtered_events(db_client, limit)
+        items = _collapse_clusters(_query_filtered_events(db_client, limit))
         events = _format_events(items, include_metadata)
 
         logger.info(f"Retrieved {len(events)} filtered events")
@@ -57,6 +57,20 @@ def _query_filtered_events(db_client: DynamoDBClient, limit: int) -> List[Dict[s
     return response.get('Items', [])
 
 
+def _collapse_clusters(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only the highest-ranked item of each near-duplicate cluster (items arrive best first)"""
+    seen = set()
+    collapsed = []
+    for item in items:
+        cluster_id = item.get('cluster_id')
+        if cluster_id:
+            if cluster_id in seen:
+                continue
+            seen.add(cluster_id)
+        collapsed.append(item)
+    return collapsed
+
+
 def _format_events(items: List[Dict[str, Any]], include_metadata: bool) -> List[Dict[str, Any]]:
     """Convert DynamoDB items to API response format"""
     events = []
@@ -0,0 +1,57 @@
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from newsfeed.shared.dynamodb_client import BATCH_WRITE_LIMIT, DynamoDBClient
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedBatchWriter:
+    """
+    Buffers items and writes them with BatchWriteItem once `flush_size` have
+    collected (and on `flush`), retrying UnprocessedItems via the client.
+
+    Items are keyed on the table's `key_attributes`. An item with the same key
+    as a buffered one replaces it (last write wins, as with put_item), since a
+    BatchWriteItem request can't put one key twice.
+
+    Each item can carry a `source` (e.g. the stream record's SequenceNumber);
+    `failed` lists the sources of items that could not be written, in the
+    order they were added, for partial-batch failure reporting. `written`
+    counts the sources whose item was stored.
+    """
+
+    def __init__(self, db_client: DynamoDBClient, flush_size: int = BATCH_WRITE_LIMIT,
+                 key_attributes: Sequence[str] = ("id",)):
+        self.db_client = db_client
+        self.flush_size = flush_size
+        self.key_attributes = tuple(key_attributes)
+        self.written = 0
+        self.failed: List[Any] = []
+        self._buffer: Dict[Tuple, Tuple[Dict, List[Any]]] = {}
+
+    def _key(self, item: Dict) -> Tuple:
+        return tuple(item[name] for name in self.key_attributes)
+
+    def add(self, item: Dict, source: Optional[Any] = None):
+        key = self._key(item)
+        sources = self._buffer[key][1] if key in self._buffer else []
+        self._buffer[key] = (item, sources + [source])
+        if len(self._buffer) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        buffered, self._buffer = list(self._buffer.values()), {}
+        try:
+            failed_keys = {self._key(item) for item in
+                           self.db_client.batch_write_items([item for item, _ in buffered], self.key_attributes)}
+        except Exception as e:
+            logger.error(f"Batch write of {len(buffered)} items failed: {str(e)}")
+            failed_keys = {self._key(item) for item, _ in buffered}
+        for item, sources in buffered:
+            if self._key(item) in failed_keys:
+                self.failed.extend(sources)
+            else:
+                self.written += len(sources)
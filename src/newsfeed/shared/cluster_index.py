@@ -0,0 +1,87 @@
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from newsfeed.shared.dynamodb_client import DynamoDBClient
+from newsfeed.shared.news_item import NewsItem, TTL_SECONDS
+from newsfeed.shared.simhash import MAX_DISTANCE, band_keys, hamming_distance, simhash
+
+logger = logging.getLogger(__name__)
+
+_index = None
+
+
+class ClusterIndex:
+    """
+    Banded SimHash index of story clusters, stored one item per band bucket
+    (`band#<n>#<bits>` -> cluster_id, simhash) with the RawEvents TTL.
+
+    `assign` looks up every band of each item's signature in one BatchGetItem,
+    joins the first candidate within MAX_DISTANCE bits, and otherwise starts a
+    new cluster named after the item. Only buckets this lookup found empty
+    are written, so an invocation never replaces a bucket it has seen. The
+    write is an unconditional BatchWriteItem, though: concurrent containers
+    that both find a bucket empty overwrite each other, last write wins, and
+    near-duplicates ingested at the same moment can land in two clusters.
+    """
+
+    def __init__(self, db_client: DynamoDBClient):
+        self.db_client = db_client
+
+    def assign(self, items: List[NewsItem], now: Optional[float] = None) -> int:
+        """Set cluster_id on each item; returns how many joined an existing cluster"""
+        signatures = [simhash(item.title, item.body) for item in items]
+        keys = [key for signature in signatures for key in band_keys(signature)]
+        buckets: Dict[str, Tuple[str, int]] = {
+            key: (entry["cluster_id"], int(entry["simhash"], 16))
+            for key, entry in self.db_client.batch_get_items(keys, ["cluster_id", "simhash"]).items()
+        }
+
+        ttl_epoch = int(time.time() if now is None else now) + TTL_SECONDS
+        new_entries, joined = {}, 0
+        for item, signature in zip(items, signatures):
+            item_keys = band_keys(signature)
+            cluster_id = next(
+                (buckets[key][0] for key in item_keys
+                 if key in buckets and hamming_distance(buckets[key][1], signature) <= MAX_DISTANCE),
+                None
+            )
+            if cluster_id is not None:
+                joined += 1
+            else:
+                cluster_id = item.id
+                for key in item_keys:
+                    if key not in buckets:
+                        # Later items in this batch can match it too
+                        buckets[key] = (cluster_id, signature)
+                        new_entries[key] = {"id": key, "cluster_id": cluster_id,
+                                            "simhash": f"{signature:016x}", "ttl_epoch": ttl_epoch}
+            item.cluster_id = cluster_id
+
+        failed = self.db_client.batch_write_items(list(new_entries.values()))
+        if failed:
+            logger.warning(f"Failed to index {len(failed)} cluster buckets")
+        return joined
+
+
+def get_cluster_index() -> Optional[ClusterIndex]:
+    """Index on CLUSTER_TABLE_NAME, shared across warm invocations; None when clustering is off"""
+    global _index
+    table_name = os.getenv("CLUSTER_TABLE_NAME")
+    if not table_name:
+        return None
+    if _index is None or _index.db_client.table.name != table_name:
+        _index = ClusterIndex(DynamoDBClient(table_name))
+    return _index
+
+
+def assign_clusters(items: List[NewsItem], index: Optional[ClusterIndex]):
+    """Best effort: items keep cluster_id None if the index is off or unavailable"""
+    if index is None or not items:
+        return
+    try:
+        joined = index.assign(items)
+        logger.info(f"Clustered {len(items)} items, {joined} near-duplicates of existing stories")
+    except Exception as e:
+        logger.error(f"Cluster assignment failed: {str(e)}")
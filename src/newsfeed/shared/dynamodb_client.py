@@ -1,12 +1,47 @@
+import time
+from typing import Callable, Dict, List, Sequence, Set
+
 import boto3
+from botocore.exceptions import ClientError
+
+# DynamoDB per-request limits
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
 
 class DynamoDBClient:
-    def __init__(self, table_name: str):
+    def __init__(self, table_name: str, max_retries: int = 5, backoff_seconds: float = 0.05):
         self.table = boto3.resource("dynamodb").Table(table_name)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._wire_client = None
+
+    @property
+    def wire_client(self):
+        """Low-level client without the resource's (de)serialization, for pre-encoded items"""
+        if self._wire_client is None:
+            self._wire_client = boto3.client("dynamodb", region_name=self.table.meta.client.meta.region_name)
+        return self._wire_client
 
     def put_item(self, item: dict):
         self.table.put_item(Item=item)
 
+    def put_if_absent(self, item: dict) -> bool:
+        """
+        Write the item only if no item with the same id exists, in one round trip.
+        Returns False (nothing written) when the id is already stored.
+
+        Unlike event_exists() followed by put_item(), concurrent writers can't
+        both store the same id. The bulk ingest path (BatchWriteItem) has no
+        condition and gives that guarantee up; see ingest_lambda._store_bulk.
+        """
+        try:
+            self.table.put_item(Item=item, ConditionExpression="attribute_not_exists(id)")
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return False
+            raise
+
     def get_item(self, key: dict):
         return self.table.get_item(Key=key)
 
@@ -16,3 +51,72 @@ class DynamoDBClient:
     def event_exists(self, fingerprint: str) -> bool:
         response = self.get_item({"id": fingerprint})
         return "Item" in response
+
+    def _backoff(self, attempt: int):
+        time.sleep(self.backoff_seconds * (2 ** attempt))
+
+    def batch_get_existing_ids(self, ids: List[str]) -> Set[str]:
+        """
+        Return the subset of `ids` already stored, using BatchGetItem
+        (100 keys per request, UnprocessedKeys retried with backoff).
+        """
+        return set(self.batch_get_items(ids, ["id"]))
+
+    def batch_get_items(self, ids: List[str], attributes: List[str]) -> Dict[str, Dict]:
+        """Fetch `attributes` of the stored items among `ids` with BatchGetItem, keyed by id"""
+        # The resource's client (de)serializes attribute values for us
+        client = self.table.meta.client
+        found = {}
+        unique_ids = list(dict.fromkeys(ids))
+        names = {f"#a{i}": name for i, name in enumerate(dict.fromkeys(["id", *attributes]))}
+
+        for start in range(0, len(unique_ids), BATCH_GET_LIMIT):
+            request = {self.table.name: {
+                "Keys": [{"id": item_id} for item_id in unique_ids[start:start + BATCH_GET_LIMIT]],
+                "ProjectionExpression": ", ".join(names),
+                "ExpressionAttributeNames": names
+            }}
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self._backoff(attempt - 1)
+                response = client.batch_get_item(RequestItems=request)
+                found.update((item["id"], item) for item in response.get("Responses", {}).get(self.table.name, []))
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+            if request:
+                raise RuntimeError(f"BatchGetItem left {len(request[self.table.name]['Keys'])} keys unprocessed")
+        return found
+
+    def batch_write_items(self, items: List[Dict], key_attributes: Sequence[str] = ("id",)) -> List[Dict]:
+        """
+        Write items with BatchWriteItem (25 per request), retrying UnprocessedItems
+        with backoff. Returns the items that still could not be written.
+        `key_attributes` is the table's primary key; items must be unique on it.
+        """
+        return self._batch_write(self.table.meta.client, items,
+                                 lambda item: tuple(item[name] for name in key_attributes))
+
+    def batch_write_wire_items(self, items: List[Dict]) -> List[Dict]:
+        """Like batch_write_items, for items already in attribute-value format (to_dynamodb_wire)"""
+        return self._batch_write(self.wire_client, items, lambda item: item["id"]["S"])
+
+    def _batch_write(self, client, items: List[Dict], key_of: Callable[[Dict], str]) -> List[Dict]:
+        failed = []
+
+        for start in range(0, len(items), BATCH_WRITE_LIMIT):
+            chunk = items[start:start + BATCH_WRITE_LIMIT]
+            pending = {key_of(item): item for item in chunk}
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    self._backoff(attempt - 1)
+                response = client.batch_write_item(RequestItems={
+                    self.table.name: [{"PutRequest": {"Item": item}} for item in pending.values()]
+                })
+                unprocessed = response.get("UnprocessedItems", {}).get(self.table.name, [])
+                unprocessed_ids = {key_of(request["PutRequest"]["Item"]) for request in unprocessed}
+                pending = {item_id: item for item_id, item in pending.items() if item_id in unprocessed_ids}
+                if not pending:
+                    break
+            failed.extend(item for item in chunk if key_of(item) in pending)
+        return failed
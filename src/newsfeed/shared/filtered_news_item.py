@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, List, Dict
 
-@dataclass
+@dataclass(slots=True)
 class FilteredNewsItem:
     """Schema for filtered news items in FilteredEvents table"""
     id: str
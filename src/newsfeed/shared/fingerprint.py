@@ -0,0 +1,68 @@
+import hashlib
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, Iterable, Set
+
+# Scheme for new fingerprints; ids carry a "<version>:" prefix except legacy v1 (bare MD5)
+FINGERPRINT_VERSION = os.getenv("FINGERPRINT_VERSION", "v2")
+# While RawEvents may still hold v1 ids (up to its 10-day TTL after switching), also look those up
+LEGACY_LOOKUP = os.getenv("FINGERPRINT_LEGACY_LOOKUP", "true").lower() == "true"
+# Domain separation for the hash (BLAKE2 personalization, cheaper than a key); must never change for v2
+_PERSON = b"newsfeed-fp-v2"
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_title(title: str) -> str:
+    """Case-, whitespace- and punctuation-insensitive form of a title"""
+    if not title.isascii():
+        title = unicodedata.normalize("NFKC", title)
+    title = title.casefold()
+    return " ".join(_PUNCTUATION.sub(" ", title).split())
+
+
+def _v1(event: dict) -> str:
+    """Original scheme: MD5 of the raw title, published_at and source"""
+    content = f"{event['title']}{event.get('published_at', '')}{event['source']}"
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def _v2(event: dict) -> str:
+    """BLAKE2b-128 of the normalized title, published_at and source"""
+    content = f"{normalize_title(event['title'])}\x1f{event.get('published_at', '')}\x1f{event['source']}"
+    return "v2:" + hashlib.blake2b(content.encode(), digest_size=16, person=_PERSON).hexdigest()
+
+
+SCHEMES: Dict[str, Callable[[dict], str]] = {"v1": _v1, "v2": _v2}
+
+
+def fingerprint(event: dict, version: str = None) -> str:
+    """Dedup id of a raw event (needs title and source) under `version`, FINGERPRINT_VERSION by default"""
+    return SCHEMES[version or FINGERPRINT_VERSION](event)
+
+
+def legacy_fingerprint(event: dict) -> str:
+    return _v1(event)
+
+
+def legacy_ids(items: Iterable) -> Dict[str, str]:
+    """v1 id -> current fingerprint for NewsItems not already on v1; empty when legacy lookup is off"""
+    if not LEGACY_LOOKUP:
+        return {}
+    ids = {}
+    for item in items:
+        legacy_id = legacy_fingerprint({"title": item.title, "published_at": item.published_at,
+                                        "source": item.source})
+        if legacy_id != item.fingerprint:
+            ids[legacy_id] = item.fingerprint
+    return ids
+
+
+def find_legacy_duplicates(items: Iterable, db_client) -> Set[str]:
+    """Fingerprints of `items` whose v1 id is already stored, with one BatchGetItem"""
+    ids = legacy_ids(items)
+    if not ids:
+        return set()
+    existing = db_client.batch_get_existing_ids(list(ids))
+    return {ids[legacy_id] for legacy_id in existing if legacy_id in ids}
@@ -0,0 +1,83 @@
+import logging
+import os
+import time
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from newsfeed.shared.dynamodb_client import DynamoDBClient
+
+logger = logging.getLogger(__name__)
+
+# Job records outlive the RawEvents items they describe by a day
+JOB_TTL_SECONDS = 11 * 24 * 60 * 60
+
+# Per-event outcomes counted by the ingest Lambda
+COUNTERS = ("processed", "duplicates", "invalid", "failed")
+
+
+class IngestJobStore:
+    """
+    Async ingest_api jobs: one item per job holding the accepted event count and
+    outcome counters the ingest Lambda adds to as it stores the queued events.
+
+    Counters are at-least-once: an SQS message redelivered after a partial
+    failure can count its already-stored events again as duplicates. Events
+    whose write fails on the message's last delivery (INGEST_MAX_RECEIVE_COUNT)
+    count as failed, so a job completes even when SQS dead-letters them. If
+    the ingest Lambda itself crashes on that delivery the job stays "processing".
+    """
+
+    def __init__(self, db_client: DynamoDBClient):
+        self.db_client = db_client
+
+    def create(self, job_id: str, accepted: int = 0, rejected: int = 0, now: Optional[float] = None):
+        now = time.time() if now is None else now
+        self.db_client.put_item({
+            "id": job_id,
+            "accepted": accepted,
+            "rejected": rejected,
+            "created_at": int(now),
+            "ttl_epoch": int(now) + JOB_TTL_SECONDS,
+            **{counter: 0 for counter in COUNTERS}
+        })
+
+    def set_totals(self, job_id: str, accepted: int, rejected: int):
+        """Record the final counts once the whole request has been streamed"""
+        self.db_client.table.update_item(
+            Key={"id": job_id},
+            UpdateExpression="SET accepted = :accepted, rejected = :rejected",
+            ExpressionAttributeValues={":accepted": accepted, ":rejected": rejected}
+        )
+
+    def increment(self, job_id: str, counts: Dict[str, int]):
+        """Atomically add to the job's counters (UpdateItem ADD)"""
+        counts = {counter: value for counter, value in counts.items() if value and counter in COUNTERS}
+        if not counts:
+            return
+        self.db_client.table.update_item(
+            Key={"id": job_id},
+            UpdateExpression="ADD " + ", ".join(f"#{counter} :{counter}" for counter in counts),
+            ExpressionAttributeNames={f"#{counter}": counter for counter in counts},
+            ExpressionAttributeValues={f":{counter}": value for counter, value in counts.items()}
+        )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job status, or None for an unknown job id"""
+        item = self.db_client.get_item({"id": job_id}).get("Item")
+        if item is None:
+            return None
+        status = {key: int(value) if isinstance(value, Decimal) else value for key, value in item.items()}
+        done = sum(status.get(counter, 0) for counter in COUNTERS)
+        return {
+            "job_id": job_id,
+            "status": "completed" if done >= status["accepted"] else "processing",
+            "accepted": status["accepted"],
+            "rejected": status["rejected"],
+            **{counter: status.get(counter, 0) for counter in COUNTERS}
+        }
+
+
+def get_job_store() -> Optional[IngestJobStore]:
+    """Store on INGEST_JOBS_TABLE; None when async jobs aren't configured"""
+    table_name = os.getenv("INGEST_JOBS_TABLE")
+    return IngestJobStore(DynamoDBClient(table_name)) if table_name else None
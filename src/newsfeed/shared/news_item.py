@@ -1,10 +1,36 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional, Union
 from datetime import datetime, timezone
 import json
-import hashlib
+import os
+import zlib
 
-@dataclass
+from newsfeed.shared.fingerprint import fingerprint
+
+# RawEvents retention
+TTL_SECONDS = 10 * 24 * 60 * 60
+
+# "zlib" stores raw_payload as a compressed Binary attribute; "none" keeps the JSON string
+RAW_PAYLOAD_COMPRESSION = os.getenv("RAW_PAYLOAD_COMPRESSION", "none")
+
+
+def compress_payload(raw_payload: str) -> bytes:
+    return zlib.compress(raw_payload.encode("utf-8"))
+
+
+def decode_raw_payload(value: Union[str, bytes, Any, None]) -> Optional[str]:
+    """
+    Return the raw_payload JSON text of a stored item, whichever encoding it was
+    written with. Readers that need the payload call this; others can leave the
+    compressed bytes untouched.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+    data = getattr(value, "value", value)
+    return zlib.decompress(bytes(data)).decode("utf-8")
+
+@dataclass(slots=True)
 class NewsItem:
     """Common schema for news items across the system"""
     id: str
@@ -17,38 +43,50 @@ class NewsItem:
     fingerprint: Optional[str] = None
     raw_payload: Optional[str] = None
     ttl_epoch: Optional[int] = None
+    # Near-duplicate story cluster (see shared.cluster_index); None when not clustered
+    cluster_id: Optional[str] = None
 
     @classmethod
-    def from_raw_event(cls, raw_event: dict) -> 'NewsItem':
-        """Create NewsItem from raw fetcher event"""
-        now = datetime.now(timezone.utc).isoformat()
+    def from_raw_event(cls, raw_event: dict, now: Optional[datetime] = None,
+                       raw_json: Optional[str] = None) -> 'NewsItem':
+        """
+        Create NewsItem from raw fetcher event.
+
+        Batch callers pass one `now` for the whole batch instead of reading the
+        clock per item, and `raw_json` when they already hold the event's JSON
+        text, which is stored as raw_payload instead of re-serializing the event.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        ingested_at = now.isoformat()
         fingerprint = cls._generate_fingerprint(raw_event)
-        
-        # Calculate TTL (10 days from now).
-        ttl_epoch = int(datetime.now(timezone.utc).timestamp()) + (10 * 24 * 60 * 60)
-        
+
         return cls(
             id=fingerprint,  # Use fingerprint as primary key
             source=raw_event['source'],
             title=raw_event['title'],
             url=raw_event.get('url', ''),
             body=raw_event.get('body', ''),
-            published_at=raw_event.get('published_at', now),
-            ingested_at=now,
+            published_at=raw_event.get('published_at', ingested_at),
+            ingested_at=ingested_at,
             fingerprint=fingerprint,
-            raw_payload=json.dumps(raw_event),
-            ttl_epoch=ttl_epoch
+            raw_payload=raw_json if raw_json is not None else json.dumps(raw_event),
+            ttl_epoch=int(now.timestamp()) + TTL_SECONDS
         )
     
     @staticmethod
     def _generate_fingerprint(event: dict) -> str:
-        """Generate unique fingerprint for deduplication"""
-        content = f"{event['title']}{event.get('published_at', '')}{event['source']}"
-        return hashlib.md5(content.encode()).hexdigest()
+        """Generate unique fingerprint for deduplication (see shared.fingerprint)"""
+        return fingerprint(event)
     
+    def _stored_payload(self) -> Union[str, bytes, None]:
+        if self.raw_payload is not None and RAW_PAYLOAD_COMPRESSION == "zlib":
+            return compress_payload(self.raw_payload)
+        return self.raw_payload
+
     def to_dynamodb_item(self) -> dict:
         """Convert to DynamoDB item format"""
-        return {
+        item = {
             'id': self.id,
             'source': self.source,
             'title': self.title,
@@ -57,11 +95,58 @@ class NewsItem:
             'published_at': self.published_at,
             'ingested_at': self.ingested_at,
             'fingerprint': self.fingerprint,
-            'raw_payload': self.raw_payload,
+            'raw_payload': self._stored_payload(),
             'ttl_epoch': self.ttl_epoch
         }
+        if self.cluster_id is not None:
+            item['cluster_id'] = self.cluster_id
+        return item
+
+    def to_dynamodb_wire(self) -> dict:
+        """
+        Encode straight to DynamoDB's attribute-value format for the low-level
+        client, skipping boto3's generic TypeSerializer. None values are omitted.
+        """
+        item = {'id': {'S': self.id}, 'source': {'S': self.source}, 'title': {'S': self.title},
+                'published_at': {'S': self.published_at}}
+        if self.body is not None:
+            item['body'] = {'S': self.body}
+        if self.url is not None:
+            item['url'] = {'S': self.url}
+        if self.ingested_at is not None:
+            item['ingested_at'] = {'S': self.ingested_at}
+        if self.fingerprint is not None:
+            item['fingerprint'] = {'S': self.fingerprint}
+        payload = self._stored_payload()
+        if isinstance(payload, bytes):
+            item['raw_payload'] = {'B': payload}
+        elif payload is not None:
+            item['raw_payload'] = {'S': payload}
+        if self.ttl_epoch is not None:
+            item['ttl_epoch'] = {'N': str(self.ttl_epoch)}
+        if self.cluster_id is not None:
+            item['cluster_id'] = {'S': self.cluster_id}
+        return item
     
+    @staticmethod
+    def validate_raw_event(raw_event: Any) -> bool:
+        """
+        Whether from_raw_event would build an item that passes validate(),
+        checked on the raw fields without fingerprinting or serializing
+        """
+        if not isinstance(raw_event, dict):
+            return False
+        required_fields = [raw_event.get('title'), raw_event.get('source'), raw_event.get('published_at', 'now')]
+        optional_fields = [raw_event.get('url'), raw_event.get('body')]
+        return (all(isinstance(field, str) and field for field in required_fields)
+                and all(field is None or isinstance(field, str) for field in optional_fields))
+
     def validate(self) -> bool:
-        """Validate required fields"""
+        """
+        Validate required fields: non-empty strings, with url and body strings
+        when set. to_dynamodb_wire encodes all of them as S without checking.
+        """
         required_fields = [self.id, self.source, self.title, self.published_at]
-        return all(field for field in required_fields)
+        optional_fields = [self.url, self.body]
+        return (all(isinstance(field, str) and field for field in required_fields)
+                and all(field is None or isinstance(field, str) for field in optional_fields))
@@ -0,0 +1,62 @@
+import hashlib
+import re
+from typing import Dict, List
+
+SIMHASH_BITS = 64
+# 4 bands of 16 bits: by pigeonhole, signatures within MAX_DISTANCE bits share at least one band
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = 3
+
+TITLE_WEIGHT = 3
+# Only the lead of the body; sources quote the same opening but diverge after it
+BODY_TOKENS = 64
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or that the this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased alphanumeric tokens without stopwords"""
+    return [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def simhash(title: str, body: str = "") -> int:
+    """
+    64-bit SimHash of a story's normalized title and body lead. Title tokens
+    weigh TITLE_WEIGHT times more than body tokens, so the same headline with
+    slightly different formatting or copy lands within a few bits.
+    """
+    weights: Dict[str, int] = {}
+    for token in tokenize(title):
+        weights[token] = weights.get(token, 0) + TITLE_WEIGHT
+    for token in tokenize(body or "")[:BODY_TOKENS]:
+        weights[token] = weights.get(token, 0) + 1
+
+    vector = [0] * SIMHASH_BITS
+    for token, weight in weights.items():
+        h = _token_hash(token)
+        for bit in range(SIMHASH_BITS):
+            vector[bit] += weight if h >> bit & 1 else -weight
+
+    signature = 0
+    for bit, total in enumerate(vector):
+        if total > 0:
+            signature |= 1 << bit
+    return signature
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def band_keys(signature: int) -> List[str]:
+    """Index keys for each band of the signature"""
+    mask = (1 << BAND_BITS) - 1
+    return [f"band#{i}#{signature >> (i * BAND_BITS) & mask:04x}" for i in range(BANDS)]
@@ -0,0 +1,157 @@
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQS limits for a single SendMessageBatch call
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+# Envelope key for message bodies carrying several events
+PACKED_EVENTS_KEY = "packed_events"
+# Envelope key tying the events to an async ingest job
+JOB_ID_KEY = "job_id"
+
+
+def pack_events(events: List[Dict[str, Any]], events_per_message: int = 1,
+                max_message_bytes: int = MAX_BATCH_BYTES,
+                job_id: Optional[str] = None) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Group events into SQS message bodies.
+
+    With `events_per_message` > 1, consecutive events are packed into a single
+    `{"packed_events": [...]}` body as long as it stays under `max_message_bytes`.
+    With a `job_id`, every body uses the envelope and carries `"job_id"` too.
+    Returns (body, events) pairs so callers know which events each body carries.
+    """
+    if events_per_message <= 1 and job_id is None:
+        return [(json.dumps(event), [event]) for event in events]
+
+    messages = []
+    chunk: List[Dict[str, Any]] = []
+    chunk_parts: List[str] = []
+    chunk_bytes = 0
+    header = f'"{JOB_ID_KEY}": {json.dumps(job_id)}, ' if job_id is not None else ""
+    # Envelope overhead: {<header>"packed_events": []}
+    envelope_bytes = len(header.encode()) + len(PACKED_EVENTS_KEY) + 8
+
+    for event in events:
+        part = json.dumps(event)
+        part_bytes = len(part.encode()) + 2  # separator ", "
+        if chunk and (len(chunk) >= events_per_message
+                      or envelope_bytes + chunk_bytes + part_bytes > max_message_bytes):
+            messages.append(_packed_body(chunk_parts, chunk, header))
+            chunk, chunk_parts, chunk_bytes = [], [], 0
+        chunk.append(event)
+        chunk_parts.append(part)
+        chunk_bytes += part_bytes
+
+    if chunk:
+        messages.append(_packed_body(chunk_parts, chunk, header))
+    return messages
+
+
+def _packed_body(parts: List[str], events: List[Dict[str, Any]],
+                 header: str = "") -> Tuple[str, List[Dict[str, Any]]]:
+    if len(events) == 1 and not header:
+        return parts[0], events
+    return f'{{{header}"{PACKED_EVENTS_KEY}": [{", ".join(parts)}]}}', events
+
+
+def unpack_message(body: str) -> List[Dict[str, Any]]:
+    """Return the events carried by an SQS message body, packed or not"""
+    return [event for event, _ in unpack_message_raw(body)]
+
+
+def unpack_message_raw(body: str) -> List[Tuple[Dict[str, Any], Optional[str]]]:
+    """
+    Like unpack_message, paired with each event's original JSON text where the
+    body holds a single unpacked event (None for packed events).
+    """
+    return unpack_envelope(body)[0]
+
+
+def unpack_envelope(body: str) -> Tuple[List[Tuple[Dict[str, Any], Optional[str]]], Optional[str]]:
+    """unpack_message_raw plus the job id the envelope carries, if any"""
+    payload = json.loads(body)
+    if isinstance(payload, dict) and isinstance(payload.get(PACKED_EVENTS_KEY), list):
+        return [(event, None) for event in payload[PACKED_EVENTS_KEY]], payload.get(JOB_ID_KEY)
+    return [(payload, body)], None
+
+
+class SQSBatchPublisher:
+    """Publishes events with SendMessageBatch, retrying only the failed entries"""
+
+    def __init__(self, sqs_client, queue_url: str, events_per_message: int = 1,
+                 max_retries: int = 3, backoff_seconds: float = 0.2, job_id: Optional[str] = None):
+        self.sqs = sqs_client
+        self.queue_url = queue_url
+        self.events_per_message = events_per_message
+        self.job_id = job_id
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.requests = 0
+        self.failed_events: List[Dict[str, Any]] = []
+
+    def publish(self, events: List[Dict[str, Any]]) -> int:
+        """Send events to SQS and return how many were accepted"""
+        messages = pack_events(events, self.events_per_message, job_id=self.job_id)
+        sent = 0
+        for batch in self._batches(messages):
+            sent += self._send_batch(batch)
+        return sent
+
+    @staticmethod
+    def _batches(messages: List[Tuple[str, List[Dict[str, Any]]]]):
+        """Yield groups of at most 10 messages whose bodies fit in one request"""
+        batch, batch_bytes = [], 0
+        for body, events in messages:
+            body_bytes = len(body.encode())
+            if batch and (len(batch) >= MAX_BATCH_ENTRIES or batch_bytes + body_bytes > MAX_BATCH_BYTES):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append((body, events))
+            batch_bytes += body_bytes
+        if batch:
+            yield batch
+
+    def _send_batch(self, batch: List[Tuple[str, List[Dict[str, Any]]]]) -> int:
+        pending = {str(i): message for i, message in enumerate(batch)}
+        sent = 0
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+            try:
+                self.requests += 1
+                response = self.sqs.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[{"Id": entry_id, "MessageBody": body} for entry_id, (body, _) in pending.items()],
+                )
+            except Exception as e:
+                logger.error(f"SQS batch send failed (attempt {attempt + 1}): {str(e)}")
+                continue
+
+            for entry in response.get("Successful", []):
+                sent += len(pending.pop(entry["Id"])[1])
+
+            retryable = {}
+            for entry in response.get("Failed", []):
+                message = pending.pop(entry["Id"])
+                if entry.get("SenderFault"):
+                    # Malformed or oversized entry; retrying won't help
+                    logger.error(f"SQS rejected message: {entry.get('Code')} {entry.get('Message', '')}")
+                    self.failed_events.extend(message[1])
+                else:
+                    retryable[entry["Id"]] = message
+            pending.update(retryable)
+            if not pending:
+                break
+
+        for _, events in pending.values():
+            self.failed_events.extend(events)
+        if pending:
+            logger.error(f"Giving up on {len(pending)} SQS messages after {self.max_retries} retries")
+        return sent
@@ -0,0 +1,52 @@
+import base64
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+
+def _number(value: str) -> Union[int, Decimal]:
+    """Integers as int (ttl_epoch, counters), anything else as an exact Decimal like boto3"""
+    try:
+        return int(value)
+    except ValueError:
+        return Decimal(value)
+
+
+def _binary(value: Union[str, bytes]) -> bytes:
+    """Stream records carry B values base64-encoded; the low-level client already decoded them"""
+    return base64.b64decode(value) if isinstance(value, str) else value
+
+
+_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "S": str,
+    "N": _number,
+    "B": _binary,
+    "BOOL": bool,
+    "NULL": lambda _: None,
+    "SS": set,
+    "NS": lambda values: {_number(value) for value in values},
+    "BS": lambda values: {_binary(value) for value in values},
+    "L": lambda values: [from_wire(value) for value in values],
+    "M": lambda values: {name: from_wire(value) for name, value in values.items()},
+}
+
+
+def from_wire(value: Dict[str, Any]) -> Any:
+    """Python value of one DynamoDB attribute value ({"S": "..."}, {"N": "1"}, ...)"""
+    # Strings are most attributes: skip the type dispatch for them
+    string = value.get("S")
+    if string is not None:
+        return string
+    for attr_type, raw in value.items():
+        return _DECODERS[attr_type](raw)
+    raise ValueError("Empty attribute value")
+
+
+def deserialize_image(image: Dict[str, Dict[str, Any]], attributes: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Plain dict of a DynamoDB item or stream image in wire format. With
+    `attributes`, only those present are decoded, so large attributes such as
+    raw_payload are never materialized.
+    """
+    if attributes is None:
+        return {name: from_wire(value) for name, value in image.items()}
+    return {name: from_wire(image[name]) for name in attributes if name in image}
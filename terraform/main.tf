@@ -12,6 +12,27 @@ module "raw_events_table" {
   table_name = "RawEvents"
 }
 
+# DynamoDB table for the near-duplicate story index (SimHash band buckets)
+module "story_clusters_table" {
+  source = "./modules/dynamodb"
+
+  table_name = "StoryClusters"
+}
+
+# DynamoDB table for async ingest_api jobs (accepted count and outcome counters)
+module "ingest_jobs_table" {
+  source = "./modules/dynamodb"
+
+  table_name = "IngestJobs"
+}
+
+# DynamoDB table for fetcher state (feed validators, per-source cursors)
+module "fetcher_state_table" {
+  source = "./modules/dynamodb"
+
+  table_name = "FetcherState"
+}
+
 # Fetcher Lambda (triggered by EventBridge, pushes to SQS)
 module "fetcher_lambda" {
   source = "./modules/lambda"
@@ -24,6 +45,8 @@ module "fetcher_lambda" {
     REDDIT_CLIENT_ID     = var.reddit_client_id
     REDDIT_CLIENT_SECRET = var.reddit_client_secret
     SQS_QUEUE_URL        = module.ingestion_queue.queue_url
+    FETCHER_STATE_TABLE  = module.fetcher_state_table.table_name
+    FETCH_TICK_SECONDS   = "900"
   }
 
 }
@@ -32,8 +55,8 @@ module "fetcher_lambda" {
 module "fetcher_schedule" {
   source = "./modules/eventbridge"
   rule_name           = "newsfeed-hourly-fetch"
-  description         = "Trigger news fetcher every hour"
-  schedule_expression = "rate(1 hour)"
+  description         = "Tick the news fetcher; the source scheduler decides which feeds are due"
+  schedule_expression = "rate(15 minutes)"
   lambda_function_arn = module.fetcher_lambda.lambda_function_arn
   lambda_function_name = module.fetcher_lambda.lambda_function_name
 }
@@ -58,6 +81,26 @@ resource "aws_iam_role_policy" "fetcher_sqs_policy" {
   })
 }
 
+# DynamoDB permissions for fetcher lambda state
+resource "aws_iam_role_policy" "fetcher_dynamodb_policy" {
+  name = "fetcher-dynamodb-policy"
+  role = module.fetcher_lambda.lambda_role_name
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:PutItem",
+          "dynamodb:GetItem"
+        ]
+        Resource = module.fetcher_state_table.table_arn
+      }
+    ]
+  })
+}
+
 # Ingest Lambda (processes SQS messages, writes to DynamoDB)
 module "ingest_lambda" {
   source = "./modules/lambda"
@@ -67,15 +110,26 @@ module "ingest_lambda" {
   dir          = "ingest"
 
   environment_variables = {
-    DYNAMODB_TABLE_NAME = module.raw_events_table.table_name
+    DYNAMODB_TABLE_NAME     = module.raw_events_table.table_name
+    INGEST_DLQ_URL          = module.ingestion_queue.dlq_url
+    # Failures on the last delivery are final and count towards async job progress
+    INGEST_MAX_RECEIVE_COUNT = tostring(module.ingestion_queue.max_receive_count)
+    RAW_PAYLOAD_COMPRESSION = "zlib"
+    CLUSTER_TABLE_NAME      = module.story_clusters_table.table_name
+    INGEST_JOBS_TABLE       = module.ingest_jobs_table.table_name
+    # Also dedup against pre-v2 (MD5) ids; safe to turn off once RawEvents' 10-day TTL has passed
+    FINGERPRINT_LEGACY_LOOKUP = "true"
   }
 }
 
 # SQS trigger for ingest lambda
+# The handler reports failed message IDs, so only those are redelivered
 resource "aws_lambda_event_source_mapping" "sqs_trigger" {
-  event_source_arn = module.ingestion_queue.queue_arn
-  function_name    = module.ingest_lambda.lambda_function_name
-  batch_size       = 10
+  event_source_arn                   = module.ingestion_queue.queue_arn
+  function_name                      = module.ingest_lambda.lambda_function_name
+  batch_size                         = 100
+  maximum_batching_window_in_seconds = 5
+  function_response_types            = ["ReportBatchItemFailures"]
 }
 
 # DynamoDB permissions for ingest lambda
@@ -90,9 +144,24 @@ resource "aws_iam_role_policy" "ingest_dynamodb_policy" {
         Effect = "Allow"
         Action = [
           "dynamodb:PutItem",
-          "dynamodb:GetItem"
+          "dynamodb:GetItem",
+          "dynamodb:BatchGetItem",
+          "dynamodb:BatchWriteItem"
         ]
         Resource = module.raw_events_table.table_arn
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:BatchGetItem",
+          "dynamodb:BatchWriteItem"
+        ]
+        Resource = module.story_clusters_table.table_arn
+      },
+      {
+        Effect   = "Allow"
+        Action   = ["dynamodb:UpdateItem"]
+        Resource = module.ingest_jobs_table.table_arn
       }
     ]
   })
@@ -114,6 +183,12 @@ resource "aws_iam_role_policy" "ingest_sqs_policy" {
           "sqs:GetQueueAttributes"
         ]
         Resource = module.ingestion_queue.queue_arn
+      },
+      {
+        # Malformed messages are dead-lettered directly (INGEST_DLQ_URL)
+        Effect   = "Allow"
+        Action   = ["sqs:SendMessage"]
+        Resource = module.ingestion_queue.dlq_arn
       }
     ]
   })
@@ -148,7 +223,17 @@ resource "aws_lambda_event_source_mapping" "dynamodb_stream_trigger" {
   event_source_arn  = module.raw_events_table.stream_arn
   function_name     = module.filter_lambda.lambda_function_name
   starting_position = "LATEST"
-  batch_size        = 10
+  batch_size        = 100
+
+  # The handler returns the SequenceNumbers of records it couldn't store
+  function_response_types = ["ReportBatchItemFailures"]
+
+  # Only new items are scored: MODIFYs and TTL-expiry REMOVEs never invoke the filter
+  filter_criteria {
+    filter {
+      pattern = jsonencode({ eventName = ["INSERT"] })
+    }
+  }
 }
 
 # DynamoDB permissions for filter lambda
@@ -162,7 +247,8 @@ resource "aws_iam_role_policy" "filter_dynamodb_policy" {
       {
         Effect = "Allow"
         Action = [
-          "dynamodb:PutItem"
+          "dynamodb:PutItem",
+          "dynamodb:BatchWriteItem"
         ]
         Resource = module.filtered_events_table.table_arn
       }
@@ -200,7 +286,13 @@ module "ingest_api_lambda" {
   dir          = "ingest_api"
 
   environment_variables = {
-    DYNAMODB_TABLE_NAME = module.raw_events_table.table_name
+    DYNAMODB_TABLE_NAME     = module.raw_events_table.table_name
+    RAW_PAYLOAD_COMPRESSION = "zlib"
+    CLUSTER_TABLE_NAME      = module.story_clusters_table.table_name
+    INGEST_JOBS_TABLE       = module.ingest_jobs_table.table_name
+    # Also dedup against pre-v2 (MD5) ids; safe to turn off once RawEvents' 10-day TTL has passed
+    FINGERPRINT_LEGACY_LOOKUP = "true"
+    SQS_QUEUE_URL           = module.ingestion_queue.queue_url
   }
 }
 
@@ -216,9 +308,45 @@ resource "aws_iam_role_policy" "ingest_api_dynamodb_policy" {
         Effect = "Allow"
         Action = [
           "dynamodb:PutItem",
-          "dynamodb:GetItem"
+          "dynamodb:GetItem",
+          # Pre-v2 fingerprint lookup (FINGERPRINT_LEGACY_LOOKUP)
+          "dynamodb:BatchGetItem"
         ]
         Resource = module.raw_events_table.table_arn
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:BatchGetItem",
+          "dynamodb:BatchWriteItem"
+        ]
+        Resource = module.story_clusters_table.table_arn
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:PutItem",
+          "dynamodb:GetItem",
+          "dynamodb:UpdateItem"
+        ]
+        Resource = module.ingest_jobs_table.table_arn
+      }
+    ]
+  })
+}
+
+# SQS permissions for ingest API lambda (async jobs enqueue to the ingestion queue)
+resource "aws_iam_role_policy" "ingest_api_sqs_policy" {
+  name = "ingest-api-sqs-policy"
+  role = module.ingest_api_lambda.lambda_role_name
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect   = "Allow"
+        Action   = ["sqs:SendMessage"]
+        Resource = module.ingestion_queue.queue_arn
       }
     ]
   })
@@ -275,6 +403,14 @@ resource "aws_lambda_permission" "ingest_api_gateway_permission" {
   source_arn    = "${module.api_gateway.api_execution_arn}/*/POST/ingest"
 }
 
+resource "aws_lambda_permission" "ingest_jobs_api_gateway_permission" {
+  statement_id  = "AllowAPIGatewayInvokeIngestJobs"
+  action        = "lambda:InvokeFunction"
+  function_name = module.ingest_api_lambda.lambda_function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${module.api_gateway.api_execution_arn}/*/GET/ingest/jobs/*"
+}
+
 # Lambda permissions for API Gateway to invoke retrieve lambda
 resource "aws_lambda_permission" "retrieve_api_gateway_permission" {
   statement_id  = "AllowAPIGatewayInvokeRetrieve"
@@ -30,6 +30,42 @@ resource "aws_api_gateway_integration" "ingest_integration" {
   uri                    = "arn:aws:apigateway:eu-west-1:lambda:path/2015-03-31/functions/${var.ingest_lambda_invoke_arn}/invocations"
 }
 
+# API Gateway resources for /ingest/jobs/{job_id} (async ingest status)
+resource "aws_api_gateway_resource" "ingest_jobs" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_resource.ingest.id
+  path_part   = "jobs"
+}
+
+resource "aws_api_gateway_resource" "ingest_job" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_resource.ingest_jobs.id
+  path_part   = "{job_id}"
+}
+
+# API Gateway method GET /ingest/jobs/{job_id}
+resource "aws_api_gateway_method" "ingest_job_get" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.ingest_job.id
+  http_method   = "GET"
+  authorization = "NONE"
+
+  request_parameters = {
+    "method.request.path.job_id" = true
+  }
+}
+
+# Job status is served by the ingest Lambda
+resource "aws_api_gateway_integration" "ingest_job_integration" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  resource_id = aws_api_gateway_resource.ingest_job.id
+  http_method = aws_api_gateway_method.ingest_job_get.http_method
+
+  integration_http_method = "POST"
+  type                   = "AWS_PROXY"
+  uri                    = "arn:aws:apigateway:eu-west-1:lambda:path/2015-03-31/functions/${var.ingest_lambda_invoke_arn}/invocations"
+}
+
 # API Gateway resource for /retrieve
 resource "aws_api_gateway_resource" "retrieve" {
   rest_api_id = aws_api_gateway_rest_api.main.id
@@ -60,6 +96,7 @@ resource "aws_api_gateway_integration" "retrieve_integration" {
 resource "aws_api_gateway_deployment" "main" {
   depends_on = [
     aws_api_gateway_integration.ingest_integration,
+    aws_api_gateway_integration.ingest_job_integration,
     aws_api_gateway_integration.retrieve_integration
   ]
 
@@ -74,6 +111,9 @@ resource "aws_api_gateway_deployment" "main" {
       aws_api_gateway_method.retrieve_get.id,
       aws_api_gateway_integration.ingest_integration.id,
       aws_api_gateway_integration.retrieve_integration.id,
+      aws_api_gateway_resource.ingest_job.id,
+      aws_api_gateway_method.ingest_job_get.id,
+      aws_api_gateway_integration.ingest_job_integration.id,
     ]))
   }
 
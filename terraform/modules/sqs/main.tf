@@ -14,6 +14,6 @@ resource "aws_sqs_queue" "main" {
   # Configure dead letter queue
   redrive_policy = jsonencode({
     deadLetterTargetArn = aws_sqs_queue.dlq.arn
-    maxReceiveCount     = 3
+    maxReceiveCount     = var.max_receive_count
   })
 }
@@ -17,3 +17,8 @@ output "dlq_arn" {
   description = "ARN of the dead letter queue"
   value       = aws_sqs_queue.dlq.arn
 }
+
+output "max_receive_count" {
+  description = "Deliveries before a message is moved to the dead letter queue"
+  value       = var.max_receive_count
+}
@@ -2,3 +2,9 @@ variable "queue_name" {
   description = "Name of the SQS queue"
   type        = string
 }
+
+variable "max_receive_count" {
+  description = "Deliveries before a message is moved to the dead letter queue"
+  type        = number
+  default     = 3
+}
@@ -0,0 +1,86 @@
+"""
+Benchmark: ingest_api request handling for 1-6 MB bodies.
+
+Compares the previous path (json.loads of the whole body, every event and
+NewsItem materialized, a repr logged per event) with the streaming parser
+(EventStream + chunked validation) for JSON arrays and NDJSON. Storage goes to
+an in-memory stand-in, so the numbers cover parsing, validation and item
+building only. Peak memory is measured with tracemalloc on top of the body.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.bench_ingest_api_parse
+"""
+import json
+import logging
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from newsfeed.lambdas.ingest_api import ingest_api_lambda
+from newsfeed.shared.news_item import NewsItem
+
+SIZES_MB = (1, 2, 4, 6)
+
+
+class InMemoryDB:
+    def put_if_absent(self, item):
+        return True
+
+    def batch_get_existing_ids(self, ids):
+        return set()
+
+
+def legacy_handle(body: str, db_client) -> int:
+    events = json.loads(body)
+    now = datetime.now(timezone.utc)
+    items = []
+    for event_data in events:
+        news_item = NewsItem.from_raw_event(event_data, now=now)
+        ingest_api_lambda.logger.info(f"Processing {news_item} events from API call")
+        if news_item.validate():
+            items.append(news_item)
+    return sum(db_client.put_if_absent(item.to_dynamodb_item()) for item in items)
+
+
+def streaming_handle(body: str, db_client) -> int:
+    return ingest_api_lambda._process_events(ingest_api_lambda._parse_event_body({"body": body}), db_client)[0]
+
+
+def build_events(size_mb: int):
+    event = {"source": "api", "title": "Major AWS outage affecting Europe", "published_at": "2025-08-20T10:00:00Z",
+             "body": "AWS reports downtime in eu-west-1 affecting several services. " * 8}
+    per_event = len(json.dumps(event)) + 2
+    return [{**event, "id": str(i), "title": f"{event['title']} {i}"}
+            for i in range(size_mb * 1024 * 1024 // per_event)]
+
+
+def measure(fn, body: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    processed = fn(body, InMemoryDB())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return processed, elapsed, peak / 1024 / 1024
+
+
+def main():
+    # The handler logs at INFO in Lambda; keep that cost in the legacy numbers but off the terminal
+    logging.getLogger().handlers = [logging.NullHandler()]
+    logging.getLogger().setLevel(logging.INFO)
+
+    for size_mb in SIZES_MB:
+        events = build_events(size_mb)
+        array_body = json.dumps(events)
+        ndjson_body = "\n".join(json.dumps(e) for e in events)
+        print(f"{len(array_body) / 1024 / 1024:.1f} MB, {len(events)} events")
+        for label, fn, body in (("legacy json.loads", legacy_handle, array_body),
+                                ("stream array", streaming_handle, array_body),
+                                ("stream ndjson", streaming_handle, ndjson_body)):
+            processed, elapsed, peak_mb = measure(fn, body)
+            assert processed == len(events)
+            print(f"  {label:<18} {elapsed * 1000:7.0f} ms  {elapsed / len(events) * 1e6:6.1f} us/event  "
+                  f"peak +{peak_mb:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
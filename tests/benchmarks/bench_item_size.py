@@ -0,0 +1,64 @@
+"""
+RawEvents item size and write capacity with raw_payload stored as a JSON
+string versus a zlib-compressed Binary attribute.
+
+Item size follows DynamoDB's accounting: attribute name bytes plus UTF-8
+string / raw binary bytes, and roughly one byte per two digits for numbers.
+One WCU covers 1 KB of a standard write.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.bench_item_size
+"""
+import math
+import random
+
+import feedparser
+
+from newsfeed.lambdas.fetcher.fetchers.extract import extract_summary
+from newsfeed.shared import news_item
+from newsfeed.shared.news_item import NewsItem
+from tests.benchmarks.feeds import build_feed
+
+
+def item_size(item: dict) -> int:
+    size = 0
+    for name, value in item.items():
+        size += len(name.encode())
+        if isinstance(value, bytes):
+            size += len(value)
+        elif isinstance(value, int):
+            size += len(str(value)) // 2 + 1
+        elif value is not None:
+            size += len(str(value).encode())
+    return size
+
+
+def sample_events():
+    events = []
+    for style in ("ars", "hn"):
+        for entry in feedparser.parse(build_feed(500, style)).entries:
+            link, text = extract_summary(entry.summary)
+            events.append({"id": entry.link, "title": entry.title, "body": text, "url": link or entry.link,
+                           "published_at": entry.published, "source": f"rss_{style}"})
+    rng = random.Random(0)
+    for i in range(500):
+        events.append({"id": f"r{i}", "title": f"Post {i} about an outage", "source": "reddit_sysadmin",
+                       "body": " ".join(rng.choice(["server", "patch", "cve", "we", "the", "down"])
+                                        for _ in range(rng.randint(0, 120))),
+                       "url": f"https://reddit.com/r/sysadmin/{i}", "published_at": "2025-08-24T12:00:00+00:00",
+                       "score": rng.randint(0, 5000)})
+    return events
+
+
+def main():
+    events = sample_events()
+    items = [NewsItem.from_raw_event(e) for e in events]
+    for mode in ("none", "zlib"):
+        news_item.RAW_PAYLOAD_COMPRESSION = mode
+        sizes = [item_size(i.to_dynamodb_item()) for i in items]
+        wcu = sum(math.ceil(s / 1024) for s in sizes)
+        print(f"raw_payload={mode:<5} avg item {sum(sizes) / len(sizes):6.0f} B   "
+              f"max {max(sizes):5d} B   WCU per {len(items)} writes {wcu}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Micro-benchmark: per-item cost and memory of NewsItem for 10k-item batches.
+
+Compares the previous construction path (unslotted dataclass, two clock reads
+and a json.dumps per item, boto3 TypeSerializer for the wire format) with the
+slotted NewsItem (one clock read per batch, raw JSON passthrough,
+to_dynamodb_wire), then times ingest_lambda and ingest_api_lambda end to end
+against an in-memory DynamoDB stand-in.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.bench_news_item
+"""
+import hashlib
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from boto3.dynamodb.types import TypeSerializer
+
+from newsfeed.lambdas.ingest import ingest_lambda
+from newsfeed.lambdas.ingest_api import ingest_api_lambda
+from newsfeed.shared.news_item import NewsItem
+
+BATCH = 10_000
+
+
+@dataclass
+class LegacyNewsItem:
+    id: str
+    source: str
+    title: str
+    published_at: str
+    url: Optional[str] = ""
+    body: Optional[str] = ""
+    ingested_at: Optional[str] = None
+    fingerprint: Optional[str] = None
+    raw_payload: Optional[str] = None
+    ttl_epoch: Optional[int] = None
+
+    @classmethod
+    def from_raw_event(cls, raw_event: dict) -> 'LegacyNewsItem':
+        now = datetime.now(timezone.utc).isoformat()
+        content = f"{raw_event['title']}{raw_event.get('published_at', '')}{raw_event['source']}"
+        fingerprint = hashlib.md5(content.encode()).hexdigest()
+        ttl_epoch = int(datetime.now(timezone.utc).timestamp()) + (10 * 24 * 60 * 60)
+        return cls(id=fingerprint, source=raw_event['source'], title=raw_event['title'],
+                   url=raw_event.get('url', ''), body=raw_event.get('body', ''),
+                   published_at=raw_event.get('published_at', now), ingested_at=now,
+                   fingerprint=fingerprint, raw_payload=json.dumps(raw_event), ttl_epoch=ttl_epoch)
+
+    def to_dynamodb_item(self) -> dict:
+        return {k: getattr(self, k) for k in self.__dataclass_fields__}
+
+
+class InMemoryDB:
+    """Accepts every write; stands in for DynamoDBClient"""
+
+    def put_if_absent(self, item):
+        return True
+
+    def batch_get_existing_ids(self, ids):
+        return set()
+
+    def batch_write_items(self, items):
+        return []
+
+    def batch_write_wire_items(self, items):
+        return []
+
+
+def _events():
+    return [{"id": str(i), "title": f"Story number {i} about Python releases", "source": "rss",
+             "published_at": "2025-08-24T12:00:00Z", "url": f"https://example.com/{i}",
+             "body": "Lorem ipsum dolor sit amet " * 12} for i in range(BATCH)]
+
+
+def _per_item_us(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / BATCH * 1e6
+
+
+def _retained_bytes(fn) -> float:
+    tracemalloc.start()
+    kept = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / BATCH
+
+
+def main():
+    events = _events()
+    bodies = [json.dumps(e) for e in events]
+    serializer = TypeSerializer()
+
+    def legacy_build():
+        return [LegacyNewsItem.from_raw_event(e) for e in events]
+
+    def slotted_build():
+        now = datetime.now(timezone.utc)
+        return [NewsItem.from_raw_event(e, now=now, raw_json=b) for e, b in zip(events, bodies)]
+
+    legacy_items, slotted_items = legacy_build(), slotted_build()
+
+    print(f"{BATCH} items")
+    print(f"  construct     legacy {_per_item_us(legacy_build):6.2f} us/item   slotted {_per_item_us(slotted_build):6.2f} us/item")
+    print(f"  retained      legacy {_retained_bytes(legacy_build):6.0f} B/item    slotted {_retained_bytes(slotted_build):6.0f} B/item")
+    legacy_wire = _per_item_us(lambda: [{k: serializer.serialize(v) for k, v in i.to_dynamodb_item().items()}
+                                        for i in legacy_items])
+    slotted_wire = _per_item_us(lambda: [i.to_dynamodb_wire() for i in slotted_items])
+    print(f"  wire encode   legacy {legacy_wire:6.2f} us/item   slotted {slotted_wire:6.2f} us/item")
+
+    records = {"Records": [{"messageId": str(i), "body": b} for i, b in enumerate(bodies)]}
+    ingest_lambda.logger.disabled = True
+    ingest_api_lambda.logger.disabled = True
+    ingest_us = _per_item_us(lambda: (ingest_lambda.recent_fingerprints.clear(),
+                                      ingest_lambda.lambda_handler(records, None, db_client=InMemoryDB())))
+    api_event = {"body": json.dumps(events)}
+    api_us = _per_item_us(lambda: ingest_api_lambda.lambda_handler(api_event, None, db_client=InMemoryDB()))
+    print(f"  ingest_lambda      {ingest_us:6.2f} us/item")
+    print(f"  ingest_api_lambda  {api_us:6.2f} us/item")
+
+
+if __name__ == "__main__":
+    main()
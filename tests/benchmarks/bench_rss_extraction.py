@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: per-entry cost of RSS summary extraction.
+
+Compares the previous approach (uncompiled re.findall for the link, raw HTML
+kept as the body) with extract_summary (single pass, markup stripped), and
+the downstream cost of lowercasing/splitting each body as the filter does.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.bench_rss_extraction
+"""
+import re
+import time
+import feedparser
+from newsfeed.lambdas.fetcher.fetchers.extract import extract_summary
+from tests.benchmarks.feeds import build_feed
+
+ROUNDS = 20
+
+
+def legacy_extract(summary: str):
+    matches = re.findall(r'href="([^"]+)"', summary)
+    return (matches[0] if matches else None), summary
+
+
+def _time_per_entry(fn, summaries) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for summary in summaries:
+            fn(summary)
+    return (time.perf_counter() - start) / (ROUNDS * len(summaries)) * 1e6
+
+
+def main():
+    for style in ("ars", "hn"):
+        document = build_feed(entries=1000, style=style)
+        start = time.perf_counter()
+        feed = feedparser.parse(document)
+        parse_us = (time.perf_counter() - start) / len(feed.entries) * 1e6
+        summaries = [entry.summary for entry in feed.entries]
+
+        legacy_bodies = [legacy_extract(s)[1] for s in summaries]
+        new_bodies = [extract_summary(s)[1] for s in summaries]
+
+        legacy_us = _time_per_entry(legacy_extract, summaries)
+        new_us = _time_per_entry(extract_summary, summaries)
+        legacy_tok = _time_per_entry(lambda b: b.lower().split(), legacy_bodies)
+        new_tok = _time_per_entry(lambda b: b.lower().split(), new_bodies)
+
+        legacy_bytes = sum(len(b.encode()) for b in legacy_bodies) / len(summaries)
+        new_bytes = sum(len(b.encode()) for b in new_bodies) / len(summaries)
+
+        print(f"[{style}] {len(summaries)} entries, feedparser {parse_us:.0f} us/entry")
+        print(f"  extract   legacy {legacy_us:7.2f} us/entry   single-pass {new_us:7.2f} us/entry")
+        print(f"  tokenize  legacy {legacy_tok:7.2f} us/entry   single-pass {new_tok:7.2f} us/entry")
+        print(f"  body size legacy {legacy_bytes:7.0f} B/entry    single-pass {new_bytes:7.0f} B/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Micro-benchmark: baseline_scoring per-item loop vs score_batch.
+
+Scores the same synthetic RawEvents batch through calculate_keyword_relevance_score
+one item at a time and through score_batch in one call, and checks both agree.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.bench_score_batch
+"""
+import time
+
+from newsfeed.lambdas.filter.filter_algorithms.baseline_scoring import calculate_keyword_relevance_score, score_batch
+
+BATCH = 50_000
+
+TITLES = [
+    "Critical vulnerability discovered in popular enterprise VPN",
+    "Major cloud provider outage affects several regions",
+    "Local bakery wins regional award",
+    "New machine learning toolkit for Python released",
+]
+BODIES = [
+    "A zero-day exploit affecting multiple VPN appliances has been reported. IT teams should patch immediately.",
+    "AWS reported downtime in EU and US-East regions. Services impacted include EC2 and S3.",
+    "The family-run shop has been baking sourdough for three generations.",
+]
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    items = [
+        {"title": TITLES[i % len(TITLES)], "body": BODIES[i % len(BODIES)],
+         "published_at": f"2025-08-{1 + i % 28:02d}T12:00:00Z"}
+        for i in range(BATCH)
+    ]
+
+    per_item = _time(lambda: [calculate_keyword_relevance_score(item) for item in items])
+    batch = _time(lambda: score_batch(items))
+    assert score_batch(items).tolist() == [calculate_keyword_relevance_score(item) for item in items]
+
+    print(f"{BATCH} items")
+    print(f"  per item:    {per_item:.2f}s ({per_item / BATCH * 1e6:.1f} us/item)")
+    print(f"  score_batch: {batch:.2f}s ({batch / BATCH * 1e6:.1f} us/item)")
+
+
+if __name__ == "__main__":
+    main()
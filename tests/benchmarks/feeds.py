@@ -0,0 +1,64 @@
+"""
+Synthetic feeds shaped like the real sources (hnrss.org front page and Ars
+Technica), for benchmarks that must run offline.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+WORDS = (
+    "cloud outage security patch kernel release server network database vulnerability "
+    "python docker kubernetes update engineers report users company data breach "
+    "researchers attack software api performance latency regions service customers"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def hn_summary(rng: random.Random, i: int) -> str:
+    """Summary markup as served by hnrss.org"""
+    return (
+        f'<p>Article URL: <a href="https://example.com/articles/{i}">https://example.com/articles/{i}</a></p>'
+        f'<p>Comments URL: <a href="https://news.ycombinator.com/item?id={40000000 + i}">'
+        f'https://news.ycombinator.com/item?id={40000000 + i}</a></p>'
+        f'<p>Points: {rng.randint(1, 900)}</p><p># Comments: {rng.randint(0, 400)}</p>'
+    )
+
+
+def ars_summary(rng: random.Random, i: int) -> str:
+    """Long-form summary with images, inline links and entities, like Ars Technica"""
+    paragraphs = []
+    for p in range(rng.randint(4, 10)):
+        paragraphs.append(
+            f'<p>{_sentence(rng, 25)} <a href="https://arstechnica.com/?p={i}{p}" '
+            f'title="link">{_sentence(rng, 4)}</a> &mdash; {_sentence(rng, 30)} &amp; {_sentence(rng, 10)}</p>'
+        )
+    return (
+        f'<figure><img src="https://cdn.arstechnica.net/{i}.jpg" alt="" /></figure>'
+        + "".join(paragraphs)
+        + '<script>trackView();</script>'
+    )
+
+
+def build_feed(entries: int = 200, style: str = "ars", seed: int = 0,
+               start: datetime = None) -> bytes:
+    """RSS 2.0 document with `entries` items, newest first"""
+    rng = random.Random(seed)
+    start = start or datetime(2025, 8, 24, 12, tzinfo=timezone.utc)
+    summary = ars_summary if style == "ars" else hn_summary
+    items = []
+    for i in range(entries):
+        published = format_datetime(start - timedelta(minutes=7 * i))
+        items.append(
+            f"<item><title>{escape(_sentence(rng, 8))}</title>"
+            f"<link>https://example.com/{style}/{seed}/{i}</link>"
+            f"<guid>{style}-{seed}-{i}</guid><pubDate>{published}</pubDate>"
+            f"<description>{escape(summary(rng, i))}</description></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>{style} feed</title>" + "".join(items) + "</channel></rss>"
+    ).encode()
@@ -0,0 +1,223 @@
+"""
+Offline benchmark harness for the fetch path.
+
+Serves synthetic feeds from a local HTTP server (configurable size, latency and
+error rate), swaps in a stub Reddit client and a local SQS stand-in, and runs
+fetcher_lambda.lambda_handler end to end.
+
+Run: PYTHONPATH=src python -m tests.benchmarks.harness --feeds 5 --subreddits 3 --latency 0.2
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Dict, List
+from unittest.mock import patch
+
+from newsfeed.lambdas.fetcher import clients, fetcher_lambda
+from newsfeed.lambdas.fetcher.fetchers.reddit import RedditFetcher
+from newsfeed.lambdas.fetcher.fetchers.rss import RSSFetcher
+from tests.benchmarks.feeds import build_feed
+
+
+@dataclass
+class FeedSpec:
+    name: str
+    entries: int = 200
+    latency: float = 0.0
+    error_rate: float = 0.0
+    style: str = "ars"
+
+
+@dataclass
+class SubredditSpec:
+    name: str
+    posts: int = 100
+    latency: float = 0.0  # per page of 100 submissions
+    listing: str = "new"
+
+
+@dataclass
+class BenchmarkReport:
+    iterations: int
+    events: int
+    wall_times: List[float]
+    source_latencies: Dict[str, List[float]] = field(default_factory=dict)
+    sqs_requests: int = 0
+    source_errors: int = 0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / sum(self.wall_times) if self.wall_times else 0.0
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+    def summary(self) -> str:
+        lines = [
+            f"iterations: {self.iterations}  events: {self.events}  sqs requests: {self.sqs_requests}  "
+            f"source errors: {self.source_errors}",
+            f"throughput: {self.events_per_second:.0f} events/s",
+            f"wall time: p50 {self.percentile(self.wall_times, 50):.3f}s  "
+            f"p99 {self.percentile(self.wall_times, 99):.3f}s",
+        ]
+        for name, latencies in sorted(self.source_latencies.items()):
+            lines.append(f"  {name:<24} p50 {self.percentile(latencies, 50):.3f}s  "
+                         f"p99 {self.percentile(latencies, 99):.3f}s")
+        return "\n".join(lines)
+
+
+class _FeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, feeds: List[FeedSpec]):
+        super().__init__(("127.0.0.1", 0), _FeedHandler)
+        self.specs = {f"/{spec.name}": spec for spec in feeds}
+        self.documents = {
+            f"/{spec.name}": build_feed(spec.entries, spec.style, seed=i)
+            for i, spec in enumerate(feeds)
+        }
+        self.rng = random.Random(0)
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        spec = self.server.specs.get(self.path)
+        if spec is None:
+            self.send_error(404)
+            return
+        time.sleep(spec.latency)
+        if self.server.rng.random() < spec.error_rate:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        document = self.server.documents[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(document)))
+        self.end_headers()
+        self.wfile.write(document)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubSubreddit:
+    def __init__(self, spec: SubredditSpec):
+        self.spec = spec
+        self.display_name = spec.name
+
+    def _listing(self, limit):
+        now = datetime.now(timezone.utc).timestamp()
+        for i in range(min(limit, self.spec.posts)):
+            if i % 100 == 0:
+                time.sleep(self.spec.latency)
+            yield SimpleNamespace(
+                id=f"{self.spec.name}{i}", title=f"Post {i} in r/{self.spec.name}", selftext="Body " * 20,
+                url=f"https://reddit.com/r/{self.spec.name}/{i}", score=i, subreddit=self,
+                created_utc=now - i * 60
+            )
+
+    hot = new = rising = _listing
+
+
+class StubReddit:
+    """Enough of praw.Reddit for RedditFetcher"""
+
+    def __init__(self, subreddits: List[SubredditSpec]):
+        self.subreddits = {spec.name: StubSubreddit(spec) for spec in subreddits}
+        self.auth = SimpleNamespace(limits={"remaining": 600.0, "reset_timestamp": None, "used": 0})
+
+    def subreddit(self, name):
+        return self.subreddits[name]
+
+
+class LocalSQS:
+    """SQS stand-in that accepts every batch"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = []
+        self.requests = 0
+
+    def send_message_batch(self, QueueUrl, Entries):
+        with self.lock:
+            self.requests += 1
+            self.messages.extend(entry["MessageBody"] for entry in Entries)
+        return {"Successful": [{"Id": entry["Id"]} for entry in Entries], "Failed": []}
+
+
+def run_benchmark(feeds: List[FeedSpec], subreddits: List[SubredditSpec], iterations: int = 5) -> BenchmarkReport:
+    """Run the fetcher lambda `iterations` times against local stand-ins with fresh fetcher state"""
+    server = _FeedServer(feeds)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    sources = [
+        {"name": f"rss_{spec.name}", "class": RSSFetcher,
+         "config": {"feed_url": f"{base_url}/{spec.name}", "source_name": spec.name}}
+        for spec in feeds
+    ] + [
+        {"name": f"reddit_{spec.name}", "class": RedditFetcher,
+         "config": {"subreddit": spec.name, "limit": spec.posts, "listing": spec.listing}}
+        for spec in subreddits
+    ]
+
+    sqs = LocalSQS()
+    report = BenchmarkReport(iterations=iterations, events=0, wall_times=[])
+    try:
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(fetcher_lambda, "sqs", sqs), \
+                patch.object(fetcher_lambda, "SOURCES", sources), \
+                patch.object(clients, "_reddit_client", StubReddit(subreddits)), \
+                patch.dict(os.environ, {"SQS_QUEUE_URL": "local-queue"}):
+            for i in range(iterations):
+                # Fresh state each run so watermarks and validators don't hide the fetch cost
+                os.environ["FETCHER_STATE_PATH"] = os.path.join(tmp, f"state-{i}.json")
+                start = time.perf_counter()
+                result = fetcher_lambda.lambda_handler({"force": True}, None)
+                report.wall_times.append(time.perf_counter() - start)
+                report.events += result["fetched"]
+                for name, stats in result["sources"].items():
+                    report.source_latencies.setdefault(name, []).append(stats["duration"])
+                    report.source_errors += 0 if stats["ok"] else 1
+            os.environ.pop("FETCHER_STATE_PATH", None)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    report.sqs_requests = sqs.requests
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--feeds", type=int, default=5)
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--subreddits", type=int, default=3)
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per feed request / Reddit page")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    feeds = [FeedSpec(f"feed{i}", args.entries, args.latency, args.error_rate, "ars" if i % 2 else "hn")
+             for i in range(args.feeds)]
+    subreddits = [SubredditSpec(f"sub{i}", args.posts, args.latency) for i in range(args.subreddits)]
+    print(run_benchmark(feeds, subreddits, args.iterations).summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
-import hashlib
 import boto3
 import json
 import unittest
 from datetime import datetime, timezone
+from newsfeed.shared.fingerprint import fingerprint
 
 # Configuration
 LAMBDA_NAME = "newsfeed-ingest"
@@ -17,8 +17,7 @@ tableFiltered = dynamodb.Table(FILTERED_DYNAMO_TABLE)
 def generate_fingerprint(body_str):
     """Generate fingerprint from JSON string body"""
     body = json.loads(body_str) if isinstance(body_str, str) else body_str
-    content = f"{body['title']}{body.get('published_at', '')}{body['source']}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return fingerprint(body)
 
 class TestDeployedLambda(unittest.TestCase):
     @classmethod
@@ -1,8 +1,8 @@
-import hashlib
 import unittest
 import boto3
 import json
 from datetime import datetime, timezone
+from newsfeed.shared.fingerprint import fingerprint
 
 # Configuration — replace with your real deployed Lambda name and table
 LAMBDA_NAME = "newsfeed-ingest_api"
@@ -15,8 +15,7 @@ table = dynamodb.Table(DYNAMO_TABLE_NAME)
 def generate_fingerprint(body_str):
     """Generate fingerprint from JSON string body"""
     body = json.loads(body_str) if isinstance(body_str, str) else body_str
-    content = f"{body['title']}{body.get('published_at', '')}{body['source']}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return fingerprint(body)
 
 
 class TestDeployedApiLambda(unittest.TestCase):
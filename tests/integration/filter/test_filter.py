@@ -33,6 +33,7 @@ def test_filter_lambda_adds_item(mock_dynamo_client):
         "score": 100
     }
     event = {"Records": [{
+        "eventName": "INSERT",
         "dynamodb": {"NewImage": {k: {"S": str(v)} for k, v in raw_item.items()}}
     }]}
 
@@ -51,6 +52,7 @@ def test_filter_lambda_skips_non_tech_article(mock_dynamo_client):
         "score": 10
     }
     event = {"Records": [{
+        "eventName": "INSERT",
         "dynamodb": {"NewImage": {k: {"S": str(v)} for k, v in raw_item.items()}}
     }]}
 
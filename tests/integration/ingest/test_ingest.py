@@ -21,6 +21,8 @@ def dynamodb_table():
             BillingMode="PAY_PER_REQUEST",
         )
         table.wait_until_exists()
+        # A fresh table invalidates anything the warm-container cache remembers
+        ingest_lambda.recent_fingerprints.clear()
         yield table
 
 @pytest.fixture
@@ -87,3 +89,87 @@ def test_ingest_lambda_skips_duplicate(db_client):
     result = ingest_lambda.lambda_handler(event, None, db_client=db_client)
     assert result["processed"] == 0
     assert result["skipped"] == 1
+
+def test_ingest_lambda_dedups_within_one_batch(db_client):
+    body = json.dumps({
+        "id": "123",
+        "title": "Python 3.12 Released",
+        "source": "reddit",
+        "published_at": "2025-08-24T12:00:00Z"
+    })
+    event = {"Records": [{"body": body}, {"body": body}]}
+
+    result = ingest_lambda.lambda_handler(event, None, db_client=db_client)
+
+    assert result["processed"] == 1
+    assert result["skipped"] == 1
+    assert len(db_client.table.scan()["Items"]) == 1
+
+def test_ingest_lambda_bulk_path_dedups_against_table_and_batch(db_client):
+    events = [
+        {"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+        for i in range(30)
+    ]
+    already_stored = NewsItem.from_raw_event(events[0])
+    db_client.put_item(already_stored.to_dynamodb_item())
+    records = [{"body": json.dumps(e)} for e in events] + [{"body": json.dumps(events[1])}]
+
+    result = ingest_lambda.lambda_handler({"Records": records}, None, db_client=db_client)
+
+    assert result["processed"] == 29
+    assert result["skipped"] == 2
+    assert len(db_client.table.scan()["Items"]) == 30
+
+def test_ingest_lambda_clusters_near_duplicate_stories(db_client, monkeypatch):
+    from newsfeed.shared import cluster_index
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+    clusters_table = dynamodb.create_table(
+        TableName="StoryClusters",
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    clusters_client = DynamoDBClient(clusters_table.name)
+    clusters_client.table = clusters_table
+    monkeypatch.setenv("CLUSTER_TABLE_NAME", "StoryClusters")
+    monkeypatch.setattr(cluster_index, "_index", cluster_index.ClusterIndex(clusters_client))
+
+    first = {"title": "Microsoft patches Exchange zero-day exploited in the wild", "source": "rss_ars",
+             "published_at": "2025-08-24T12:00:00Z"}
+    repeat = {"title": "Microsoft Patches Exchange Zero-Day Exploited in the Wild", "source": "hackernews",
+              "published_at": "2025-08-24T12:05:00Z"}
+    other = {"title": "AWS outage takes down services in eu-west-1", "source": "reddit",
+             "published_at": "2025-08-24T12:00:00Z"}
+
+    ingest_lambda.lambda_handler({"Records": [{"body": json.dumps(first)}]}, None, db_client=db_client)
+    ingest_lambda.lambda_handler({"Records": [{"body": json.dumps(repeat)}, {"body": json.dumps(other)}]},
+                                 None, db_client=db_client)
+
+    items = {item["source"]: item for item in db_client.table.scan()["Items"]}
+    assert items["rss_ars"]["cluster_id"] == items["rss_ars"]["id"]
+    assert items["hackernews"]["cluster_id"] == items["rss_ars"]["id"]
+    assert items["reddit"]["cluster_id"] == items["reddit"]["id"]
+
+def test_ingest_lambda_skips_items_stored_under_legacy_ids(db_client):
+    from newsfeed.shared.fingerprint import legacy_fingerprint
+    events = [{"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"} for i in range(6)]
+    # Stored before the v2 switch, under the bare MD5 id
+    db_client.put_item({"id": legacy_fingerprint(events[0]), "title": "Story 0", "source": "rss"})
+    db_client.put_item({"id": legacy_fingerprint(events[1]), "title": "Story 1", "source": "rss"})
+
+    small = ingest_lambda.lambda_handler({"Records": [{"body": json.dumps(events[0])}]}, None, db_client=db_client)
+    bulk = ingest_lambda.lambda_handler({"Records": [{"body": json.dumps(e)} for e in events[1:]]}, None,
+                                        db_client=db_client)
+
+    assert (small["processed"], small["skipped"]) == (0, 1)
+    assert (bulk["processed"], bulk["skipped"]) == (4, 1)
+
+def test_ingest_lambda_bulk_skips_events_with_non_string_fields(db_client):
+    events = [{"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"} for i in range(6)]
+    events.append({"title": "Epoch timestamp", "source": "rss", "published_at": 1724500000})
+    records = [{"messageId": f"m{i}", "body": json.dumps(e)} for i, e in enumerate(events)]
+
+    result = ingest_lambda.lambda_handler({"Records": records}, None, db_client=db_client)
+
+    assert result == {"processed": 6, "skipped": 1, "batchItemFailures": []}
+    assert len(db_client.table.scan()["Items"]) == 6
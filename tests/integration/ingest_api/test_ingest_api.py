@@ -100,3 +100,41 @@ def test_lambda_handler_skips_invalid_and_duplicates(db_client):
 
     assert body['processed'] == 1  # only id=3 processed
     assert len(body['errors']) == 1  # id=4 skipped
+
+def test_async_job_reports_progress_after_ingest(db_client, monkeypatch):
+    from unittest.mock import MagicMock
+    from newsfeed.lambdas.ingest import ingest_lambda
+    dynamodb = boto3.resource("dynamodb", region_name="eu-west-1")
+    dynamodb.create_table(
+        TableName="IngestJobs",
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST"
+    )
+    monkeypatch.setenv("INGEST_JOBS_TABLE", "IngestJobs")
+    monkeypatch.setenv("SQS_QUEUE_URL", "queue-url")
+    queued = []
+
+    def send_message_batch(QueueUrl, Entries):
+        queued.extend(e["MessageBody"] for e in Entries)
+        return {"Successful": [{"Id": e["Id"]} for e in Entries], "Failed": []}
+    mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.side_effect = send_message_batch
+    monkeypatch.setattr(ingest_api_lambda, "sqs", mock_sqs)
+    ingest_lambda.recent_fingerprints.clear()
+
+    events = [{"source": "rss", "title": f"Story {i}", "published_at": "2025-08-24T12:00:00Z"} for i in range(30)]
+    events.append(events[0])
+    accepted = ingest_api_lambda.lambda_handler(
+        {"body": json.dumps(events), "queryStringParameters": {"mode": "async"}}, None)
+    job_id = json.loads(accepted["body"])["job_id"]
+
+    ingest_lambda.lambda_handler(
+        {"Records": [{"messageId": str(i), "body": body} for i, body in enumerate(queued)]}, None, db_client=db_client)
+    status = ingest_api_lambda.lambda_handler({"httpMethod": "GET", "pathParameters": {"job_id": job_id}}, None)
+
+    assert accepted["statusCode"] == 202
+    assert json.loads(status["body"]) == {
+        "job_id": job_id, "status": "completed", "accepted": 31, "rejected": 0,
+        "processed": 30, "duplicates": 1, "invalid": 0, "failed": 0
+    }
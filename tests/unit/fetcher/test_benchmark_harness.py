@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    # fetcher_lambda creates its SQS client on import, which needs a region
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    from tests.benchmarks import harness
+    return harness
+
+
+def test_fetch_path_runs_sources_in_parallel_and_batches_sqs(harness):
+    feeds = [harness.FeedSpec(f"feed{i}", entries=20, latency=0.3, style="hn") for i in range(4)]
+    subreddits = [harness.SubredditSpec(f"sub{i}", posts=50, latency=0.3) for i in range(2)]
+
+    report = harness.run_benchmark(feeds, subreddits, iterations=1)
+
+    assert report.events == 4 * 20 + 2 * 50
+    assert report.source_errors == 0
+    # Back to back, the run would take at least as long as all sources together
+    assert report.wall_times[0] < sum(durations[0] for durations in report.source_latencies.values())
+    # 10 events per message, 10 messages per SendMessageBatch
+    assert report.sqs_requests == 2
+
+
+def test_failing_feed_does_not_block_the_others(harness):
+    feeds = [harness.FeedSpec("ok", entries=10), harness.FeedSpec("broken", entries=10, error_rate=1.0)]
+
+    report = harness.run_benchmark(feeds, [], iterations=1)
+
+    assert report.events == 10
+    assert report.source_errors == 1
@@ -0,0 +1,52 @@
+import random
+from newsfeed.lambdas.fetcher.dedup_filter import RecentFingerprintFilter, SECONDS_PER_DAY
+from newsfeed.lambdas.fetcher.state_store import FileStateStore
+
+
+def _event(i):
+    return {"source": "rss", "title": f"Story {i}", "published_at": "2025-08-24T12:00:00Z"}
+
+
+def test_published_events_are_dropped_next_run(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    first = RecentFingerprintFilter.load(store)
+    events = [_event(i) for i in range(10)]
+    assert first.filter_events(events) == events
+    first.add_events(events)
+    first.save(store)
+
+    second = RecentFingerprintFilter.load(store)
+    kept = second.filter_events(events + [_event(99)])
+
+    assert kept == [_event(99)]
+    assert second.dropped == 10
+
+
+def test_repeats_within_a_batch_are_dropped():
+    bloom = RecentFingerprintFilter()
+
+    assert bloom.filter_events([_event(1), _event(1)]) == [_event(1)]
+
+
+def test_fingerprints_age_out_after_ttl():
+    bloom = RecentFingerprintFilter(capacity=100, ttl_days=10)
+    bloom.add("abc", now=0)
+    assert bloom.contains("abc")
+
+    bloom.expire(now=10 * SECONDS_PER_DAY)
+
+    assert not bloom.contains("abc")
+
+
+def test_false_positive_rate_is_bounded():
+    bloom = RecentFingerprintFilter(capacity=1000, error_rate=0.01, ttl_days=10)
+    for day in range(10):
+        for i in range(1000):
+            bloom.add(f"seen-{day}-{i}", now=day * SECONDS_PER_DAY)
+
+    rng = random.Random(42)
+    trials = 20000
+    false_positives = sum(bloom.contains(f"unseen-{rng.random()}") for _ in range(trials))
+
+    assert false_positives / trials < 0.02
+    assert bloom.estimated_false_positive_rate() < 0.02
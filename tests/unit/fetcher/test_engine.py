@@ -0,0 +1,79 @@
+import time
+from newsfeed.lambdas.fetcher.engine import fetch_sources
+
+
+class FakeFetcher:
+    def __init__(self, delay: float = 0.0, fail: bool = False, title: str = "item"):
+        self.delay = delay
+        self.fail = fail
+        self.title = title
+
+    def fetch(self):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return [{"source": "fake", "title": self.title}]
+
+
+class FakeContext:
+    def __init__(self, remaining_ms: int):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+
+def _source(name, **config):
+    return {"name": name, "class": FakeFetcher, "config": config}
+
+
+def test_sources_are_fetched_in_parallel():
+    sources = [_source(f"s{i}", delay=0.2) for i in range(5)]
+
+    start = time.monotonic()
+    results = fetch_sources(sources, max_workers=5)
+    elapsed = time.monotonic() - start
+
+    assert [r.name for r in results] == ["s0", "s1", "s2", "s3", "s4"]
+    assert all(r.ok and len(r.events) == 1 for r in results)
+    assert elapsed < 0.6
+
+
+def test_slow_source_times_out_without_losing_others():
+    sources = [_source("fast", delay=0.0), _source("slow", delay=2.0)]
+
+    results = fetch_sources(sources, source_timeout=0.2)
+    by_name = {r.name: r for r in results}
+
+    assert by_name["fast"].ok
+    assert by_name["fast"].events == [{"source": "fake", "title": "item"}]
+    assert by_name["slow"].timed_out
+    assert by_name["slow"].events == []
+
+
+def test_overall_deadline_follows_lambda_remaining_time(monkeypatch):
+    monkeypatch.setattr("newsfeed.lambdas.fetcher.engine.PUBLISH_RESERVE_SECONDS", 0.0)
+    sources = [_source("fast"), _source("slow", delay=2.0)]
+
+    start = time.monotonic()
+    results = fetch_sources(sources, context=FakeContext(300), source_timeout=10)
+
+    assert time.monotonic() - start < 1.0
+    assert results[0].ok
+    assert results[1].timed_out
+
+
+def test_failing_source_is_reported():
+    results = fetch_sources([_source("bad", fail=True), _source("good")])
+
+    assert results[0].error == "boom"
+    assert results[1].ok
+
+
+def test_each_run_gets_a_fresh_fetcher():
+    sources = [_source("fresh", title="a")]
+
+    first = fetch_sources(sources)[0].fetcher
+    second = fetch_sources(sources)[0].fetcher
+
+    assert first is not second
@@ -0,0 +1,17 @@
+from newsfeed.lambdas.fetcher.fetchers.extract import extract_summary
+
+
+def test_extracts_first_link_and_plain_text():
+    html = ('<p>Article URL: <a href="https://example.com/a?x=1&amp;y=2">example</a></p>'
+            '<p>Points: 10 &amp; rising</p><script>track()</script>')
+
+    link, text = extract_summary(html)
+
+    assert link == "https://example.com/a?x=1&y=2"
+    assert text == "Article URL: example Points: 10 & rising"
+
+
+def test_single_quoted_and_missing_links():
+    assert extract_summary("<a class='x' href='https://e.com'>e</a>")[0] == "https://e.com"
+    assert extract_summary("plain   text\n body") == (None, "plain text body")
+    assert extract_summary("") == (None, "")
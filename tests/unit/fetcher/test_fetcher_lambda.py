@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+import pytest
+from newsfeed.lambdas.fetcher import fetcher_lambda
+from newsfeed.lambdas.fetcher.engine import FetchResult
+from newsfeed.lambdas.fetcher.dedup_filter import FILTER_KEY
+from newsfeed.lambdas.fetcher.scheduler import SCHEDULE_KEY
+
+
+class FlakyStore:
+    """State store whose reads of `failing_keys` raise, like a throttled FetcherState table"""
+
+    def __init__(self, failing_keys):
+        self.failing_keys = failing_keys
+        self.saved = {}
+
+    def get(self, key):
+        if key in self.failing_keys:
+            raise RuntimeError("ProvisionedThroughputExceededException")
+        return None
+
+    def put(self, key, value):
+        self.saved[key] = value
+
+
+@pytest.fixture
+def run(monkeypatch):
+    def _run(store):
+        events = [{"source": "rss", "id": "1", "title": "Story", "published_at": "2025-08-24T12:00:00Z"}]
+        sqs = MagicMock()
+        sqs.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": entry["Id"]} for entry in Entries]
+        }
+        monkeypatch.setenv("SQS_QUEUE_URL", "https://sqs.example/queue")
+        monkeypatch.setattr(fetcher_lambda, "sqs", sqs)
+        monkeypatch.setattr(fetcher_lambda, "get_state_store", lambda: store)
+        monkeypatch.setattr(fetcher_lambda, "fetch_sources",
+                            lambda sources, context, state_store=None: [FetchResult("rss", events)])
+        return fetcher_lambda.lambda_handler({}, None)
+    return _run
+
+
+def test_schedule_read_failure_polls_everything(run):
+    store = FlakyStore({SCHEDULE_KEY})
+
+    result = run(store)
+
+    assert result["sent"] == 1
+    # The unreadable schedule isn't overwritten with this run's partial view
+    assert SCHEDULE_KEY not in store.saved
+
+
+def test_dedup_filter_read_failure_still_publishes_fetched_events(run):
+    store = FlakyStore({FILTER_KEY})
+
+    result = run(store)
+
+    assert result["sent"] == 1
+    assert FILTER_KEY not in store.saved
+    assert SCHEDULE_KEY in store.saved
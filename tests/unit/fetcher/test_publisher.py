@@ -0,0 +1,87 @@
+import json
+from unittest.mock import MagicMock
+from newsfeed.shared.sqs_publisher import SQSBatchPublisher, pack_events, unpack_message, MAX_BATCH_BYTES
+
+
+def _events(n):
+    return [{"source": "rss", "title": f"Story {i}", "published_at": "2025-08-24T12:00:00Z"} for i in range(n)]
+
+
+def _all_ok(QueueUrl, Entries):
+    return {"Successful": [{"Id": e["Id"]} for e in Entries], "Failed": []}
+
+
+def test_pack_and_unpack_round_trip():
+    events = _events(25)
+    messages = pack_events(events, events_per_message=10)
+
+    assert [len(evts) for _, evts in messages] == [10, 10, 5]
+    unpacked = [e for body, _ in messages for e in unpack_message(body)]
+    assert unpacked == events
+
+
+def test_unpack_plain_event():
+    assert unpack_message(json.dumps({"title": "x"})) == [{"title": "x"}]
+
+
+def test_packing_respects_message_size():
+    events = [{"title": "x" * 1000} for _ in range(10)]
+    messages = pack_events(events, events_per_message=10, max_message_bytes=3500)
+
+    assert all(len(body.encode()) <= 3500 for body, _ in messages)
+    assert sum(len(evts) for _, evts in messages) == 10
+
+
+def test_publish_uses_one_request_per_ten_messages():
+    sqs = MagicMock()
+    sqs.send_message_batch.side_effect = _all_ok
+    publisher = SQSBatchPublisher(sqs, "queue", events_per_message=10)
+
+    sent = publisher.publish(_events(250))
+
+    assert sent == 250
+    assert publisher.requests == 3
+    for call in sqs.send_message_batch.call_args_list:
+        entries = call.kwargs["Entries"]
+        assert len(entries) <= 10
+        assert sum(len(e["MessageBody"].encode()) for e in entries) <= MAX_BATCH_BYTES
+
+
+def test_only_failed_entries_are_retried():
+    sqs = MagicMock()
+    sqs.send_message_batch.side_effect = [
+        {"Successful": [{"Id": "0"}], "Failed": [{"Id": "1", "SenderFault": False, "Code": "InternalError"}]},
+        {"Successful": [{"Id": "1"}], "Failed": []},
+    ]
+    publisher = SQSBatchPublisher(sqs, "queue", backoff_seconds=0)
+
+    sent = publisher.publish(_events(2))
+
+    assert sent == 2
+    retry_entries = sqs.send_message_batch.call_args_list[1].kwargs["Entries"]
+    assert [e["Id"] for e in retry_entries] == ["1"]
+    assert publisher.failed_events == []
+
+
+def test_sender_fault_is_not_retried():
+    sqs = MagicMock()
+    sqs.send_message_batch.return_value = {
+        "Successful": [], "Failed": [{"Id": "0", "SenderFault": True, "Code": "InvalidMessageContents"}]
+    }
+    publisher = SQSBatchPublisher(sqs, "queue", backoff_seconds=0)
+
+    assert publisher.publish(_events(1)) == 0
+    assert sqs.send_message_batch.call_count == 1
+    assert len(publisher.failed_events) == 1
+
+
+def test_job_envelope_round_trip():
+    from newsfeed.shared.sqs_publisher import unpack_envelope
+    events = [{"title": f"t{i}"} for i in range(3)]
+
+    messages = pack_events(events, events_per_message=1, job_id="job-1")
+
+    assert len(messages) == 3
+    unpacked, job_id = unpack_envelope(messages[0][0])
+    assert job_id == "job-1"
+    assert [e for e, _ in unpacked] == [events[0]]
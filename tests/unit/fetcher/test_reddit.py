@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from datetime import datetime, timezone
+from newsfeed.lambdas.fetcher.fetchers.reddit import RedditFetcher
+from newsfeed.lambdas.fetcher.state_store import FileStateStore
+
+BASE_TS = datetime(2025, 8, 24, 12, tzinfo=timezone.utc).timestamp()
+
+
+def _submission(i):
+    return SimpleNamespace(
+        id=f"t{i}", title=f"Post {i}", selftext="", url=f"https://example.com/{i}", score=i,
+        subreddit=SimpleNamespace(display_name="technology"), created_utc=BASE_TS - i * 60
+    )
+
+
+class FakeSubreddit:
+    def __init__(self, count):
+        self.count = count
+        self.calls = []
+
+    def _listing(self, name, limit):
+        self.calls.append((name, limit))
+        for i in range(min(limit, self.count)):
+            yield _submission(i)
+
+    def new(self, limit):
+        return self._listing("new", limit)
+
+    def hot(self, limit):
+        return self._listing("hot", limit)
+
+
+class FakeReddit:
+    def __init__(self, count=250, limits=None):
+        self.sub = FakeSubreddit(count)
+        self.auth = SimpleNamespace(limits=limits or {})
+
+    def subreddit(self, name):
+        return self.sub
+
+
+def _fetcher(reddit, store=None, **config):
+    fetcher = RedditFetcher(**config)
+    fetcher.reddit = reddit
+    fetcher.state_store = store
+    fetcher.source_id = "reddit_technology"
+    return fetcher
+
+
+def test_configured_limit_is_honored():
+    reddit = FakeReddit()
+
+    events = _fetcher(reddit, limit=150, listing="new").fetch()
+
+    assert len(events) == 150
+    assert reddit.sub.calls == [("new", 150)]
+
+
+def test_new_listing_stops_at_watermark(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    first = _fetcher(FakeReddit(count=5), store, limit=100, listing="new")
+    first.fetch()
+    first.commit_state()
+
+    # Two newer submissions appear on top of the five already seen
+    reddit = FakeReddit(count=7)
+    reddit.sub._listing = lambda name, limit: (_submission(i) for i in range(-2, 5))
+    events = _fetcher(reddit, store, limit=100, listing="new").fetch()
+
+    assert [e["id"] for e in events] == ["t-2", "t-1"]
+
+
+def test_stops_when_rate_limit_is_nearly_exhausted():
+    reddit = FakeReddit(limits={"remaining": 1, "reset_timestamp": 4102444800})
+
+    events = _fetcher(reddit, limit=100, listing="hot").fetch()
+
+    assert len(events) == 1
+
+
+def test_hot_listing_emits_posts_that_rise_later(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    reddit = FakeReddit()
+    reddit.sub._listing = lambda name, limit: (_submission(i) for i in (0, 1))
+    first = _fetcher(reddit, store, limit=100, listing="hot")
+    first.fetch()
+    first.commit_state()
+
+    # An older post climbs above the two already emitted
+    reddit.sub._listing = lambda name, limit: (_submission(i) for i in (5, 0, 1))
+    events = _fetcher(reddit, store, limit=100, listing="hot").fetch()
+
+    assert [e["id"] for e in events] == ["t5"]
@@ -0,0 +1,151 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from newsfeed.lambdas.fetcher.fetchers.rss import RSSFetcher
+from newsfeed.lambdas.fetcher.state_store import FileStateStore
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Test feed</title>
+<item><title>Critical patch released</title><link>https://example.com/1</link>
+<guid>1</guid><pubDate>Sun, 24 Aug 2025 12:00:00 GMT</pubDate>
+<description>&lt;a href="https://example.com/a1"&gt;Details&lt;/a&gt;</description></item>
+</channel></rss>"""
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    feed = FEED
+    send_validators = True
+    protocol_version = "HTTP/1.1"
+    requests = []
+    client_ports = []
+
+    def do_GET(self):
+        FeedHandler.requests.append(dict(self.headers))
+        FeedHandler.client_ports.append(self.client_address[1])
+        if self.send_validators and self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(self.feed)))
+        if self.send_validators:
+            self.send_header("ETag", self.etag)
+            self.send_header("Last-Modified", "Sun, 24 Aug 2025 12:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(self.feed)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def feed_url():
+    FeedHandler.requests = []
+    FeedHandler.client_ports = []
+    FeedHandler.send_validators = True
+    FeedHandler.feed = FEED
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/feed"
+    server.shutdown()
+
+
+def _fetcher(feed_url, store, **config):
+    fetcher = RSSFetcher(feed_url, source_name="test", **config)
+    fetcher.state_store = store
+    fetcher.source_id = "test"
+    return fetcher
+
+
+def _feed(*items):
+    """RSS body with (guid, pubDate or None) items"""
+    entries = "".join(
+        f"<item><title>Story {guid}</title><link>https://example.com/{guid}</link><guid>{guid}</guid>"
+        + (f"<pubDate>{pub_date}</pubDate>" if pub_date else "") + "</item>"
+        for guid, pub_date in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>{entries}</channel></rss>'.encode()
+
+
+def test_not_modified_feed_emits_nothing(feed_url, tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+
+    first = _fetcher(feed_url, store)
+    assert len(first.fetch()) == 1
+    first.commit_state()
+
+    second = _fetcher(feed_url, store)
+    assert second.fetch() == []
+    assert FeedHandler.requests[-1]["If-None-Match"] == '"v1"'
+    assert FeedHandler.requests[-1]["If-Modified-Since"] == "Sun, 24 Aug 2025 12:00:00 GMT"
+
+
+def test_unchanged_body_without_validators_is_skipped(feed_url, tmp_path):
+    FeedHandler.send_validators = False
+    store = FileStateStore(str(tmp_path / "state.json"))
+
+    first = _fetcher(feed_url, store)
+    assert len(first.fetch()) == 1
+    first.commit_state()
+
+    assert _fetcher(feed_url, store).fetch() == []
+
+
+def test_validators_are_not_saved_until_committed(feed_url, tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+
+    _fetcher(feed_url, store).fetch()
+
+    assert len(_fetcher(feed_url, store).fetch()) == 1
+    assert "If-None-Match" not in FeedHandler.requests[-1]
+
+
+def test_state_survives_a_new_store_instance(tmp_path):
+    path = str(tmp_path / "state.json")
+    FileStateStore(path).put("k", {"etag": "x"})
+
+    assert FileStateStore(path).get("k") == {"etag": "x"}
+
+
+def test_fetches_reuse_the_shared_session(feed_url, tmp_path):
+    from newsfeed.lambdas.fetcher.clients import get_http_session
+
+    assert get_http_session() is get_http_session()
+    _fetcher(feed_url, None).fetch()
+    _fetcher(feed_url, None).fetch()
+
+    # Both requests went over the same keep-alive connection
+    assert FeedHandler.client_ports[0] == FeedHandler.client_ports[1]
+
+
+def test_undated_entry_does_not_advance_the_watermark(feed_url, tmp_path):
+    FeedHandler.send_validators = False
+    store = FileStateStore(str(tmp_path / "state.json"))
+    FeedHandler.feed = _feed(("1", "Sun, 24 Aug 2025 12:00:00 GMT"), ("2", None))
+
+    first = _fetcher(feed_url, store, date_ordered=True)
+    events = first.fetch()
+    first.commit_state()
+
+    # The undated entry gets the fetch time for ingest, in UTC
+    assert events[1]["published_at"].endswith("+00:00")
+    FeedHandler.feed = _feed(("3", "Sun, 24 Aug 2025 13:00:00 GMT"), ("1", "Sun, 24 Aug 2025 12:00:00 GMT"))
+    assert [e["id"] for e in _fetcher(feed_url, store, date_ordered=True).fetch()] == ["3"]
+
+
+def test_rank_ordered_feed_emits_late_rising_entries(feed_url, tmp_path):
+    FeedHandler.send_validators = False
+    store = FileStateStore(str(tmp_path / "state.json"))
+    FeedHandler.feed = _feed(("1", "Sun, 24 Aug 2025 12:00:00 GMT"))
+
+    first = _fetcher(feed_url, store)
+    first.fetch()
+    first.commit_state()
+
+    # An older submission climbs onto the front page above the one already emitted
+    FeedHandler.feed = _feed(("0", "Sun, 24 Aug 2025 09:00:00 GMT"), ("1", "Sun, 24 Aug 2025 12:00:00 GMT"))
+    assert [e["id"] for e in _fetcher(feed_url, store).fetch()] == ["0"]
@@ -0,0 +1,55 @@
+from newsfeed.lambdas.fetcher.engine import FetchResult
+from newsfeed.lambdas.fetcher.scheduler import SourceScheduler, CIRCUIT_THRESHOLD
+from newsfeed.lambdas.fetcher.state_store import FileStateStore
+
+TICK = 900
+SOURCES = [{"name": "busy"}, {"name": "quiet"}]
+
+
+def _names(sources):
+    return [s["name"] for s in sources]
+
+
+def test_all_sources_due_on_first_tick():
+    scheduler = SourceScheduler(tick_seconds=TICK)
+
+    assert _names(scheduler.due_sources(SOURCES, now=0)) == ["busy", "quiet"]
+
+
+def test_quiet_sources_are_backed_off_and_busy_ones_polled_every_tick():
+    scheduler = SourceScheduler(tick_seconds=TICK, max_interval=4 * TICK)
+    now = 0
+    polls = {"busy": 0, "quiet": 0}
+
+    for _ in range(20):
+        for source in scheduler.due_sources(SOURCES, now=now):
+            polls[source["name"]] += 1
+            new_items = 10 if source["name"] == "busy" else 0
+            scheduler.record_success(source["name"], new_items, now=now)
+        now += TICK
+
+    assert polls["busy"] == 20
+    assert polls["quiet"] < 10
+
+
+def test_circuit_breaker_backs_off_failing_source():
+    scheduler = SourceScheduler(tick_seconds=TICK, max_interval=100 * TICK)
+    for _ in range(CIRCUIT_THRESHOLD):
+        scheduler.record_failure("busy", now=0)
+
+    assert not scheduler.is_due("busy", now=TICK)
+    assert scheduler.is_due("busy", now=2 * TICK)
+
+    scheduler.record_success("busy", 1, now=2 * TICK)
+    assert scheduler.state["busy"]["failures"] == 0
+
+
+def test_schedule_is_persisted(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    scheduler = SourceScheduler(store, tick_seconds=TICK)
+    scheduler.record_results([FetchResult(name="busy", error="boom"), FetchResult(name="quiet")], now=0)
+    scheduler.save()
+
+    restored = SourceScheduler(FileStateStore(str(tmp_path / "state.json")), tick_seconds=TICK)
+    assert restored.state["busy"]["failures"] == 1
+    assert restored.state["quiet"]["next_due"] > 0
@@ -0,0 +1,90 @@
+from newsfeed.lambdas.fetcher.fetchers.base import BaseFetcher
+from newsfeed.lambdas.fetcher.state_store import FileStateStore
+from newsfeed.lambdas.fetcher.watermark import SeenIds, Watermark, parse_published_at
+
+
+class ListFetcher(BaseFetcher):
+    def __init__(self, events, date_ordered=True):
+        self.events = events
+        self.date_ordered = date_ordered
+
+    def fetch(self):
+        return self.filter_new(self.events)
+
+
+def _fetcher(events, store, date_ordered=True):
+    fetcher = ListFetcher(events, date_ordered)
+    fetcher.state_store = store
+    fetcher.source_id = "test_source"
+    return fetcher
+
+
+def test_parse_published_at_formats():
+    iso = parse_published_at("2025-08-24T12:00:00Z")
+    rfc = parse_published_at("Sun, 24 Aug 2025 12:00:00 GMT")
+    naive = parse_published_at("2025-08-24T12:00:00")
+
+    assert iso == rfc == naive
+    assert parse_published_at("not a date") is None
+
+
+def test_only_newer_entries_are_emitted(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    first_run = [
+        {"id": "a", "published_at": "Sun, 24 Aug 2025 10:00:00 GMT"},
+        {"id": "b", "published_at": "Sun, 24 Aug 2025 12:00:00 GMT"},
+    ]
+    fetcher = _fetcher(first_run, store)
+    assert len(fetcher.fetch()) == 2
+    fetcher.commit_state()
+
+    second_run = first_run + [
+        {"id": "c", "published_at": "Sun, 24 Aug 2025 12:00:00 GMT"},
+        {"id": "d", "published_at": "Sun, 24 Aug 2025 13:00:00 GMT"},
+    ]
+    assert [e["id"] for e in _fetcher(second_run, store).fetch()] == ["c", "d"]
+
+
+def test_watermark_is_not_advanced_without_commit(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    events = [{"id": "a", "published_at": "2025-08-24T12:00:00Z"}]
+
+    _fetcher(events, store).fetch()
+
+    assert len(_fetcher(events, store).fetch()) == 1
+
+
+def test_undated_entries_are_always_new():
+    watermark = Watermark(parse_published_at("2025-08-24T12:00:00Z"), {"a"})
+
+    assert watermark.is_new(None, "x")
+    assert Watermark.from_dict(watermark.to_dict()) == watermark
+
+
+def test_undated_events_do_not_move_the_watermark():
+    watermark = Watermark(parse_published_at("2025-08-24T12:00:00Z"), {"a"})
+
+    assert watermark.advance([{"id": "x", "published_at": None}]) == watermark
+
+
+def test_seen_ids_emit_older_entries_not_seen_before(tmp_path):
+    store = FileStateStore(str(tmp_path / "state.json"))
+    first = _fetcher([{"id": "b", "published_at": "2025-08-24T12:00:00Z"}], store, date_ordered=False)
+    first.fetch()
+    first.commit_state()
+
+    second_run = [
+        {"id": "a", "published_at": "2025-08-24T10:00:00Z"},
+        {"id": "b", "published_at": "2025-08-24T12:00:00Z"},
+    ]
+    assert [e["id"] for e in _fetcher(second_run, store, date_ordered=False).fetch()] == ["a"]
+    assert store.get("watermark#test_source") is None
+
+
+def test_seen_ids_keep_refetched_ids_and_drop_the_oldest():
+    seen = SeenIds(["a", "b", "c"], limit=3)
+
+    advanced = seen.advance([{"id": "a"}, {"id": "d"}])
+
+    assert advanced.ids == ["c", "a", "d"]
+    assert SeenIds.from_dict(advanced.to_dict()).ids == advanced.ids
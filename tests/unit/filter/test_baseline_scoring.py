@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+from newsfeed.lambdas.filter.filter_algorithms.baseline_scoring import (
+    PRIORITY_POINTS, TITLE_MULTIPLIER, calculate_keyword_relevance_score, count_keyword_hits, keyword_points,
+    recency_points, recency_points_batch, score_batch
+)
+
+
+def test_count_keyword_hits_matches_phrases_and_punctuated_words():
+    counts = count_keyword_hits("Data  Breach follows the outage, says a machine learning team.")
+    assert counts == {"high": 1, "medium": 1, "low": 1}
+
+
+def test_count_keyword_hits_requires_whole_words():
+    assert count_keyword_hits("apis, ransomwares and dataset breaches") == {"high": 0, "medium": 0, "low": 0}
+
+
+def test_keyword_points_counts_repeats():
+    assert keyword_points("AWS outage; AWS api") == 4 * PRIORITY_POINTS["medium"]
+
+
+def test_title_hits_weigh_more_than_body_hits():
+    in_title = calculate_keyword_relevance_score({"title": "data breach", "body": "", "published_at": ""})
+    in_body = calculate_keyword_relevance_score({"title": "", "body": "data breach", "published_at": ""})
+    assert in_title == min((PRIORITY_POINTS["high"] * TITLE_MULTIPLIER + 1) / 35, 1.0)
+    assert in_body == (PRIORITY_POINTS["high"] + 1) / 35
+
+
+def test_score_batch_matches_scalar_helpers():
+    items = [
+        {"title": "Ransomware hits AWS", "body": "A data breach and an outage, says security team.",
+         "published_at": "2025-08-24T12:00:00Z"},
+        {"title": "Gardening Tips", "body": "Water often.", "published_at": "not a date"},
+        {"title": "Python release", "published_at": "2025-08-24T12:00:00"},
+        {},
+    ]
+    expected = [
+        min((keyword_points(item.get("title", "")) * TITLE_MULTIPLIER + keyword_points(item.get("body", ""))
+             + recency_points(item.get("published_at", ""))) / 35, 1.0)
+        for item in items
+    ]
+    scores = score_batch(items)
+    assert scores.shape == (4,)
+    assert scores.tolist() == expected
+    assert [calculate_keyword_relevance_score(item) for item in items] == expected
+
+
+def test_score_batch_recency_against_one_clock():
+    now = datetime(2025, 8, 25, tzinfo=timezone.utc).timestamp()
+    points = recency_points_batch(["2025-08-25T00:00:00Z", "2025-08-10T00:00:00Z", "2025-01-01T00:00:00Z", ""],
+                                  now=now)
+    assert points.tolist() == [10, 5, 1, 1]
+
+
+def test_score_batch_empty():
+    assert score_batch([]).shape == (0,)
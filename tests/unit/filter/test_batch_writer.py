@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+from newsfeed.shared.batch_writer import BufferedBatchWriter
+
+
+def test_flushes_every_25_items():
+    client = MagicMock()
+    client.batch_write_items.return_value = []
+    writer = BufferedBatchWriter(client)
+
+    for i in range(60):
+        writer.add({"id": f"id{i}"}, i)
+    writer.flush()
+
+    assert [len(c.args[0]) for c in client.batch_write_items.call_args_list] == [25, 25, 10]
+    assert writer.written == 60
+    assert writer.failed == []
+
+
+def test_reports_sources_of_failed_items():
+    client = MagicMock()
+    client.batch_write_items.side_effect = lambda items, key_attributes: [item for item in items if item["id"] == "id1"]
+    writer = BufferedBatchWriter(client, flush_size=2)
+
+    for i in range(3):
+        writer.add({"id": f"id{i}"}, f"seq{i}")
+    writer.flush()
+
+    assert writer.failed == ["seq1"]
+    assert writer.written == 2
+
+
+def test_request_error_fails_whole_flush():
+    client = MagicMock()
+    client.batch_write_items.side_effect = Exception("ProvisionedThroughputExceededException")
+    writer = BufferedBatchWriter(client)
+
+    writer.add({"id": "a"}, "1")
+    writer.add({"id": "b"}, "2")
+    writer.flush()
+
+    assert writer.failed == ["1", "2"]
+    assert writer.written == 0
+
+
+def test_repeated_key_keeps_the_last_write():
+    client = MagicMock()
+    client.batch_write_items.return_value = []
+    writer = BufferedBatchWriter(client, key_attributes=("PK", "SK"))
+
+    writer.add({"PK": "news", "SK": "0.57#t", "id": "a"}, "1")
+    writer.add({"PK": "news", "SK": "0.60#t", "id": "b"}, "2")
+    writer.add({"PK": "news", "SK": "0.57#t", "id": "c"}, "3")
+    writer.flush()
+
+    client.batch_write_items.assert_called_once_with(
+        [{"PK": "news", "SK": "0.57#t", "id": "c"}, {"PK": "news", "SK": "0.60#t", "id": "b"}], ("PK", "SK"))
+    assert writer.written == 3
+
+
+def test_failed_key_fails_every_record_that_wrote_it():
+    client = MagicMock()
+    client.batch_write_items.side_effect = lambda items, key_attributes: [i for i in items if i["SK"] == "0.57#t"]
+    writer = BufferedBatchWriter(client, key_attributes=("PK", "SK"))
+
+    writer.add({"PK": "news", "SK": "0.57#t", "id": "a"}, "1")
+    writer.add({"PK": "news", "SK": "0.60#t", "id": "b"}, "2")
+    writer.add({"PK": "news", "SK": "0.57#t", "id": "c"}, "3")
+    writer.flush()
+
+    assert writer.failed == ["1", "3"]
+    assert writer.written == 1
@@ -4,8 +4,10 @@ from unittest.mock import MagicMock
 
 def test_lambda_handler_with_mock():
     mock_client = MagicMock()
+    mock_client.batch_write_items.return_value = []
     event = {
         "Records": [{
+            "eventName": "INSERT",
             "dynamodb": {
                 "NewImage": {
                     "id": {"S": "1"},
@@ -20,4 +22,111 @@ def test_lambda_handler_with_mock():
     result = filter_lambda.lambda_handler(event, None, db_client=mock_client)
 
     assert result["processed"] == 1
-    mock_client.put_item.assert_called_once()
+    assert result["batchItemFailures"] == []
+    mock_client.batch_write_items.assert_called_once()
+
+
+def test_extract_stream_item_decodes_binary_attributes():
+    import base64
+    import zlib
+    from newsfeed.shared.news_item import decode_raw_payload
+    payload = zlib.compress(b'{"title": "t"}')
+    record = {"eventName": "INSERT", "dynamodb": {"NewImage": {
+        "id": {"S": "1"},
+        "raw_payload": {"B": base64.b64encode(payload).decode()},
+        "ttl_epoch": {"N": "10"}
+    }}}
+
+    item = filter_lambda.extract_stream_item(record)
+
+    assert item["raw_payload"] == payload
+    assert decode_raw_payload(item["raw_payload"]) == '{"title": "t"}'
+    assert item["id"] == "1"
+
+
+def test_lambda_handler_skips_near_duplicates():
+    mock_client = MagicMock()
+    event = {"Records": [{"eventName": "INSERT", "dynamodb": {"NewImage": {
+        "id": {"S": "2"},
+        "cluster_id": {"S": "1"},
+        "title": {"S": "Major AWS outage and ransomware breach"},
+        "source": {"S": "reddit"},
+        "published_at": {"S": "2025-08-24T12:00:00Z"}
+    }}}]}
+
+    result = filter_lambda.lambda_handler(event, None, db_client=mock_client)
+
+    assert result["processed"] == 0
+    mock_client.batch_write_items.assert_not_called()
+
+
+def _stream_record(item_id: str, sequence_number: str = None,
+                   published_at: str = "2025-08-24T12:00:00Z") -> dict:
+    record = {"eventName": "INSERT", "dynamodb": {"NewImage": {
+        "id": {"S": item_id},
+        "title": {"S": "Major AWS outage and ransomware breach"},
+        "source": {"S": "reddit"},
+        "published_at": {"S": published_at}
+    }}}
+    if sequence_number:
+        record["dynamodb"]["SequenceNumber"] = sequence_number
+    return record
+
+
+def test_lambda_handler_reports_failed_writes_by_sequence_number():
+    mock_client = MagicMock()
+    mock_client.batch_write_items.side_effect = lambda items, key_attributes: [item for item in items if item["id"] == "b"]
+    event = {"Records": [_stream_record("a", "100", "2025-08-24T12:00:00Z"),
+                         _stream_record("b", "200", "2025-08-24T12:01:00Z"),
+                         _stream_record("c", "300", "2025-08-24T12:02:00Z")]}
+
+    result = filter_lambda.lambda_handler(event, None, db_client=mock_client)
+
+    assert result == {"processed": 2, "batchItemFailures": [{"itemIdentifier": "200"}]}
+    mock_client.batch_write_items.assert_called_once()
+    mock_client.put_item.assert_not_called()
+
+
+def test_lambda_handler_raises_on_failure_without_sequence_numbers():
+    import pytest
+    mock_client = MagicMock()
+    mock_client.batch_write_items.side_effect = lambda items, key_attributes: items
+
+    with pytest.raises(RuntimeError):
+        filter_lambda.lambda_handler({"Records": [_stream_record("a")]}, None, db_client=mock_client)
+
+
+def test_extract_stream_item_projects_scored_attributes():
+    record = _stream_record("a")
+    record["dynamodb"]["NewImage"]["raw_payload"] = {"S": '{"title": "t"}'}
+    record["dynamodb"]["NewImage"]["ttl_epoch"] = {"N": "1756000000"}
+
+    item = filter_lambda.extract_stream_item(record, filter_lambda.SCORED_ATTRIBUTES)
+
+    assert set(item) == {"id", "title", "source", "published_at"}
+
+
+def test_lambda_handler_ignores_modify_and_remove_records():
+    mock_client = MagicMock()
+    modify = _stream_record("a", "100")
+    modify["eventName"] = "MODIFY"
+    expired = {"eventName": "REMOVE", "userIdentity": {"type": "Service", "principalId": "dynamodb.amazonaws.com"},
+               "dynamodb": {"OldImage": _stream_record("b")["dynamodb"]["NewImage"], "SequenceNumber": "200"}}
+
+    result = filter_lambda.lambda_handler({"Records": [modify, expired]}, None, db_client=mock_client)
+
+    assert result == {"processed": 0, "batchItemFailures": []}
+    mock_client.batch_write_items.assert_not_called()
+
+
+def test_lambda_handler_writes_colliding_sort_keys_once():
+    mock_client = MagicMock()
+    mock_client.batch_write_items.return_value = []
+    # Same score and published_at: the same (PK, SK) in FilteredEvents
+    event = {"Records": [_stream_record("a", "100"), _stream_record("b", "200")]}
+
+    result = filter_lambda.lambda_handler(event, None, db_client=mock_client)
+
+    assert result == {"processed": 2, "batchItemFailures": []}
+    written = mock_client.batch_write_items.call_args.args[0]
+    assert [item["id"] for item in written] == ["b"]
@@ -0,0 +1,58 @@
+import base64
+from decimal import Decimal
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from newsfeed.lambdas.filter.dynamodb_client import DynamoDBClient
+from newsfeed.shared.wire_format import deserialize_image, from_wire
+
+IMAGE = {
+    "id": {"S": "1"},
+    "ttl_epoch": {"N": "1756000000"},
+    "relevance_score": {"N": "0.57"},
+    "raw_payload": {"B": base64.b64encode(b"\x78\x9c").decode()},
+    "seen": {"BOOL": True},
+    "cluster_id": {"NULL": True},
+    "tags": {"SS": ["aws", "outage"]},
+    "scores": {"NS": ["1", "2.5"]},
+    "categories": {"L": [{"S": "cloud"}, {"N": "3"}]},
+    "decisions": {"M": {"baseline": {"M": {"score": {"N": "0.4"}, "kept": {"BOOL": False}}}}},
+}
+
+
+def test_deserialize_image_decodes_every_type():
+    item = deserialize_image(IMAGE)
+
+    assert item == {
+        "id": "1",
+        "ttl_epoch": 1756000000,
+        "relevance_score": Decimal("0.57"),
+        "raw_payload": b"\x78\x9c",
+        "seen": True,
+        "cluster_id": None,
+        "tags": {"aws", "outage"},
+        "scores": {1, Decimal("2.5")},
+        "categories": ["cloud", 3],
+        "decisions": {"baseline": {"score": Decimal("0.4"), "kept": False}},
+    }
+
+
+def test_deserialize_image_agrees_with_boto3_for_non_binary_values():
+    image = {name: value for name, value in IMAGE.items() if name != "raw_payload"}
+    deserializer = TypeDeserializer()
+
+    assert deserialize_image(image) == {name: deserializer.deserialize(value) for name, value in image.items()}
+
+
+def test_deserialize_image_projects_attributes():
+    item = deserialize_image(IMAGE, ["id", "ttl_epoch", "missing"])
+
+    assert item == {"id": "1", "ttl_epoch": 1756000000}
+
+
+def test_binary_from_low_level_client_is_passed_through():
+    assert from_wire({"B": b"raw"}) == b"raw"
+
+
+def test_filter_client_dynamodb_to_dict_uses_shared_deserializer():
+    assert DynamoDBClient.dynamodb_to_dict({"id": {"S": "1"}, "n": {"N": "2"}}) == {"id": "1", "n": 2}
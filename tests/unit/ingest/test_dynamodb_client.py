@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+from newsfeed.shared.dynamodb_client import DynamoDBClient
+
+
+def _client():
+    client = DynamoDBClient.__new__(DynamoDBClient)
+    client.table = MagicMock()
+    client.table.name = "RawEvents"
+    client.max_retries = 3
+    client.backoff_seconds = 0
+    return client
+
+
+def test_batch_write_retries_only_unprocessed_items():
+    client = _client()
+    low_level = client.table.meta.client
+    items = [{"id": f"id{i}", "title": "t"} for i in range(30)]
+    unprocessed = {"RawEvents": [{"PutRequest": {"Item": {"id": "id3", "title": "t"}}}]}
+    low_level.batch_write_item.side_effect = [
+        {"UnprocessedItems": unprocessed}, {"UnprocessedItems": {}}, {"UnprocessedItems": {}}
+    ]
+
+    failed = client.batch_write_items(items)
+
+    assert failed == []
+    calls = low_level.batch_write_item.call_args_list
+    assert [len(c.kwargs["RequestItems"]["RawEvents"]) for c in calls] == [25, 1, 5]
+
+
+def test_batch_write_reports_items_left_unprocessed():
+    client = _client()
+    unprocessed = {"RawEvents": [{"PutRequest": {"Item": {"id": "id0"}}}]}
+    client.table.meta.client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+    assert client.batch_write_items([{"id": "id0"}]) == [{"id": "id0"}]
+
+
+def test_batch_get_retries_unprocessed_keys():
+    client = _client()
+    low_level = client.table.meta.client
+    low_level.batch_get_item.side_effect = [
+        {"Responses": {"RawEvents": [{"id": "a"}]},
+         "UnprocessedKeys": {"RawEvents": {"Keys": [{"id": "b"}]}}},
+        {"Responses": {"RawEvents": [{"id": "b"}]}, "UnprocessedKeys": {}},
+    ]
+
+    assert client.batch_get_existing_ids(["a", "b", "c", "a"]) == {"a", "b"}
+    first_keys = low_level.batch_get_item.call_args_list[0].kwargs["RequestItems"]["RawEvents"]["Keys"]
+    assert len(first_keys) == 3
+
+
+def test_batch_write_wire_items_uses_low_level_client():
+    client = _client()
+    client._wire_client = MagicMock()
+    unprocessed = {"RawEvents": [{"PutRequest": {"Item": {"id": {"S": "id1"}}}}]}
+    client._wire_client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+    failed = client.batch_write_wire_items([{"id": {"S": "id0"}}, {"id": {"S": "id1"}}])
+
+    assert failed == [{"id": {"S": "id1"}}]
+    client.table.meta.client.batch_write_item.assert_not_called()
+
+
+def test_batch_write_matches_unprocessed_items_on_the_table_key():
+    client = _client()
+    items = [{"PK": "news", "SK": "0.57#t", "id": "same"}, {"PK": "news", "SK": "0.60#t", "id": "same"}]
+    unprocessed = {"RawEvents": [{"PutRequest": {"Item": items[1]}}]}
+    client.table.meta.client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+    assert client.batch_write_items(items, key_attributes=("PK", "SK")) == [items[1]]
@@ -0,0 +1,32 @@
+import hashlib
+from unittest.mock import MagicMock
+
+from newsfeed.shared.fingerprint import fingerprint, find_legacy_duplicates, legacy_fingerprint, normalize_title
+from newsfeed.shared.news_item import NewsItem
+
+EVENT = {"title": "Python 3.12 Released!", "source": "reddit", "published_at": "2025-08-24T12:00:00Z"}
+
+
+def test_normalize_title_ignores_case_whitespace_and_punctuation():
+    assert normalize_title("  Python 3.12   RELEASED!! ") == normalize_title("python 3.12 released") == "python 3 12 released"
+
+
+def test_v2_fingerprints_are_prefixed_and_normalized():
+    variant = {**EVENT, "title": "python 3.12 released"}
+    assert fingerprint(EVENT, "v2").startswith("v2:")
+    assert fingerprint(EVENT, "v2") == fingerprint(variant, "v2")
+    assert fingerprint(EVENT, "v2") != fingerprint({**EVENT, "source": "rss"}, "v2")
+
+
+def test_v1_is_the_original_md5_scheme():
+    content = f"{EVENT['title']}{EVENT['published_at']}{EVENT['source']}"
+    assert legacy_fingerprint(EVENT) == fingerprint(EVENT, "v1") == hashlib.md5(content.encode()).hexdigest()
+
+
+def test_find_legacy_duplicates_maps_stored_v1_ids_back():
+    item = NewsItem.from_raw_event(EVENT)
+    db_client = MagicMock()
+    db_client.batch_get_existing_ids.return_value = {legacy_fingerprint(EVENT)}
+
+    assert find_legacy_duplicates([item], db_client) == {item.fingerprint}
+    db_client.batch_get_existing_ids.assert_called_once_with([legacy_fingerprint(EVENT)])
@@ -0,0 +1,30 @@
+from newsfeed.lambdas.ingest.fingerprint_cache import FingerprintCache
+
+
+def test_cache_hits_and_misses_are_counted():
+    cache = FingerprintCache(max_entries=10, ttl_seconds=60)
+    cache.add("a", now=0)
+
+    assert cache.contains("a", now=1)
+    assert not cache.contains("b", now=1)
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "evictions": 0, "hit_rate": 0.5}
+
+
+def test_cache_entries_expire_after_ttl():
+    cache = FingerprintCache(max_entries=10, ttl_seconds=60)
+    cache.add("a", now=0)
+
+    assert not cache.contains("a", now=60)
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = FingerprintCache(max_entries=2, ttl_seconds=60)
+    cache.add("a", now=0)
+    cache.add("b", now=0)
+    cache.contains("a", now=1)
+    cache.add("c", now=2)
+
+    assert cache.contains("a", now=3)
+    assert not cache.contains("b", now=3)
+    assert cache.evictions == 1
@@ -1,9 +1,14 @@
 import json
 import pytest
 from unittest.mock import MagicMock
+from newsfeed.lambdas.ingest import ingest_lambda
 from newsfeed.lambdas.ingest.ingest_lambda import lambda_handler
 from newsfeed.shared.news_item import NewsItem
 
+@pytest.fixture(autouse=True)
+def clear_fingerprint_cache():
+    ingest_lambda.recent_fingerprints.clear()
+
 @pytest.fixture
 def sample_event():
     return {
@@ -21,17 +26,19 @@ def sample_event():
 
 def test_lambda_processes_valid_item(sample_event):
     mock_client = MagicMock()
-    mock_client.event_exists.return_value = False
+    mock_client.put_if_absent.return_value = True
 
     result = lambda_handler(sample_event, None, db_client=mock_client)
 
     assert result["processed"] == 1
     assert result["skipped"] == 0
-    mock_client.put_item.assert_called_once()
+    mock_client.put_if_absent.assert_called_once()
+    mock_client.event_exists.assert_not_called()
 
 def test_lambda_skips_duplicate(sample_event):
     mock_client = MagicMock()
-    mock_client.event_exists.return_value = True
+    # Conditional put fails: the fingerprint is already stored
+    mock_client.put_if_absent.return_value = False
 
     result = lambda_handler(sample_event, None, db_client=mock_client)
 
@@ -49,3 +56,148 @@ def test_lambda_skips_invalid_item(sample_event, monkeypatch):
     assert result["processed"] == 0
     assert result["skipped"] == 1
     mock_client.put_item.assert_not_called()
+    mock_client.put_if_absent.assert_not_called()
+
+def test_lambda_unpacks_packed_messages():
+    events = [
+        {"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+        for i in range(3)
+    ]
+    packed = {"Records": [{"body": json.dumps({"packed_events": events})}]}
+    mock_client = MagicMock()
+    mock_client.put_if_absent.return_value = True
+
+    result = lambda_handler(packed, None, db_client=mock_client)
+
+    assert result["processed"] == 3
+    assert mock_client.put_if_absent.call_count == 3
+
+def test_lambda_uses_bulk_path_for_large_batches():
+    events = [
+        {"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+        for i in range(10)
+    ]
+    existing = NewsItem.from_raw_event(events[0]).fingerprint
+    mock_client = MagicMock()
+    mock_client.batch_get_existing_ids.return_value = {existing}
+    mock_client.batch_write_wire_items.return_value = []
+
+    result = lambda_handler({"Records": [{"body": json.dumps(e)} for e in events]}, None, db_client=mock_client)
+
+    assert result == {"processed": 9, "skipped": 1, "batchItemFailures": []}
+    mock_client.batch_get_existing_ids.assert_called_once()
+    assert len(mock_client.batch_write_wire_items.call_args.args[0]) == 9
+    mock_client.put_if_absent.assert_not_called()
+
+
+def _record(message_id, body):
+    return {"messageId": message_id, "body": body if isinstance(body, str) else json.dumps(body)}
+
+
+def test_lambda_reports_only_failed_messages():
+    ok = {"title": "Stored", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+    bad = {"title": "Throttled", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+    mock_client = MagicMock()
+
+    def put_if_absent(item):
+        if item["title"] == "Throttled":
+            raise Exception("ProvisionedThroughputExceededException")
+        return True
+    mock_client.put_if_absent.side_effect = put_if_absent
+
+    result = lambda_handler({"Records": [_record("m1", ok), _record("m2", bad)]}, None, db_client=mock_client)
+
+    assert result["processed"] == 1
+    assert result["batchItemFailures"] == [{"itemIdentifier": "m2"}]
+
+
+def test_lambda_fails_every_message_sharing_a_failed_fingerprint():
+    event = {"title": "Same", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+    mock_client = MagicMock()
+    mock_client.put_if_absent.side_effect = Exception("boom")
+
+    result = lambda_handler({"Records": [_record("m1", event), _record("m2", event)]}, None, db_client=mock_client)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "m1"}, {"itemIdentifier": "m2"}]
+
+
+def test_lambda_reports_failed_bulk_writes(monkeypatch):
+    events = [{"title": f"Story {i}", "source": "rss", "published_at": "2025-08-24T12:00:00Z"} for i in range(6)]
+    mock_client = MagicMock()
+    mock_client.batch_get_existing_ids.return_value = set()
+    mock_client.batch_write_wire_items.side_effect = lambda items: [i for i in items if i["title"]["S"] == "Story 3"]
+
+    result = lambda_handler({"Records": [_record(f"m{i}", e) for i, e in enumerate(events)]}, None,
+                            db_client=mock_client)
+
+    assert result["processed"] == 5
+    assert result["batchItemFailures"] == [{"itemIdentifier": "m3"}]
+
+
+def test_lambda_dead_letters_malformed_messages(monkeypatch):
+    import newsfeed.lambdas.ingest.ingest_lambda as ingest_lambda
+    mock_sqs = MagicMock()
+    monkeypatch.setattr(ingest_lambda, "sqs", mock_sqs)
+    monkeypatch.setenv("INGEST_DLQ_URL", "dlq-url")
+    mock_client = MagicMock()
+    mock_client.put_if_absent.return_value = True
+
+    result = lambda_handler({"Records": [
+        _record("m1", "not json"),
+        _record("m2", {"source": "rss"}),
+        _record("m3", {"title": "Fine", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}),
+    ]}, None, db_client=mock_client)
+
+    assert result["processed"] == 1
+    assert result["batchItemFailures"] == []
+    assert mock_sqs.send_message.call_count == 2
+    assert mock_sqs.send_message.call_args_list[0].kwargs["MessageBody"] == "not json"
+
+
+def test_lambda_retries_malformed_messages_without_dlq(monkeypatch):
+    monkeypatch.delenv("INGEST_DLQ_URL", raising=False)
+    result = lambda_handler({"Records": [_record("m1", "not json")]}, None, db_client=MagicMock())
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "m1"}]
+
+
+def test_lambda_skips_recently_stored_items_without_dynamodb():
+    event = {"title": "Top story", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+    mock_client = MagicMock()
+    mock_client.put_if_absent.return_value = True
+
+    lambda_handler({"Records": [_record("m1", event)]}, None, db_client=mock_client)
+    result = lambda_handler({"Records": [_record("m2", event)]}, None, db_client=mock_client)
+
+    assert result["skipped"] == 1
+    assert mock_client.put_if_absent.call_count == 1
+    assert ingest_lambda.recent_fingerprints.hits == 1
+
+
+def test_lambda_does_not_cache_failed_writes():
+    event = {"title": "Throttled", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}
+    mock_client = MagicMock()
+    mock_client.put_if_absent.side_effect = [Exception("throttled"), True]
+
+    lambda_handler({"Records": [_record("m1", event)]}, None, db_client=mock_client)
+    result = lambda_handler({"Records": [_record("m1", event)]}, None, db_client=mock_client)
+
+    assert result["processed"] == 1
+    assert mock_client.put_if_absent.call_count == 2
+
+
+def test_lambda_counts_job_failures_only_on_the_last_delivery(monkeypatch):
+    from newsfeed.shared.sqs_publisher import pack_events
+    job_store = MagicMock()
+    monkeypatch.setattr(ingest_lambda, "get_job_store", lambda: job_store)
+    events = [{"title": "Throttled", "source": "rss", "published_at": "2025-08-24T12:00:00Z"}]
+    body, _ = pack_events(events, job_id="job1")[0]
+    mock_client = MagicMock()
+    mock_client.put_if_absent.side_effect = Exception("throttled")
+
+    for receive_count in ("1", str(ingest_lambda.MAX_RECEIVE_COUNT)):
+        record = {"messageId": "m1", "body": body, "attributes": {"ApproximateReceiveCount": receive_count}}
+        result = lambda_handler({"Records": [record]}, None, db_client=mock_client)
+        assert result["batchItemFailures"] == [{"itemIdentifier": "m1"}]
+
+    job_store.increment.assert_called_once_with("job1", {"failed": 1})
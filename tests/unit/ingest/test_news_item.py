@@ -0,0 +1,68 @@
+import json
+from datetime import datetime, timezone
+
+from boto3.dynamodb.types import TypeDeserializer
+
+from newsfeed.shared.news_item import NewsItem, TTL_SECONDS
+
+RAW_EVENT = {"id": "1", "title": "Story", "source": "rss", "published_at": "2025-08-24T12:00:00Z",
+             "url": "https://example.com/1", "body": "Body"}
+
+
+def test_from_raw_event_uses_one_timestamp():
+    now = datetime(2025, 8, 24, 12, 0, tzinfo=timezone.utc)
+    item = NewsItem.from_raw_event(RAW_EVENT, now=now)
+
+    assert item.ingested_at == now.isoformat()
+    assert item.ttl_epoch == int(now.timestamp()) + TTL_SECONDS
+
+
+def test_from_raw_event_keeps_original_json():
+    raw_json = json.dumps(RAW_EVENT, separators=(",", ":"))
+    assert NewsItem.from_raw_event(RAW_EVENT, raw_json=raw_json).raw_payload == raw_json
+    assert json.loads(NewsItem.from_raw_event(RAW_EVENT).raw_payload) == RAW_EVENT
+
+
+def test_news_item_is_slotted():
+    assert not hasattr(NewsItem.from_raw_event(RAW_EVENT), "__dict__")
+
+
+def test_wire_encoding_matches_item_format():
+    item = NewsItem.from_raw_event(RAW_EVENT)
+    deserializer = TypeDeserializer()
+
+    decoded = {k: deserializer.deserialize(v) for k, v in item.to_dynamodb_wire().items()}
+
+    assert decoded == item.to_dynamodb_item()
+
+
+def test_validate_rejects_non_string_fields():
+    assert NewsItem.from_raw_event(RAW_EVENT).validate()
+    assert not NewsItem.from_raw_event({**RAW_EVENT, "published_at": 1724500000}).validate()
+    assert not NewsItem.from_raw_event({**RAW_EVENT, "body": {"html": "<p>"}}).validate()
+    assert NewsItem.from_raw_event({**RAW_EVENT, "url": None}).validate()
+
+
+def test_compressed_payload_is_stored_as_binary(monkeypatch):
+    import newsfeed.shared.news_item as news_item
+    monkeypatch.setattr(news_item, "RAW_PAYLOAD_COMPRESSION", "zlib")
+    item = NewsItem.from_raw_event(RAW_EVENT)
+
+    stored = item.to_dynamodb_item()["raw_payload"]
+    wire = item.to_dynamodb_wire()["raw_payload"]
+
+    assert isinstance(stored, bytes)
+    assert wire == {"B": stored}
+    assert json.loads(news_item.decode_raw_payload(stored)) == RAW_EVENT
+
+
+def test_decode_raw_payload_passes_through_strings():
+    from newsfeed.shared.news_item import decode_raw_payload
+    assert decode_raw_payload('{"a": 1}') == '{"a": 1}'
+    assert decode_raw_payload(None) is None
+
+
+def test_validate_raw_event_agrees_with_built_item():
+    for raw_event in [RAW_EVENT, {**RAW_EVENT, "published_at": 1724500000}, {**RAW_EVENT, "title": ""},
+                      {**RAW_EVENT, "url": None}, {k: v for k, v in RAW_EVENT.items() if k != "published_at"}]:
+        assert NewsItem.validate_raw_event(raw_event) == NewsItem.from_raw_event(raw_event).validate()
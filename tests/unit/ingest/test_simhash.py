@@ -0,0 +1,23 @@
+from newsfeed.shared.simhash import MAX_DISTANCE, band_keys, hamming_distance, simhash
+
+
+def test_same_story_from_different_sources_is_near():
+    ars = simhash("Microsoft patches Exchange zero-day exploited in the wild",
+                  "Microsoft has released an emergency patch for an Exchange Server zero-day.")
+    hn = simhash("Microsoft Patches Exchange Zero-Day Exploited in the Wild", "")
+
+    assert hamming_distance(ars, hn) <= MAX_DISTANCE
+
+
+def test_different_stories_are_far():
+    a = simhash("Microsoft patches Exchange zero-day exploited in the wild")
+    b = simhash("AWS outage takes down services in eu-west-1")
+
+    assert hamming_distance(a, b) > MAX_DISTANCE
+
+
+def test_near_signatures_share_a_band():
+    signature = simhash("Major AWS outage affecting Europe")
+    flipped = signature ^ 0b1 ^ (1 << 20) ^ (1 << 40)
+
+    assert set(band_keys(signature)) & set(band_keys(flipped))
@@ -7,8 +7,7 @@ from newsfeed.shared.news_item import NewsItem
 @pytest.fixture
 def mock_db_client():
     client = MagicMock()
-    client.event_exists.return_value = False
-    client.put_item.return_value = None
+    client.put_if_absent.return_value = True
     return client
 
 def test_process_valid_events(mock_db_client):
@@ -26,8 +25,8 @@ def test_process_valid_events(mock_db_client):
 
     assert processed == 1
     assert errors == []
-    mock_db_client.put_item.assert_called_once()
-    mock_db_client.event_exists.assert_called_once()
+    mock_db_client.put_if_absent.assert_called_once()
+    mock_db_client.event_exists.assert_not_called()
 
 def test_process_invalid_event_skipped(mock_db_client):
     # Missing required field 'title'
@@ -43,12 +42,12 @@ def test_process_invalid_event_skipped(mock_db_client):
 
     assert processed == 0
     assert len(errors) == 1
-    mock_db_client.put_item.assert_not_called()
+    mock_db_client.put_if_absent.assert_not_called()
 
 def test_process_duplicate_event_skipped(mock_db_client):
     """Test that duplicate events are properly detected and skipped"""
-    # Mock that event already exists
-    mock_db_client.event_exists.return_value = True
+    # Mock that the conditional put finds the event already stored
+    mock_db_client.put_if_absent.return_value = False
 
     events = [
         {
@@ -64,4 +63,96 @@ def test_process_duplicate_event_skipped(mock_db_client):
 
     assert processed == 0  # Should be skipped due to duplicate
     assert errors == []    # No errors, just skipped
-    mock_db_client.put_item.assert_not_called()  # Should not try to put duplicate
+    mock_db_client.put_if_absent.assert_called_once()  # Single round trip, nothing written
+
+def _events(n):
+    return [{"source": "rss", "title": f"Story {i}", "published_at": "2025-08-24T12:00:00Z"} for i in range(n)]
+
+def test_async_mode_queues_events_and_returns_202(monkeypatch):
+    import json
+    mock_sqs = MagicMock()
+    mock_sqs.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+        "Successful": [{"Id": e["Id"]} for e in Entries], "Failed": []}
+    job_store = MagicMock()
+    monkeypatch.setattr(ingest_api_lambda, "sqs", mock_sqs)
+    monkeypatch.setattr(ingest_api_lambda, "get_job_store", lambda: job_store)
+    monkeypatch.setenv("SQS_QUEUE_URL", "queue-url")
+    db_client = MagicMock()
+    events = _events(60) + [{"source": "rss"}]
+
+    resp = ingest_api_lambda.lambda_handler(
+        {"body": json.dumps(events), "queryStringParameters": {"mode": "async"}}, None, db_client=db_client)
+
+    body = json.loads(resp["body"])
+    assert resp["statusCode"] == 202
+    assert body["queued"] == 60
+    assert len(body["errors"]) == 1
+    job_store.create.assert_called_once_with(body["job_id"])
+    job_store.set_totals.assert_called_once_with(body["job_id"], accepted=60, rejected=1)
+    db_client.put_if_absent.assert_not_called()
+    # 60 events at 25 per message: 3 messages in one SendMessageBatch
+    sent = mock_sqs.send_message_batch.call_args.kwargs["Entries"]
+    assert len(sent) == 3
+    assert all(json.loads(e["MessageBody"])["job_id"] == body["job_id"] for e in sent)
+
+def test_async_mode_requires_configuration(monkeypatch):
+    import json
+    monkeypatch.setattr(ingest_api_lambda, "get_job_store", lambda: None)
+    resp = ingest_api_lambda.lambda_handler(
+        {"body": json.dumps(_events(1)), "queryStringParameters": {"mode": "async"}}, None, db_client=MagicMock())
+    assert resp["statusCode"] == 503
+
+def test_job_status_endpoint(monkeypatch):
+    import json
+    job_store = MagicMock()
+    job_store.get.side_effect = lambda job_id: {"job_id": job_id, "status": "processing"} if job_id == "abc" else None
+    monkeypatch.setattr(ingest_api_lambda, "get_job_store", lambda: job_store)
+
+    found = ingest_api_lambda.lambda_handler({"httpMethod": "GET", "pathParameters": {"job_id": "abc"}}, None)
+    missing = ingest_api_lambda.lambda_handler({"httpMethod": "GET", "pathParameters": {"job_id": "nope"}}, None)
+
+    assert found["statusCode"] == 200
+    assert json.loads(found["body"])["status"] == "processing"
+    assert missing["statusCode"] == 404
+
+def test_handler_streams_ndjson_with_per_event_errors(mock_db_client):
+    import json
+    body = "\n".join([json.dumps(e) for e in _events(2)] + ["{not json", json.dumps({"source": "rss"})])
+
+    resp = ingest_api_lambda.lambda_handler({"body": body}, None, db_client=mock_db_client)
+
+    result = json.loads(resp["body"])
+    assert resp["statusCode"] == 200
+    assert result["processed"] == 2
+    assert result["total"] == 4
+    assert [e.split(":")[0] for e in result["errors"]] == ["Event 2", "Event 3"]
+
+def test_validate_events_checks_raw_fields_without_building_items(monkeypatch):
+    from newsfeed.lambdas.ingest_api.stream_parser import EventParseError
+    monkeypatch.setattr(ingest_api_lambda.NewsItem, "from_raw_event",
+                        MagicMock(side_effect=AssertionError("items are built by the ingest Lambda")))
+    chunk = list(enumerate([
+        {"source": "rss", "title": "Story"},
+        {"source": "rss", "title": "Epoch", "published_at": 1724500000},
+        {"source": "rss"},
+        EventParseError("bad"),
+        ["not", "an", "object"],
+    ]))
+
+    valid, errors = ingest_api_lambda._validate_events(chunk)
+
+    assert valid == [{"source": "rss", "title": "Story"}]
+    assert errors == ["Event 1: Missing required fields", "Event 2: Missing required fields",
+                      "Event 3: Invalid JSON: bad", "Event 4: Missing required fields"]
+
+def test_legacy_lookup_failure_fails_only_that_chunk(monkeypatch):
+    monkeypatch.setattr(ingest_api_lambda, "STREAM_CHUNK_SIZE", 2)
+    mock_db_client = MagicMock()
+    mock_db_client.batch_get_existing_ids.side_effect = [set(), Exception("AccessDeniedException")]
+    mock_db_client.put_if_absent.return_value = True
+
+    processed, errors = ingest_api_lambda._process_events(_events(4), mock_db_client)
+
+    assert processed == 2
+    assert errors == ["Event 2: AccessDeniedException", "Event 3: AccessDeniedException"]
+    assert mock_db_client.put_if_absent.call_count == 2
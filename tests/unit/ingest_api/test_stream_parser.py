@@ -0,0 +1,35 @@
+from newsfeed.lambdas.ingest_api.stream_parser import EventParseError, EventStream
+
+
+def _parse(body):
+    stream = EventStream(body)
+    return [e if isinstance(e, dict) else "error" for e in stream], stream.count
+
+
+def test_parses_json_array():
+    assert _parse('[{"a": 1}, {"b": 2}]') == ([{"a": 1}, {"b": 2}], 2)
+
+
+def test_parses_ndjson_and_single_object():
+    assert _parse('{"a": 1}\n{"b": 2}\n') == ([{"a": 1}, {"b": 2}], 2)
+    assert _parse('{"a": 1}') == ([{"a": 1}], 1)
+
+
+def test_array_recovers_after_malformed_element():
+    body = '[{"a": 1}, {bad}, {"c": "],{"}, 3]'
+    assert _parse(body) == ([{"a": 1}, "error", {"c": "],{"}, "error"], 4)
+
+
+def test_ndjson_recovers_after_malformed_line():
+    assert _parse('{"a": 1}\n{oops\n{"b": 2}') == ([{"a": 1}, "error", {"b": 2}], 3)
+
+
+def test_truncated_array_reports_error():
+    events = list(EventStream('[{"a": 1},'))
+    assert events[0] == {"a": 1}
+    assert isinstance(events[1], EventParseError)
+
+
+def test_empty_bodies():
+    assert _parse("[]") == ([], 0)
+    assert _parse("  ") == ([], 0)
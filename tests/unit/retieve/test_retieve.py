@@ -48,3 +48,15 @@ def test_format_events_no_metadata():
     formatted = retrieve_lambda._format_events(items, include_metadata=False)
     assert 'SK' not in formatted[0]
     assert formatted[0]['title'] == 'Test'
+
+def test_lambda_handler_collapses_clusters():
+    client = MagicMock()
+    client.query.return_value = {'Items': [
+        {'id': '1', 'title': 'Exchange zero-day', 'cluster_id': '1'},
+        {'id': '2', 'title': 'Exchange Zero-Day', 'cluster_id': '1'},
+        {'id': '3', 'title': 'AWS outage'},
+    ]}
+
+    resp = retrieve_lambda.lambda_handler({'queryStringParameters': None}, None, db_client=client)
+
+    assert [e['id'] for e in json.loads(resp['body'])] == ['1', '3']